@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Booking
+from .models import Booking, BookingHold
 
 
 @admin.register(Booking)
@@ -18,3 +18,18 @@ class BookingAdmin(admin.ModelAdmin):
     list_filter = ("kind", "created_at")
     search_fields = ("user__username", "room__name", "experience__name")
 
+
+@admin.register(BookingHold)
+class BookingHoldAdmin(admin.ModelAdmin):
+    list_display = (
+        "kind",
+        "user",
+        "room",
+        "experience",
+        "check_in",
+        "check_out",
+        "experience_time",
+        "expires_at",
+    )
+    list_filter = ("kind", "expires_at")
+    search_fields = ("user__username", "room__name", "experience__name")
@@ -0,0 +1,342 @@
+from collections import defaultdict
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+
+from django.db import IntegrityError, transaction
+from django.db.models import BooleanField, Q, Value
+from django.utils import timezone
+from rest_framework.exceptions import ParseError, ValidationError
+
+from experiences.models import Experience, ExperienceSlot
+from experiences.slots import invalidate_experience_slots
+from rooms.models import Bed, Room
+from .models import Booking, BookingHold
+from .serializers import CreateExperienceBookingSerializer, CreateRoomBookingSerializer
+from .services import CONFLICT_MESSAGES, FULL_MESSAGE, HELD_MESSAGE, lock
+
+ROOM = Booking.BookingKindChoices.ROOM
+BED = Booking.BookingKindChoices.BED
+EXPERIENCE = Booking.BookingKindChoices.EXPERIENCE
+
+# The field naming the booked object for each kind of item.
+TARGETS = {ROOM: "room", BED: "bed", EXPERIENCE: "experience"}
+
+STAY_FIELDS = ("kind", "room_id", "bed_id", "check_in", "check_out", "held")
+SLOT_FIELDS = ("experience_id", "experience_time", "experience_end", "held")
+
+
+def target_of(item):
+    """Return the item's kind and the pk of the room, bed or experience."""
+
+    if not isinstance(item, dict):
+        raise ValidationError({"non_field_errors": ["Expected an object."]})
+    kind = item.get("kind")
+    if kind not in TARGETS:
+        raise ValidationError({"kind": [f"Must be one of {', '.join(TARGETS)}."]})
+    pk = item.get(TARGETS[kind])
+    if isinstance(pk, bool) or not isinstance(pk, int):
+        raise ValidationError({TARGETS[kind]: ["A valid integer is required."]})
+    return kind, pk
+
+
+def build_booking(user, item, kind, target):
+    """Validate one item the way the single-booking endpoints do."""
+
+    if target is None:
+        raise ValidationError({TARGETS[kind]: ["Not found."]})
+    if kind == EXPERIENCE:
+        if target.host_id == user.pk:
+            raise ValidationError(
+                {"detail": "Hosts cannot book their own experiences."}
+            )
+        serializer = CreateExperienceBookingSerializer(
+            data=item,
+            context={"experience": target},
+        )
+    else:
+        serializer = CreateRoomBookingSerializer(data=item)
+    serializer.is_valid(raise_exception=True)
+    data = serializer.validated_data
+    booking = Booking(kind=kind, user=user, guests=data["guests"])
+    if kind == EXPERIENCE:
+        booking.experience = target
+        booking.experience_time = data["experience_time"]
+        booking.experience_end = booking.experience_time + timedelta(
+            minutes=target.duration
+        )
+        return booking
+    if kind == BED:
+        if data["guests"] > target.capacity:
+            raise ValidationError({"detail": "Guest count exceeds bed capacity."})
+        booking.room = target.room
+        booking.bed = target
+    else:
+        booking.room = target
+    booking.check_in = data["check_in"]
+    booking.check_out = data["check_out"]
+    return booking
+
+
+def taken_stays(bookings, user):
+    """Room and bed bookings and other users' live holds near ``bookings``.
+
+    One UNION query, narrowed to each room's [first check-in, last
+    check-out) window, returns everything any stay in the batch could
+    overlap, grouped by room.
+    """
+
+    windows = {}
+    for booking in bookings:
+        first, last = windows.get(
+            booking.room_id, (booking.check_in, booking.check_out)
+        )
+        windows[booking.room_id] = (
+            min(first, booking.check_in),
+            max(last, booking.check_out),
+        )
+    taken = defaultdict(list)
+    if not windows:
+        return taken
+    near = reduce(
+        or_,
+        (
+            Q(room_id=room_id, check_in__lt=last, check_out__gt=first)
+            for room_id, (first, last) in windows.items()
+        ),
+    )
+    stays = Booking.objects.filter(near, kind__in=[ROOM, BED]).annotate(
+        held=Value(False, output_field=BooleanField())
+    )
+    holds = (
+        BookingHold.objects.active(exclude_user=user)
+        .filter(near, kind__in=[ROOM, BED])
+        .annotate(held=Value(True, output_field=BooleanField()))
+    )
+    rows = stays.values_list(*STAY_FIELDS).union(
+        holds.values_list(*STAY_FIELDS), all=True
+    )
+    for kind, room_id, bed_id, check_in, check_out, held in rows:
+        taken[room_id].append((kind, bed_id, check_in, check_out, held))
+    return taken
+
+
+def taken_slots(bookings, user):
+    """Experience bookings and live holds near ``bookings``, by experience."""
+
+    windows = {}
+    for booking in bookings:
+        first, last = windows.get(
+            booking.experience_id,
+            (booking.experience_time, booking.experience_end),
+        )
+        windows[booking.experience_id] = (
+            min(first, booking.experience_time),
+            max(last, booking.experience_end),
+        )
+    taken = defaultdict(list)
+    if not windows:
+        return taken
+    near = reduce(
+        or_,
+        (
+            Q(
+                experience_id=experience_id,
+                experience_time__lt=last,
+                experience_end__gt=first,
+            )
+            for experience_id, (first, last) in windows.items()
+        ),
+    )
+    slots = Booking.objects.filter(near, kind=EXPERIENCE).annotate(
+        held=Value(False, output_field=BooleanField())
+    )
+    holds = (
+        BookingHold.objects.active(exclude_user=user)
+        .filter(near, kind=EXPERIENCE)
+        .annotate(held=Value(True, output_field=BooleanField()))
+    )
+    rows = slots.values_list(*SLOT_FIELDS).union(
+        holds.values_list(*SLOT_FIELDS), all=True
+    )
+    for experience_id, experience_time, experience_end, held in rows:
+        taken[experience_id].append((experience_time, experience_end, held))
+    return taken
+
+
+def open_slots(bookings):
+    """Locked ExperienceSlot rows of the slots ``bookings`` start, by start.
+
+    Slots that have no row yet are returned as new, unsaved rows with all
+    of the experience's seats free.
+    """
+
+    starts = {(booking.experience_id, booking.experience_time) for booking in bookings}
+    slots = {}
+    if starts:
+        rows = ExperienceSlot.objects.select_for_update().filter(
+            experience_id__in={experience_id for experience_id, _ in starts},
+            starts_at__in={starts_at for _, starts_at in starts},
+        )
+        slots = {(row.experience_id, row.starts_at): row for row in rows}
+    for booking in bookings:
+        key = (booking.experience_id, booking.experience_time)
+        if key not in slots:
+            capacity = booking.experience.capacity
+            slots[key] = ExperienceSlot(
+                experience_id=booking.experience_id,
+                starts_at=booking.experience_time,
+                capacity=capacity,
+                seats=capacity,
+            )
+    return slots
+
+
+def conflicts_of(booking, stays, slots):
+    """(kind, held) of everything in stays/slots that overlaps ``booking``.
+
+    Experience bookings that start together share the slot's seats, so
+    only those starting at another time conflict.
+    """
+
+    if booking.kind == EXPERIENCE:
+        return [
+            (EXPERIENCE, held)
+            for starts, ends, held in slots[booking.experience_id]
+            if starts != booking.experience_time
+            and starts < booking.experience_end
+            and ends > booking.experience_time
+        ]
+    return [
+        (kind, held)
+        for kind, bed_id, check_in, check_out, held in stays[booking.room_id]
+        if check_in < booking.check_out
+        and check_out > booking.check_in
+        and (booking.kind == ROOM or kind == ROOM or bed_id == booking.bed_id)
+    ]
+
+
+def conflict_message(conflicts):
+    # Same precedence as first_conflict: whole-room bookings first.
+    kind, held = max(
+        conflicts, key=lambda conflict: (conflict[0] == ROOM, not conflict[1])
+    )
+    return HELD_MESSAGE if held else CONFLICT_MESSAGES[kind]
+
+
+def create_bookings(user, items, all_or_nothing=True):
+    """Validate and insert a batch of bookings with a fixed number of queries.
+
+    Targets are loaded with one query per kind, the rooms and experiences
+    involved are locked, and conflicts with existing bookings and other
+    users' holds are found with one query for stays and one for slots.
+    The seat counters of the experience slots are locked with one more
+    query. Items are also checked against earlier items of the same
+    batch. The accepted bookings are inserted with a single bulk_create
+    and the counters written back with one bulk_create and one
+    bulk_update.
+
+    Returns ``(bookings, errors, saved)``: per item, the booking or None
+    and the validation errors or None. With ``all_or_nothing`` a single
+    failed item means nothing is saved.
+    """
+
+    errors = [None] * len(items)
+    targets = [None] * len(items)
+    for index, item in enumerate(items):
+        try:
+            targets[index] = target_of(item)
+        except ValidationError as exc:
+            errors[index] = exc.detail
+    pks = defaultdict(set)
+    for target in filter(None, targets):
+        pks[target[0]].add(target[1])
+    loaded = {
+        ROOM: Room.objects.in_bulk(pks[ROOM]),
+        BED: Bed.objects.select_related("room").in_bulk(pks[BED]),
+        EXPERIENCE: Experience.objects.in_bulk(pks[EXPERIENCE]),
+    }
+    bookings = [None] * len(items)
+    for index, target in enumerate(targets):
+        if target is None:
+            continue
+        kind, pk = target
+        try:
+            bookings[index] = build_booking(
+                user, items[index], kind, loaded[kind].get(pk)
+            )
+        except ValidationError as exc:
+            errors[index] = exc.detail
+
+    with transaction.atomic():
+        valid = [booking for booking in bookings if booking is not None]
+        stays = [booking for booking in valid if booking.kind != EXPERIENCE]
+        experiences = [booking for booking in valid if booking.kind == EXPERIENCE]
+        lock(Room, *{booking.room_id for booking in stays})
+        experience_ids = {booking.experience_id for booking in experiences}
+        lock(Experience, *experience_ids)
+        if experience_ids:
+            # Swept like take_seats does, so their seats count as free.
+            BookingHold.objects.filter(
+                experience_id__in=experience_ids,
+                expires_at__lte=timezone.now(),
+            ).delete()
+        stay_rows = taken_stays(stays, user)
+        slot_rows = taken_slots(experiences, user)
+        seats = open_slots(experiences)
+        for index, booking in enumerate(bookings):
+            if booking is None:
+                continue
+            conflicts = conflicts_of(booking, stay_rows, slot_rows)
+            if conflicts:
+                errors[index] = {"detail": conflict_message(conflicts)}
+                bookings[index] = None
+            elif booking.kind == EXPERIENCE:
+                slot = seats[booking.experience_id, booking.experience_time]
+                if booking.guests > slot.seats:
+                    errors[index] = {"detail": FULL_MESSAGE}
+                    bookings[index] = None
+                    continue
+                slot.seats -= booking.guests
+                slot_rows[booking.experience_id].append(
+                    (booking.experience_time, booking.experience_end, False)
+                )
+            else:
+                stay_rows[booking.room_id].append(
+                    (
+                        booking.kind,
+                        booking.bed_id,
+                        booking.check_in,
+                        booking.check_out,
+                        False,
+                    )
+                )
+        if all_or_nothing and any(errors):
+            return bookings, errors, False
+        created = [booking for booking in bookings if booking is not None]
+        try:
+            with transaction.atomic():
+                Booking.objects.bulk_create(created)
+        except IntegrityError:
+            # Exclusion constraint on PostgreSQL.
+            raise ParseError("Some bookings conflict with existing bookings.")
+        # bulk_create sends no post_save, so the slot listings are
+        # invalidated here.
+        invalidate_experience_slots(
+            *{
+                booking.experience_id
+                for booking in created
+                if booking.kind == EXPERIENCE
+            }
+        )
+        opened = [
+            slot
+            for slot in seats.values()
+            if slot.pk is None and slot.seats < slot.capacity
+        ]
+        if opened:
+            ExperienceSlot.objects.bulk_create(opened)
+        joined = [slot for slot in seats.values() if slot.pk is not None]
+        if joined:
+            ExperienceSlot.objects.bulk_update(joined, ["seats"])
+    return bookings, errors, True
@@ -0,0 +1,75 @@
+import csv
+from datetime import timedelta
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+from common.dates import day_range
+from .models import Booking
+
+FIELDS = (
+    "pk",
+    "kind",
+    "user_id",
+    "room_id",
+    "bed_id",
+    "experience_id",
+    "check_in",
+    "check_out",
+    "experience_time",
+    "experience_end",
+    "guests",
+    "created_at",
+)
+
+FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+CHUNK_SIZE = 2000
+
+
+def bookings_between(first_day, last_day, host=None):
+    """Bookings that touch the days first_day..last_day, as value tuples.
+
+    Stays overlap the range, experiences start inside it. With ``host``
+    only bookings of that user's rooms and experiences are returned. Rows
+    are streamed with iterator(), so memory stays flat however many match.
+    """
+
+    end = last_day + timedelta(days=1)
+    starts, ends = day_range(first_day, last_day)
+    bookings = Booking.objects.filter(
+        Q(check_in__lt=end, check_out__gt=first_day)
+        | Q(experience_time__gte=starts, experience_time__lt=ends)
+    )
+    if host is not None:
+        bookings = bookings.filter(Q(room__owner=host) | Q(experience__host=host))
+    return bookings.order_by("pk").values_list(*FIELDS).iterator(
+        chunk_size=CHUNK_SIZE
+    )
+
+
+class Echo:
+    """File-like object whose write() hands the line back to csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(FIELDS)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def iter_ndjson(rows):
+    encoder = DjangoJSONEncoder()
+    for row in rows:
+        yield encoder.encode(dict(zip(FIELDS, row))) + "\n"
+
+
+def iter_export(rows, output):
+    return iter_csv(rows) if output == "csv" else iter_ndjson(rows)
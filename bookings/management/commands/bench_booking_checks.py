@@ -0,0 +1,184 @@
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from bookings.models import Booking
+from bookings.services import (
+    bed_conflicts,
+    experience_conflicts,
+    first_conflict,
+    room_conflicts,
+)
+from experiences.models import Experience
+from rooms.models import Bed, Room
+from users.models import User
+
+INDEXES = [
+    "booking_room_kind_dates_idx",
+    "booking_bed_dates_idx",
+    "booking_experience_slot_idx",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the room, bed and experience booking conflict checks with "
+        "and without the booking indexes. Seeds a dataset inside a "
+        "transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--bookings", type=int, default=1_000_000)
+        parser.add_argument("--rooms", type=int, default=2_000)
+        parser.add_argument("--experiences", type=int, default=500)
+        parser.add_argument("--probes", type=int, default=200)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.seed(options)
+            probes = self.make_probes(options["probes"])
+            self.report("indexed", self.measure(probes))
+            with connection.cursor() as cursor:
+                for name in INDEXES:
+                    cursor.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
+            self.report("foreign keys only", self.measure(probes))
+            transaction.set_rollback(True)
+
+    def seed(self, options):
+        self.rng = random.Random(42)
+        self.start = date(2030, 1, 1)
+        user = User.objects.create_user(username="bench-booking-user")
+        started = time.perf_counter()
+        self.rooms = Room.objects.bulk_create(
+            [
+                Room(
+                    name=f"Room {i}",
+                    price=50_000,
+                    rooms=1,
+                    toilets=1,
+                    description="",
+                    address="",
+                    kind=Room.RoomKindChoices.ENTIRE_PLACE,
+                    owner=user,
+                )
+                for i in range(options["rooms"])
+            ],
+            batch_size=options["batch_size"],
+        )
+        self.beds = Bed.objects.bulk_create(
+            [
+                Bed(room=room, name=f"Bed {i}", bed_type=Bed.BedTypeChoices.SINGLE)
+                for room in self.rooms[: len(self.rooms) // 4]
+                for i in range(4)
+            ],
+            batch_size=options["batch_size"],
+        )
+        self.experiences = Experience.objects.bulk_create(
+            [
+                Experience(
+                    name=f"Experience {i}",
+                    host=user,
+                    price=30_000,
+                    address="",
+                    start="09:00",
+                    end="18:00",
+                    description="",
+                )
+                for i in range(options["experiences"])
+            ],
+            batch_size=options["batch_size"],
+        )
+        created = 0
+        while created < options["bookings"]:
+            size = min(options["batch_size"], options["bookings"] - created)
+            Booking.objects.bulk_create(
+                [self.random_booking(user) for _ in range(size)]
+            )
+            created += size
+        self.stdout.write(
+            f"Seeded {created} bookings in {time.perf_counter() - started:.1f}s"
+        )
+
+    def random_booking(self, user):
+        roll = self.rng.random()
+        check_in = self.start + timedelta(days=self.rng.randrange(730))
+        check_out = check_in + timedelta(days=self.rng.randint(1, 5))
+        if roll < 0.2:
+            bed = self.rng.choice(self.beds)
+            return Booking(
+                kind=Booking.BookingKindChoices.BED,
+                user=user,
+                room_id=bed.room_id,
+                bed=bed,
+                check_in=check_in,
+                check_out=check_out,
+                guests=1,
+            )
+        if roll < 0.4:
+            starts = datetime.combine(check_in, datetime.min.time(), timezone.utc)
+            starts += timedelta(hours=self.rng.randrange(9, 17))
+            return Booking(
+                kind=Booking.BookingKindChoices.EXPERIENCE,
+                user=user,
+                experience=self.rng.choice(self.experiences),
+                experience_time=starts,
+                experience_end=starts + timedelta(hours=1),
+                guests=1,
+            )
+        return Booking(
+            kind=Booking.BookingKindChoices.ROOM,
+            user=user,
+            room=self.rng.choice(self.rooms),
+            check_in=check_in,
+            check_out=check_out,
+            guests=2,
+        )
+
+    def make_probes(self, count):
+        probes = []
+        for _ in range(count):
+            check_in = self.start + timedelta(days=self.rng.randrange(730))
+            check_out = check_in + timedelta(days=3)
+            starts = datetime.combine(check_in, datetime.min.time(), timezone.utc)
+            starts += timedelta(hours=10)
+            probes.append(
+                {
+                    "room": (self.rng.choice(self.rooms), check_in, check_out),
+                    "bed": (self.rng.choice(self.beds), check_in, check_out),
+                    "experience": (
+                        self.rng.choice(self.experiences),
+                        starts,
+                        starts + timedelta(hours=1),
+                    ),
+                }
+            )
+        return probes
+
+    def measure(self, probes):
+        checks = {
+            "room": room_conflicts,
+            "bed": bed_conflicts,
+            "experience": experience_conflicts,
+        }
+        timings = {name: [] for name in checks}
+        for probe in probes:
+            for name, conflicts in checks.items():
+                started = time.perf_counter()
+                first_conflict(conflicts(*probe[name]))
+                timings[name].append(time.perf_counter() - started)
+        return timings
+
+    def report(self, label, timings):
+        for name, samples in timings.items():
+            samples = sorted(samples)
+            p95 = samples[int(len(samples) * 0.95) - 1]
+            self.stdout.write(
+                f"{label:>18} {name:>10}: "
+                f"median {statistics.median(samples) * 1000:7.3f} ms, "
+                f"p95 {p95 * 1000:7.3f} ms"
+            )
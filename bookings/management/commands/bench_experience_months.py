@@ -0,0 +1,125 @@
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from bookings.models import Booking
+from common.dates import month_range
+from experiences.models import Experience
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the monthly experience bookings query filtered with "
+        "experience_time__date versus a half-open datetime range. Seeds a "
+        "dataset inside a transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--bookings", type=int, default=500_000)
+        parser.add_argument("--experiences", type=int, default=50)
+        parser.add_argument("--probes", type=int, default=200)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.seed(options)
+            probes = [
+                (
+                    self.rng.choice(self.experiences),
+                    self.rng.choice((2030, 2031)),
+                    self.rng.randint(1, 12),
+                )
+                for _ in range(options["probes"])
+            ]
+            for label, month_bookings in (
+                ("__date cast", self.by_date),
+                ("datetime range", self.by_range),
+            ):
+                plan = month_bookings(*probes[0]).explain()
+                self.stdout.write(f"{label}: {plan.splitlines()[-1].strip()}")
+                self.report(label, self.measure(month_bookings, probes))
+            transaction.set_rollback(True)
+
+    def seed(self, options):
+        self.rng = random.Random(42)
+        user = User.objects.create_user(username="bench-experience-user")
+        started = time.perf_counter()
+        self.experiences = Experience.objects.bulk_create(
+            [
+                Experience(
+                    name=f"Experience {i}",
+                    host=user,
+                    price=30_000,
+                    address="",
+                    start="09:00",
+                    end="18:00",
+                    description="",
+                )
+                for i in range(options["experiences"])
+            ],
+            batch_size=options["batch_size"],
+        )
+        first = month_range(2030, 1)[0]
+        created = 0
+        while created < options["bookings"]:
+            size = min(options["batch_size"], options["bookings"] - created)
+            bookings = []
+            for _ in range(size):
+                starts = first + timedelta(
+                    days=self.rng.randrange(730), hours=self.rng.randrange(9, 17)
+                )
+                bookings.append(
+                    Booking(
+                        kind=Booking.BookingKindChoices.EXPERIENCE,
+                        user=user,
+                        experience=self.rng.choice(self.experiences),
+                        experience_time=starts,
+                        experience_end=starts + timedelta(hours=1),
+                        guests=1,
+                    )
+                )
+            Booking.objects.bulk_create(bookings)
+            created += size
+        self.stdout.write(
+            f"Seeded {created} bookings in {time.perf_counter() - started:.1f}s"
+        )
+
+    def by_date(self, experience, year, month):
+        month_start, month_end = month_range(year, month)
+        return Booking.objects.filter(
+            experience=experience,
+            kind=Booking.BookingKindChoices.EXPERIENCE,
+            experience_time__date__gte=month_start.date(),
+            experience_time__date__lt=month_end.date(),
+        ).order_by("experience_time")
+
+    def by_range(self, experience, year, month):
+        month_start, month_end = month_range(year, month)
+        return Booking.objects.filter(
+            experience=experience,
+            kind=Booking.BookingKindChoices.EXPERIENCE,
+            experience_time__gte=month_start,
+            experience_time__lt=month_end,
+        ).order_by("experience_time")
+
+    def measure(self, month_bookings, probes):
+        timings = []
+        for probe in probes:
+            started = time.perf_counter()
+            list(month_bookings(*probe)[:20].values_list("pk", flat=True))
+            timings.append(time.perf_counter() - started)
+        return timings
+
+    def report(self, label, samples):
+        samples = sorted(samples)
+        p95 = samples[int(len(samples) * 0.95) - 1]
+        self.stdout.write(
+            f"{label:>18}: "
+            f"median {statistics.median(samples) * 1000:7.3f} ms, "
+            f"p95 {p95 * 1000:7.3f} ms"
+        )
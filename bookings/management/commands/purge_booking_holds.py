@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from bookings.models import BookingHold
+
+
+class Command(BaseCommand):
+    help = "Delete checkout holds whose BOOKING_HOLD_TTL has passed."
+
+    def handle(self, *args, **options):
+        deleted, _ = BookingHold.objects.filter(
+            expires_at__lte=timezone.now()
+        ).delete()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired holds."))
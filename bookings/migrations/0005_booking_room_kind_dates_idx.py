@@ -0,0 +1,36 @@
+# Generated by Django 5.2.7 on 2026-10-17 23:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0004_booking_experience_end"),
+        ("experiences", "0005_experience_experience_created_at_id_idx"),
+        ("rooms", "0009_room_search_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="booking",
+            name="kind",
+            field=models.CharField(
+                choices=[
+                    ("room", "Room"),
+                    ("experience", "Experience"),
+                    ("bed", "Bed"),
+                ],
+                max_length=15,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                fields=["room", "kind", "check_in", "check_out"],
+                name="booking_room_kind_dates_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,70 @@
+from django.db import migrations
+
+CONSTRAINTS = {
+    "booking_room_no_overlap": ("room_id", "room"),
+    "booking_bed_no_overlap": ("bed_id", "bed"),
+}
+
+
+def find_overlaps(cursor, column, kind):
+    """(pk, pk) pairs of bookings the constraint on ``column`` would reject."""
+
+    cursor.execute(
+        f"SELECT a.id, b.id FROM bookings_booking a "
+        f"JOIN bookings_booking b ON a.{column} = b.{column} AND a.id < b.id "
+        f"WHERE a.kind = %s AND b.kind = %s "
+        f"AND a.check_in < b.check_out AND b.check_in < a.check_out "
+        f"ORDER BY a.id, b.id",
+        [kind, kind],
+    )
+    return cursor.fetchall()
+
+
+def add_constraints(apps, schema_editor):
+    # Exclusion constraints need PostgreSQL's btree_gist. Other backends
+    # rely on the row lock taken by bookings.services.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    # Bookings made before the row lock may already overlap, and
+    # ADD CONSTRAINT would fail on them with an opaque error. Which one
+    # to keep is a business decision, so list them and stop instead.
+    with schema_editor.connection.cursor() as cursor:
+        clashes = [
+            f"{kind} bookings {first} and {second}"
+            for column, kind in CONSTRAINTS.values()
+            for first, second in find_overlaps(cursor, column, kind)
+        ]
+    if clashes:
+        raise RuntimeError(
+            "Cannot add the booking overlap constraints. Cancel or move one "
+            "booking of each overlapping pair, then migrate again: "
+            + "; ".join(clashes)
+        )
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    for name, (column, kind) in CONSTRAINTS.items():
+        schema_editor.execute(
+            f"ALTER TABLE bookings_booking ADD CONSTRAINT {name} "
+            f"EXCLUDE USING gist ({column} WITH =, "
+            f"daterange(check_in, check_out, '[)') WITH &&) "
+            f"WHERE (kind = '{kind}')"
+        )
+
+
+def remove_constraints(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in CONSTRAINTS:
+        schema_editor.execute(
+            f"ALTER TABLE bookings_booking DROP CONSTRAINT IF EXISTS {name}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0005_booking_room_kind_dates_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_constraints, remove_constraints),
+    ]
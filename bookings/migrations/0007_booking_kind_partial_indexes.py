@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-18 00:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0006_booking_no_overlap_constraints"),
+        ("experiences", "0005_experience_experience_created_at_id_idx"),
+        ("rooms", "0009_room_search_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                condition=models.Q(("kind", "bed")),
+                fields=["bed", "check_in", "check_out"],
+                name="booking_bed_dates_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                condition=models.Q(("kind", "experience")),
+                fields=["experience", "experience_time", "experience_end"],
+                name="booking_experience_slot_idx",
+            ),
+        ),
+    ]
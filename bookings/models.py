@@ -1,8 +1,44 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 from common.models import CommonModel
 
 
+class BookingQuerySet(models.QuerySet):
+    def for_public(self, kind=None):
+        """Load exactly what PublicBookingSerializer reads.
+
+        Joins the relations the given kind can have (all of them when kind
+        is None) and defers every column the serializer does not show, so a
+        page of bookings is a single query.
+        """
+
+        related = {
+            Booking.BookingKindChoices.ROOM: ["room"],
+            Booking.BookingKindChoices.BED: ["room", "bed"],
+            Booking.BookingKindChoices.EXPERIENCE: ["experience"],
+        }.get(kind, ["room", "bed", "experience"])
+        fields = [
+            "pk",
+            "kind",
+            "check_in",
+            "check_out",
+            "experience_time",
+            "experience_end",
+            "guests",
+            "room",
+            "bed",
+            "experience",
+        ]
+        if "room" in related:
+            fields.append("room__price")
+        if "bed" in related:
+            fields += ["bed__name", "bed__bed_type", "bed__room"]
+        if "experience" in related:
+            fields.append("experience__price")
+        return self.select_related(*related).only(*fields)
+
+
 class Booking(CommonModel):
     """Booking model definition."""
 
@@ -44,7 +80,84 @@ class Booking(CommonModel):
     experience_time = models.DateTimeField(null=True, blank=True)
     guests = models.PositiveIntegerField()
 
+    objects = BookingQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["room", "kind", "check_in", "check_out"],
+                name="booking_room_kind_dates_idx",
+            ),
+            models.Index(
+                fields=["bed", "check_in", "check_out"],
+                condition=models.Q(kind="bed"),
+                name="booking_bed_dates_idx",
+            ),
+            models.Index(
+                fields=["experience", "experience_time", "experience_end"],
+                condition=models.Q(kind="experience"),
+                name="booking_experience_slot_idx",
+            ),
+        ]
+
     def __str__(self) -> str:
         target = self.room or self.experience
         return f"{self.user} → {self.kind}: {target}"
 
+
+class BookingHoldQuerySet(models.QuerySet):
+    def active(self, exclude_user=None):
+        """Holds that have not expired, optionally leaving out one user's."""
+
+        holds = self.filter(expires_at__gt=timezone.now())
+        if exclude_user is not None:
+            holds = holds.exclude(user=exclude_user)
+        return holds
+
+
+class BookingHold(CommonModel):
+    """Dates or a slot reserved for a few minutes during checkout.
+
+    Until ``expires_at`` passes, a hold blocks other users' bookings and
+    holds exactly like a Booking of the same kind would.
+    """
+
+    kind = models.CharField(max_length=15, choices=Booking.BookingKindChoices.choices)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="booking_holds",
+    )
+    room = models.ForeignKey(
+        "rooms.Room",
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="holds",
+    )
+    experience = models.ForeignKey(
+        "experiences.Experience",
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="holds",
+    )
+    bed = models.ForeignKey(
+        "rooms.Bed",
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="holds",
+    )
+    check_in = models.DateField(null=True, blank=True)
+    check_out = models.DateField(null=True, blank=True)
+    experience_time = models.DateTimeField(null=True, blank=True)
+    experience_end = models.DateTimeField(null=True, blank=True)
+    guests = models.PositiveIntegerField()
+    expires_at = models.DateTimeField(db_index=True)
+
+    objects = BookingHoldQuerySet.as_manager()
+
+    def __str__(self) -> str:
+        target = self.room or self.experience
+        return f"{self.user} ⏳ {self.kind}: {target}"
@@ -2,7 +2,7 @@ from django.utils import timezone
 from datetime import timedelta
 from rest_framework import serializers
 
-from .models import Booking
+from .models import Booking, BookingHold
 
 
 class CreateRoomBookingSerializer(serializers.ModelSerializer):
@@ -37,40 +37,6 @@ class CreateRoomBookingSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(
                 "Check out must be after check in."
             )
-        room = self.context.get("room")
-        bed = self.context.get("bed")
-        if room:
-            overlaps = Booking.objects.filter(
-                room=room,
-                kind=Booking.BookingKindChoices.ROOM,
-                check_in__lt=check_out,
-                check_out__gt=check_in,
-            ).exists()
-            if overlaps:
-                raise serializers.ValidationError(
-                    "Those dates are already taken for this room."
-                )
-            if bed:
-                room_full = Booking.objects.filter(
-                    room=room,
-                    kind=Booking.BookingKindChoices.ROOM,
-                    check_in__lt=check_out,
-                    check_out__gt=check_in,
-                ).exists()
-                if room_full:
-                    raise serializers.ValidationError(
-                        "The whole room is booked for those dates."
-                    )
-                bed_conflict = Booking.objects.filter(
-                    bed=bed,
-                    kind=Booking.BookingKindChoices.BED,
-                    check_in__lt=check_out,
-                    check_out__gt=check_in,
-                ).exists()
-                if bed_conflict:
-                    raise serializers.ValidationError(
-                        "This bed is already booked for those dates."
-                    )
         return data
 
 class CreateExperienceBookingSerializer(serializers.ModelSerializer):
@@ -105,14 +71,9 @@ class CreateExperienceBookingSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError("Start time outside experience schedule.")
             if slot_end.date() != experience_time.date() or end_time > experience.end:
                 raise serializers.ValidationError("Slot exceeds available schedule.")
-            conflicts = Booking.objects.filter(
-                experience=experience,
-                kind=Booking.BookingKindChoices.EXPERIENCE,
-                experience_time__lt=slot_end,
-                experience_end__gt=experience_time,
-            ).exists()
-            if conflicts:
-                raise serializers.ValidationError("This slot is already booked.")
+        guests = data.get("guests", getattr(self.instance, "guests", None))
+        if guests is not None and guests > experience.capacity:
+            raise serializers.ValidationError("Guest count exceeds experience capacity.")
         return data
 
 
@@ -149,6 +110,24 @@ class PublicBookingSerializer(serializers.ModelSerializer):
             "pk": booking.bed.pk,
             "name": booking.bed.name,
             "bed_type": booking.bed.bed_type,
-            "room": booking.bed.room.pk,
+            "room": booking.bed.room_id,
         }
 
+
+class BookingHoldSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = BookingHold
+        fields = (
+            "pk",
+            "kind",
+            "room",
+            "bed",
+            "experience",
+            "check_in",
+            "check_out",
+            "experience_time",
+            "experience_end",
+            "guests",
+            "expires_at",
+        )
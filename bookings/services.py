@@ -0,0 +1,420 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import BooleanField, F, Q, Value
+from django.db.models.functions import Least
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+
+from experiences.models import Experience, ExperienceSlot
+from rooms.models import Room
+from .models import Booking, BookingHold
+
+CONFLICT_MESSAGES = {
+    Booking.BookingKindChoices.ROOM: "Those dates are already booked.",
+    Booking.BookingKindChoices.BED: "Some beds are already booked during those dates.",
+    Booking.BookingKindChoices.EXPERIENCE: "This slot is already booked.",
+}
+
+HELD_MESSAGE = "Those dates are on hold by another guest. Try again in a few minutes."
+
+FULL_MESSAGE = "Not enough seats left in this slot."
+
+
+def lock(model, *pks):
+    """Take a row lock on the booked rooms or experiences.
+
+    Bookings of the same room (including its beds) or experience are made
+    one at a time, so the conflict query below and the INSERT cannot
+    interleave with another request. Rows are locked in pk order so two
+    requests locking several rows can't deadlock. On SQLite, which has no
+    row locks, the IMMEDIATE transaction mode in settings serializes
+    writers instead.
+    """
+
+    list(
+        model.objects.select_for_update()
+        .filter(pk__in=pks)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+
+
+def overlapping(check_in, check_out):
+    return Q(check_in__lt=check_out, check_out__gt=check_in)
+
+
+def first_conflict(bookings, holds=None):
+    """Return (kind, held) of the first conflicting booking or hold, or None.
+
+    Bookings and live holds are checked with one UNION query. ROOM
+    conflicts sort before BED ones so the whole-room message wins.
+    """
+
+    conflicts = bookings.annotate(
+        held=Value(False, output_field=BooleanField())
+    ).values_list("kind", "held")
+    if holds is not None:
+        conflicts = conflicts.union(
+            holds.annotate(held=Value(True, output_field=BooleanField())).values_list(
+                "kind", "held"
+            ),
+            all=True,
+        )
+    return conflicts.order_by("-kind").first()
+
+
+def save_booking(conflicts, booking, lock_model, lock_pk, holds=None, release=None):
+    """Save a Booking or BookingHold unless something overlaps it.
+
+    ``holds`` are the other users' live holds over the same dates or slot.
+    ``release`` is a hold that is deleted in the same transaction, which
+    is how a hold is turned into a booking.
+    """
+
+    with transaction.atomic():
+        lock(lock_model, lock_pk)
+        conflict = first_conflict(conflicts, holds)
+        if conflict is not None:
+            kind, held = conflict
+            raise ParseError(HELD_MESSAGE if held else CONFLICT_MESSAGES[kind])
+        try:
+            with transaction.atomic():
+                booking.save()
+        except IntegrityError:
+            # Exclusion constraint on PostgreSQL.
+            raise ParseError(CONFLICT_MESSAGES[booking.kind])
+        if release is not None:
+            release.delete()
+    return booking
+
+
+def room_conflicts(room, check_in, check_out, queryset=None):
+    """Any ROOM or BED booking of the room conflicts with a whole-room stay.
+
+    Like the other *_conflicts helpers, ``queryset`` may be BookingHolds
+    instead of Bookings; both models share the fields filtered on.
+    """
+
+    if queryset is None:
+        queryset = Booking.objects.all()
+    return queryset.filter(
+        overlapping(check_in, check_out),
+        room=room,
+        kind__in=[Booking.BookingKindChoices.ROOM, Booking.BookingKindChoices.BED],
+    )
+
+
+def bed_conflicts(bed, check_in, check_out, queryset=None):
+    """A ROOM booking of the bed's room or a BED booking of the bed conflicts."""
+
+    if queryset is None:
+        queryset = Booking.objects.all()
+    return queryset.filter(
+        overlapping(check_in, check_out),
+        Q(room_id=bed.room_id, kind=Booking.BookingKindChoices.ROOM)
+        | Q(bed=bed, kind=Booking.BookingKindChoices.BED),
+    )
+
+
+def experience_conflicts(experience, experience_time, experience_end, queryset=None):
+    if queryset is None:
+        queryset = Booking.objects.all()
+    return queryset.filter(
+        experience=experience,
+        kind=Booking.BookingKindChoices.EXPERIENCE,
+        experience_time__lt=experience_end,
+        experience_end__gt=experience_time,
+    )
+
+
+def create_room_booking(room, user, check_in, check_out, guests):
+    """Book a whole room."""
+
+    conflicts = room_conflicts(room, check_in, check_out)
+    booking = Booking(
+        kind=Booking.BookingKindChoices.ROOM,
+        user=user,
+        room=room,
+        check_in=check_in,
+        check_out=check_out,
+        guests=guests,
+    )
+    holds = room_conflicts(
+        room, check_in, check_out, BookingHold.objects.active(exclude_user=user)
+    )
+    return save_booking(conflicts, booking, Room, room.pk, holds)
+
+
+def create_bed_booking(bed, user, check_in, check_out, guests):
+    """Book one bed."""
+
+    if guests > bed.capacity:
+        raise ParseError("Guest count exceeds bed capacity.")
+    conflicts = bed_conflicts(bed, check_in, check_out)
+    booking = Booking(
+        kind=Booking.BookingKindChoices.BED,
+        user=user,
+        room_id=bed.room_id,
+        bed=bed,
+        check_in=check_in,
+        check_out=check_out,
+        guests=guests,
+    )
+    holds = bed_conflicts(
+        bed, check_in, check_out, BookingHold.objects.active(exclude_user=user)
+    )
+    return save_booking(conflicts, booking, Room, bed.room_id, holds)
+
+
+def slot_seats(experience_id, experience_time):
+    return ExperienceSlot.objects.filter(
+        experience_id=experience_id,
+        starts_at=experience_time,
+    )
+
+
+def take_seats(experience, experience_time, experience_end, guests, user, exclude=None):
+    """Take ``guests`` seats of the slot that starts at ``experience_time``.
+
+    Joining a slot that already has guests is one conditional UPDATE of
+    its ExperienceSlot row: ``seats`` only drops while it covers the
+    party, and no other lock is taken. Opening a slot, or retrying a full
+    one, locks the experience, clears its expired holds and checks that
+    no booking or hold starting at another time overlaps the slot before
+    taking the seats. Must run inside a transaction.
+    """
+
+    seats = slot_seats(experience.pk, experience_time)
+    if seats.filter(seats__gte=guests, seats__lt=F("capacity")).update(
+        seats=F("seats") - guests
+    ):
+        return
+    lock(Experience, experience.pk)
+    BookingHold.objects.filter(
+        experience=experience,
+        expires_at__lte=timezone.now(),
+    ).delete()
+    conflicts = experience_conflicts(
+        experience, experience_time, experience_end
+    ).exclude(experience_time=experience_time)
+    if exclude is not None:
+        conflicts = conflicts.exclude(pk=exclude.pk)
+    holds = experience_conflicts(
+        experience,
+        experience_time,
+        experience_end,
+        BookingHold.objects.active(exclude_user=user),
+    ).exclude(experience_time=experience_time)
+    conflict = first_conflict(conflicts, holds)
+    if conflict is not None:
+        kind, held = conflict
+        raise ParseError(HELD_MESSAGE if held else CONFLICT_MESSAGES[kind])
+    ExperienceSlot.objects.bulk_create(
+        [
+            ExperienceSlot(
+                experience=experience,
+                starts_at=experience_time,
+                capacity=experience.capacity,
+                seats=experience.capacity,
+            )
+        ],
+        ignore_conflicts=True,
+    )
+    if not seats.filter(seats__gte=guests).update(seats=F("seats") - guests):
+        raise ParseError(FULL_MESSAGE)
+
+
+def release_seats(experience_id, experience_time, guests):
+    """Give ``guests`` seats back to a slot, never past its capacity."""
+
+    slot_seats(experience_id, experience_time).update(
+        seats=Least(F("seats") + guests, F("capacity"))
+    )
+
+
+def save_experience_booking(
+    experience, user, experience_time, guests, booking=None
+):
+    """Create an experience booking, or move ``booking`` to a new slot.
+
+    Any number of parties can book the same start time until its seats
+    run out. A slot that overlaps one starting at another time is taken.
+    """
+
+    experience_end = experience_time + timedelta(minutes=experience.duration)
+    if booking is None:
+        booking = Booking(
+            kind=Booking.BookingKindChoices.EXPERIENCE,
+            user=user,
+            experience=experience,
+        )
+    with transaction.atomic():
+        if booking.pk is not None:
+            release_seats(experience.pk, booking.experience_time, booking.guests)
+        take_seats(
+            experience,
+            experience_time,
+            experience_end,
+            guests,
+            booking.user,
+            exclude=booking if booking.pk is not None else None,
+        )
+        booking.experience_time = experience_time
+        booking.experience_end = experience_end
+        booking.guests = guests
+        booking.save()
+    return booking
+
+
+def hold_expiry():
+    return timezone.now() + timedelta(seconds=settings.BOOKING_HOLD_TTL)
+
+
+def save_hold(hold, conflicts, holds, lock_model, lock_pk, target):
+    """Save a room or bed hold after clearing expired and replaced holds.
+
+    Expired holds are swept lazily here, per room, and by take_seats, per
+    experience, so they never pile up between runs of purge_booking_holds.
+    A user keeps at most one hold per room, bed or experience: holding
+    again replaces it.
+    """
+
+    with transaction.atomic():
+        lock(lock_model, lock_pk)
+        BookingHold.objects.filter(
+            Q(expires_at__lte=timezone.now()) | Q(user=hold.user, **target),
+            **{f"{lock_model._meta.model_name}_id": lock_pk},
+        ).delete()
+        return save_booking(conflicts, hold, lock_model, lock_pk, holds)
+
+
+def hold_room(room, user, check_in, check_out, guests):
+    """Hold a whole room for BOOKING_HOLD_TTL seconds."""
+
+    hold = BookingHold(
+        kind=Booking.BookingKindChoices.ROOM,
+        user=user,
+        room=room,
+        check_in=check_in,
+        check_out=check_out,
+        guests=guests,
+        expires_at=hold_expiry(),
+    )
+    conflicts = room_conflicts(room, check_in, check_out)
+    holds = room_conflicts(
+        room, check_in, check_out, BookingHold.objects.active(exclude_user=user)
+    )
+    return save_hold(hold, conflicts, holds, Room, room.pk, {"bed": None})
+
+
+def hold_bed(bed, user, check_in, check_out, guests):
+    """Hold one bed for BOOKING_HOLD_TTL seconds."""
+
+    if guests > bed.capacity:
+        raise ParseError("Guest count exceeds bed capacity.")
+    hold = BookingHold(
+        kind=Booking.BookingKindChoices.BED,
+        user=user,
+        room_id=bed.room_id,
+        bed=bed,
+        check_in=check_in,
+        check_out=check_out,
+        guests=guests,
+        expires_at=hold_expiry(),
+    )
+    conflicts = bed_conflicts(bed, check_in, check_out)
+    holds = bed_conflicts(
+        bed, check_in, check_out, BookingHold.objects.active(exclude_user=user)
+    )
+    return save_hold(hold, conflicts, holds, Room, bed.room_id, {"bed": bed})
+
+
+def hold_experience(experience, user, experience_time, guests):
+    """Hold seats of an experience slot for BOOKING_HOLD_TTL seconds.
+
+    The seats are taken like a booking's and come back when the hold is
+    deleted, whether it is released, replaced, confirmed or swept.
+    """
+
+    experience_end = experience_time + timedelta(minutes=experience.duration)
+    hold = BookingHold(
+        kind=Booking.BookingKindChoices.EXPERIENCE,
+        user=user,
+        experience=experience,
+        experience_time=experience_time,
+        experience_end=experience_end,
+        guests=guests,
+        expires_at=hold_expiry(),
+    )
+    with transaction.atomic():
+        BookingHold.objects.filter(user=user, experience=experience).delete()
+        take_seats(experience, experience_time, experience_end, guests, user)
+        hold.save()
+    return hold
+
+
+def confirm_hold(hold):
+    """Turn a live hold into a Booking in one transaction.
+
+    The booking is checked against bookings and other users' holds under
+    the same lock as any other booking, and the hold is deleted in the
+    transaction that saves it, so a hold is never confirmed twice.
+    """
+
+    booking = Booking(
+        kind=hold.kind,
+        user=hold.user,
+        room_id=hold.room_id,
+        bed_id=hold.bed_id,
+        experience_id=hold.experience_id,
+        check_in=hold.check_in,
+        check_out=hold.check_out,
+        experience_time=hold.experience_time,
+        experience_end=hold.experience_end,
+        guests=hold.guests,
+    )
+    if hold.kind == Booking.BookingKindChoices.EXPERIENCE:
+        return confirm_experience_hold(hold, booking)
+    active = BookingHold.objects.active(exclude_user=hold.user)
+    if hold.kind == Booking.BookingKindChoices.BED:
+        lock_model, lock_pk = Room, hold.room_id
+        span = (hold.bed, hold.check_in, hold.check_out)
+        conflicts = bed_conflicts(*span)
+        holds = bed_conflicts(*span, active)
+    else:
+        lock_model, lock_pk = Room, hold.room_id
+        span = (hold.room, hold.check_in, hold.check_out)
+        conflicts = room_conflicts(*span)
+        holds = room_conflicts(*span, active)
+    with transaction.atomic():
+        lock(lock_model, lock_pk)
+        if not BookingHold.objects.active().filter(pk=hold.pk).exists():
+            raise ParseError("This hold has expired.")
+        return save_booking(
+            conflicts, booking, lock_model, lock_pk, holds, release=hold
+        )
+
+
+def confirm_experience_hold(hold, booking):
+    """Move the hold's seats to ``booking``.
+
+    The hold row is locked first, so two confirmations of one hold run
+    one after the other and the second finds it gone.
+    """
+
+    with transaction.atomic():
+        held = BookingHold.objects.active().select_for_update().filter(pk=hold.pk)
+        if not list(held.values_list("pk", flat=True)):
+            raise ParseError("This hold has expired.")
+        hold.delete()
+        take_seats(
+            hold.experience,
+            hold.experience_time,
+            hold.experience_end,
+            hold.guests,
+            hold.user,
+        )
+        booking.save()
+    return booking
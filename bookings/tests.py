@@ -1,9 +1,23 @@
-from datetime import date, timedelta
+import csv
+import io
+import json
+import tempfile
+import threading
+from datetime import date, datetime, time, timedelta
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
-from rest_framework.test import APITestCase
+from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
-from bookings.models import Booking
-from rooms.models import Room, Amenity
+from bookings.models import Booking, BookingHold
+from common.dates import month_range
+from common.models import IdempotencyKey
+from bookings.services import bed_conflicts, experience_conflicts, room_conflicts
+from experiences.models import Experience, ExperienceSlot
+from rooms.models import Bed, Room, Amenity
 from categories.models import Category
 from users.models import User
 
@@ -258,3 +272,1325 @@ class TestRoomBookings(APITestCase):
         # 검증 (인증 필요 - IsAuthenticatedOrReadOnly는 403 반환)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+
+class TestBookingConflicts(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.room = Room.objects.create(
+            name="Hostel",
+            price=30000,
+            rooms=1,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=Room.RoomKindChoices.SHARED_ROOM,
+            owner=self.user,
+        )
+        self.bed = Bed.objects.create(
+            room=self.room,
+            name="Bed 1",
+            bed_type=Bed.BedTypeChoices.SINGLE,
+        )
+        self.other_bed = Bed.objects.create(
+            room=self.room,
+            name="Bed 2",
+            bed_type=Bed.BedTypeChoices.SINGLE,
+        )
+        self.room_url = f"/api/v1/rooms/{self.room.pk}/bookings"
+        self.check_in = timezone.localdate() + timedelta(days=1)
+        self.check_out = self.check_in + timedelta(days=2)
+
+    def bed_url(self, bed):
+        return f"/api/v1/rooms/{self.room.pk}/beds/{bed.pk}/bookings"
+
+    def stay(self, guests=1):
+        return {
+            "check_in": self.check_in.isoformat(),
+            "check_out": self.check_out.isoformat(),
+            "guests": guests,
+        }
+
+    def test_room_booking_blocked_by_bed_booking(self):
+        """POST /api/v1/rooms/<pk>/bookings - 침대 예약이 있으면 방 전체 예약 불가 테스트"""
+        self.client.post(self.bed_url(self.bed), self.stay(), format="json")
+
+        # API 호출
+        response = self.client.post(self.room_url, self.stay(), format="json")
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["detail"],
+            "Some beds are already booked during those dates.",
+        )
+
+    def test_bed_booking_blocked_by_room_booking(self):
+        """POST /api/v1/rooms/<pk>/beds/<bed_pk>/bookings - 방 전체 예약 시 침대 예약 불가 테스트"""
+        self.client.post(self.room_url, self.stay(), format="json")
+
+        # API 호출
+        response = self.client.post(self.bed_url(self.bed), self.stay(), format="json")
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["detail"], "Those dates are already booked.")
+
+    def test_bed_bookings_only_conflict_per_bed(self):
+        """POST /api/v1/rooms/<pk>/beds/<bed_pk>/bookings - 침대별 중복 검사 테스트"""
+        first = self.client.post(self.bed_url(self.bed), self.stay(), format="json")
+        same_bed = self.client.post(self.bed_url(self.bed), self.stay(), format="json")
+        other_bed = self.client.post(
+            self.bed_url(self.other_bed), self.stay(), format="json"
+        )
+
+        # 검증
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(same_bed.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(other_bed.status_code, status.HTTP_201_CREATED)
+
+    def test_one_conflict_query_per_booking(self):
+        """POST /api/v1/rooms/<pk>/bookings - 예약 1건당 중복 검사 쿼리 1회 테스트"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.room_url, self.stay(), format="json")
+
+        # 검증 (bookings_booking 조회는 중복 검사 1회뿐)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        booking_selects = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith("SELECT")
+            and 'FROM "bookings_booking"' in query["sql"]
+        ]
+        self.assertEqual(len(booking_selects), 1)
+
+
+class TestConcurrentBookings(TransactionTestCase):
+    # 동시에 보내는 예약 요청 수
+    THREADS = 8
+
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.users = [
+            User.objects.create_user(username=f"guest{i}", password="testpass123")
+            for i in range(self.THREADS)
+        ]
+        self.room = Room.objects.create(
+            name="Popular Room",
+            price=50000,
+            rooms=1,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=Room.RoomKindChoices.ENTIRE_PLACE,
+            owner=self.users[0],
+        )
+        self.check_in = timezone.localdate() + timedelta(days=7)
+
+    def post_in_parallel(self, url, data):
+        barrier = threading.Barrier(self.THREADS)
+        statuses = []
+
+        def book(user):
+            client = APIClient()
+            client.force_authenticate(user=user)
+            try:
+                barrier.wait()
+                response = client.post(url, data, format="json")
+                statuses.append(response.status_code)
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=book, args=(user,)) for user in self.users
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return statuses
+
+    def test_parallel_room_bookings_do_not_double_book(self):
+        """POST /api/v1/rooms/<pk>/bookings - 동시 예약 요청 중 1건만 성공 테스트"""
+        statuses = self.post_in_parallel(
+            f"/api/v1/rooms/{self.room.pk}/bookings",
+            {
+                "check_in": self.check_in.isoformat(),
+                "check_out": (self.check_in + timedelta(days=2)).isoformat(),
+                "guests": 2,
+            },
+        )
+
+        # 검증
+        self.assertEqual(len(statuses), self.THREADS)
+        self.assertEqual(statuses.count(status.HTTP_201_CREATED), 1)
+        self.assertEqual(
+            statuses.count(status.HTTP_400_BAD_REQUEST), self.THREADS - 1
+        )
+        self.assertEqual(Booking.objects.filter(room=self.room).count(), 1)
+
+    def test_parallel_experience_bookings_do_not_oversell(self):
+        """POST /api/v1/experiences/<pk>/bookings - 동시 예약 요청이 정원을 넘지 않는지 테스트"""
+        host = User.objects.create_user(username="host", password="testpass123")
+        experience = Experience.objects.create(
+            name="Popular Experience",
+            host=host,
+            price=20000,
+            address="Address",
+            start="09:00",
+            end="18:00",
+            capacity=5,
+            description="Description",
+        )
+        experience_time = timezone.make_aware(
+            datetime.combine(self.check_in, datetime.min.time().replace(hour=10))
+        )
+        # 첫 예약으로 슬롯을 열어 두고, 나머지는 조건부 UPDATE로 좌석을 다툼
+        Booking.objects.create(
+            kind=Booking.BookingKindChoices.EXPERIENCE,
+            user=host,
+            experience=experience,
+            experience_time=experience_time,
+            experience_end=experience_time + timedelta(hours=1),
+            guests=1,
+        )
+        ExperienceSlot.objects.create(
+            experience=experience,
+            starts_at=experience_time,
+            capacity=5,
+            seats=4,
+        )
+
+        statuses = self.post_in_parallel(
+            f"/api/v1/experiences/{experience.pk}/bookings",
+            {"experience_time": experience_time.isoformat(), "guests": 1},
+        )
+
+        # 검증 (남은 4석만큼만 성공)
+        self.assertEqual(len(statuses), self.THREADS)
+        self.assertEqual(statuses.count(status.HTTP_201_CREATED), 4)
+        self.assertEqual(
+            statuses.count(status.HTTP_400_BAD_REQUEST), self.THREADS - 4
+        )
+        self.assertEqual(Booking.objects.filter(experience=experience).count(), 5)
+        self.assertEqual(ExperienceSlot.objects.get(experience=experience).seats, 0)
+
+
+class TestBookingQueryPlans(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        self.room = Room.objects.create(
+            name="Room",
+            price=50000,
+            rooms=1,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=Room.RoomKindChoices.ENTIRE_PLACE,
+            owner=self.user,
+        )
+        self.bed = Bed.objects.create(
+            room=self.room,
+            name="Bed",
+            bed_type=Bed.BedTypeChoices.SINGLE,
+        )
+        self.experience = Experience.objects.create(
+            name="Experience",
+            host=self.user,
+            price=30000,
+            address="Address",
+            start="09:00",
+            end="18:00",
+            description="Description",
+        )
+        self.check_in = date(2030, 1, 1)
+        self.check_out = date(2030, 1, 3)
+
+    def assertUsesIndex(self, queryset):
+        if connection.vendor == "postgresql":
+            # 데이터가 적으면 플래너가 Seq Scan을 고르므로 비활성화
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = queryset.explain()
+        self.assertNotRegex(plan, r"\bSCAN bookings_booking\b|Seq Scan on bookings_booking")
+        self.assertRegex(plan, r"bookings_booking USING (COVERING )?INDEX|Index")
+
+    def test_conflict_checks_use_indexes(self):
+        """예약 중복 검사 쿼리가 전체 스캔 없이 인덱스를 사용하는지 테스트"""
+        experience_time = timezone.now() + timedelta(days=1)
+        querysets = [
+            room_conflicts(self.room, self.check_in, self.check_out),
+            bed_conflicts(self.bed, self.check_in, self.check_out),
+            experience_conflicts(
+                self.experience,
+                experience_time,
+                experience_time + timedelta(hours=1),
+            ),
+        ]
+
+        # 검증
+        for queryset in querysets:
+            self.assertUsesIndex(queryset.order_by().values_list("kind"))
+
+    def test_listing_queries_use_indexes(self):
+        """예약 목록/프로필 쿼리가 인덱스를 사용하는지 테스트"""
+        querysets = [
+            Booking.objects.filter(
+                room=self.room,
+                kind=Booking.BookingKindChoices.ROOM,
+                check_in__gte=self.check_in,
+                check_in__lte=self.check_out,
+            ),
+            Booking.objects.filter(
+                bed=self.bed,
+                kind=Booking.BookingKindChoices.BED,
+                check_in__gte=self.check_in,
+                check_in__lte=self.check_out,
+            ),
+            Booking.objects.filter(
+                experience=self.experience,
+                kind=Booking.BookingKindChoices.EXPERIENCE,
+            ),
+            Booking.objects.filter(user=self.user),
+        ]
+
+        # 검증
+        for queryset in querysets:
+            self.assertUsesIndex(queryset)
+
+    def test_experience_month_uses_time_range(self):
+        """체험 월별 예약 쿼리가 experience_time 범위로 인덱스를 사용하는지 테스트"""
+        month_start, month_end = month_range(2030, 1)
+        queryset = Booking.objects.filter(
+            experience=self.experience,
+            kind=Booking.BookingKindChoices.EXPERIENCE,
+            experience_time__gte=month_start,
+            experience_time__lt=month_end,
+        )
+
+        # 검증
+        self.assertUsesIndex(queryset)
+        if connection.vendor == "sqlite":
+            self.assertIn(
+                "booking_experience_slot_idx (experience_id=? AND experience_time>? AND experience_time<?)",
+                queryset.explain(),
+            )
+
+
+class TestIdempotentBookings(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        self.client.force_authenticate(user=self.user)
+        self.room = Room.objects.create(
+            name="Room",
+            price=50000,
+            rooms=1,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=Room.RoomKindChoices.ENTIRE_PLACE,
+            owner=self.user,
+        )
+        self.url = f"/api/v1/rooms/{self.room.pk}/bookings"
+        check_in = timezone.localdate() + timedelta(days=1)
+        self.data = {
+            "check_in": check_in.isoformat(),
+            "check_out": (check_in + timedelta(days=2)).isoformat(),
+            "guests": 2,
+        }
+
+    def post(self, key, data=None):
+        return self.client.post(
+            self.url,
+            data or self.data,
+            format="json",
+            HTTP_IDEMPOTENCY_KEY=key,
+        )
+
+    def test_retry_replays_first_response(self):
+        """POST /api/v1/rooms/<pk>/bookings - 같은 키 재시도 시 첫 응답 재생 테스트"""
+        first = self.post("retry-1")
+
+        # 검증 (중복 검사 없이 저장된 응답을 그대로 반환)
+        with CaptureQueriesContext(connection) as queries:
+            retry = self.post("retry-1")
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.data, first.data)
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        self.assertFalse(
+            any('FROM "bookings_booking"' in query["sql"] for query in queries)
+        )
+        self.assertEqual(Booking.objects.count(), 1)
+
+    def test_error_responses_are_replayed(self):
+        """POST /api/v1/rooms/<pk>/bookings - 실패 응답도 재생 테스트"""
+        self.post("other-key")
+        conflict = self.post("conflict")
+        Booking.objects.all().delete()
+
+        # 검증 (예약이 사라져도 같은 키는 처음 응답을 반환)
+        retry = self.post("conflict")
+        self.assertEqual(conflict.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(retry.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(retry.data, conflict.data)
+
+    def test_key_reused_for_different_request(self):
+        """POST /api/v1/rooms/<pk>/bookings - 다른 요청에 같은 키 사용 시 422 테스트"""
+        self.post("reused")
+
+        # API 호출
+        response = self.post("reused", {**self.data, "guests": 3})
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+    def test_keys_are_per_user_and_expire(self):
+        """POST /api/v1/rooms/<pk>/bookings - 사용자별 키 및 만료 테스트"""
+        self.post("shared")
+        other = User.objects.create_user(username="other", password="testpass123")
+        self.client.force_authenticate(user=other)
+
+        # 검증 (다른 사용자의 같은 키는 새 요청)
+        response = self.post("shared")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # 검증 (만료된 키는 새 요청)
+        IdempotencyKey.objects.update(expires_at=timezone.now())
+        Booking.objects.all().delete()
+        response = self.post("shared")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertFalse(response.has_header("Idempotent-Replayed"))
+
+    def test_without_key(self):
+        """POST /api/v1/rooms/<pk>/bookings - 키 없는 요청은 기존과 동일 테스트"""
+        first = self.client.post(self.url, self.data, format="json")
+        second = self.client.post(self.url, self.data, format="json")
+
+        # 검증
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+
+class TestConcurrentIdempotentRetries(TransactionTestCase):
+    # 같은 키로 동시에 보내는 재시도 수
+    THREADS = 8
+
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.user = User.objects.create_user(username="guest", password="testpass123")
+        self.room = Room.objects.create(
+            name="Room",
+            price=50000,
+            rooms=1,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=Room.RoomKindChoices.ENTIRE_PLACE,
+            owner=self.user,
+        )
+        check_in = timezone.localdate() + timedelta(days=7)
+        self.data = {
+            "check_in": check_in.isoformat(),
+            "check_out": (check_in + timedelta(days=2)).isoformat(),
+            "guests": 2,
+        }
+
+    def test_concurrent_retries_with_same_key(self):
+        """POST /api/v1/rooms/<pk>/bookings - 같은 키 동시 재시도 시 예약 1건 테스트"""
+        barrier = threading.Barrier(self.THREADS)
+        responses = []
+
+        def retry():
+            client = APIClient()
+            client.force_authenticate(user=self.user)
+            try:
+                barrier.wait()
+                responses.append(
+                    client.post(
+                        f"/api/v1/rooms/{self.room.pk}/bookings",
+                        self.data,
+                        format="json",
+                        HTTP_IDEMPOTENCY_KEY="same-key",
+                    )
+                )
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=retry) for _ in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 검증 (진행 중인 재시도는 409, 완료 후 재시도는 같은 201 응답)
+        created = [r for r in responses if r.status_code == status.HTTP_201_CREATED]
+        self.assertEqual(len(responses), self.THREADS)
+        self.assertTrue(created)
+        self.assertEqual({r.data["pk"] for r in created}, {created[0].data["pk"]})
+        self.assertTrue(
+            all(
+                r.status_code in (status.HTTP_201_CREATED, status.HTTP_409_CONFLICT)
+                for r in responses
+            )
+        )
+        self.assertEqual(Booking.objects.count(), 1)
+        self.assertEqual(IdempotencyKey.objects.count(), 1)
+
+
+class TestBookingExport(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.host = User.objects.create_user(
+            username="host", password="testpass123", is_host=True
+        )
+        self.other_host = User.objects.create_user(
+            username="other", password="testpass123", is_host=True
+        )
+        self.guest = User.objects.create_user(username="guest", password="testpass123")
+        self.client.force_authenticate(user=self.host)
+        self.room = self.create_room("Host Room", self.host)
+        self.other_room = self.create_room("Other Room", self.other_host)
+        self.inside = self.book(self.room, date(2030, 1, 30), date(2030, 2, 2))
+        self.book(self.room, date(2030, 3, 1), date(2030, 3, 2))
+        self.other = self.book(self.other_room, date(2030, 2, 10), date(2030, 2, 11))
+        self.url = "/api/v1/bookings/export"
+        self.february = {"from": "2030-02-01", "to": "2030-02-28"}
+
+    def create_room(self, name, owner):
+        return Room.objects.create(
+            name=name,
+            price=50000,
+            rooms=1,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=Room.RoomKindChoices.ENTIRE_PLACE,
+            owner=owner,
+        )
+
+    def book(self, room, check_in, check_out):
+        return Booking.objects.create(
+            kind=Booking.BookingKindChoices.ROOM,
+            user=self.guest,
+            room=room,
+            check_in=check_in,
+            check_out=check_out,
+            guests=2,
+        )
+
+    def export(self, **params):
+        response = self.client.get(self.url, {**self.february, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return b"".join(response.streaming_content).decode("utf-8")
+
+    def test_host_exports_own_bookings_as_ndjson(self):
+        """GET /api/v1/bookings/export - 호스트 본인 예약 NDJSON 스트리밍 테스트"""
+        rows = [json.loads(line) for line in self.export().splitlines()]
+
+        # 검증 (이전 달에 시작한 숙박 포함, 다른 호스트 예약 제외)
+        self.assertEqual([row["pk"] for row in rows], [self.inside.pk])
+        self.assertEqual(rows[0]["check_in"], "2030-01-30")
+        self.assertEqual(rows[0]["room_id"], self.room.pk)
+
+    def test_staff_exports_everything_as_csv(self):
+        """GET /api/v1/bookings/export?output=csv - 스태프 전체 CSV 테스트"""
+        staff = User.objects.create_user(
+            username="staff", password="testpass123", is_staff=True
+        )
+        self.client.force_authenticate(user=staff)
+
+        # API 호출
+        rows = list(csv.reader(io.StringIO(self.export(output="csv"))))
+
+        # 검증
+        self.assertEqual(rows[0][:3], ["pk", "kind", "user_id"])
+        self.assertEqual([int(row[0]) for row in rows[1:]], [self.inside.pk, self.other.pk])
+
+    def test_export_streams_with_one_query(self):
+        """GET /api/v1/bookings/export - 행 수와 무관한 쿼리 수 테스트"""
+        for day in range(1, 28):
+            self.book(self.room, date(2030, 2, day), date(2030, 2, day + 1))
+
+        # 검증 (모델 인스턴스 없이 values 조회 1회)
+        with self.assertNumQueries(1):
+            lines = self.export().splitlines()
+        self.assertEqual(len(lines), 28)
+
+    def test_guest_forbidden(self):
+        """GET /api/v1/bookings/export - 일반 사용자 403 테스트"""
+        self.client.force_authenticate(user=self.guest)
+
+        # API 호출
+        response = self.client.get(self.url, self.february)
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_invalid_params(self):
+        """GET /api/v1/bookings/export - 잘못된 파라미터 테스트"""
+        for params in (
+            {"from": "2030-02-01"},
+            {"from": "2030-02-28", "to": "2030-02-01"},
+            {**self.february, "output": "xml"},
+            {"from": "9999-12-31", "to": "9999-12-31"},
+        ):
+            response = self.client.get(self.url, params)
+
+            # 검증
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_command(self):
+        """manage.py export_bookings - 파일 내보내기 및 처리량 출력 테스트"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = f"{directory}/bookings.csv"
+            stderr = io.StringIO()
+            call_command(
+                "export_bookings",
+                "--from=2030-02-01",
+                "--to=2030-02-28",
+                "--output=csv",
+                f"--file={path}",
+                stderr=stderr,
+            )
+            with open(path, encoding="utf-8") as exported:
+                rows = list(csv.reader(exported))
+
+        # 검증
+        self.assertEqual(len(rows), 3)
+        self.assertIn("Exported 2 bookings", stderr.getvalue())
+        self.assertIn("rows/s", stderr.getvalue())
+
+
+class TestPublicBookingQueries(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        self.host = User.objects.create_user(
+            username="host", password="testpass123", is_host=True
+        )
+        self.client.force_authenticate(user=self.user)
+        self.room = Room.objects.create(
+            name="Hostel",
+            price=30000,
+            rooms=1,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=Room.RoomKindChoices.SHARED_ROOM,
+            owner=self.host,
+        )
+        self.bed = Bed.objects.create(
+            room=self.room,
+            name="Bed",
+            bed_type=Bed.BedTypeChoices.SINGLE,
+        )
+        self.experience = Experience.objects.create(
+            name="Experience",
+            host=self.host,
+            price=20000,
+            address="Address",
+            start="09:00",
+            end="18:00",
+            description="Description",
+        )
+        self.month = {"year": 2030, "month": 1}
+
+    def create_bookings(self, count):
+        for day in range(1, count + 1):
+            check_in = date(2030, 1, day)
+            Booking.objects.create(
+                kind=Booking.BookingKindChoices.ROOM,
+                user=self.user,
+                room=self.room,
+                check_in=check_in,
+                check_out=check_in + timedelta(days=1),
+                guests=1,
+            )
+            Booking.objects.create(
+                kind=Booking.BookingKindChoices.BED,
+                user=self.user,
+                room=self.room,
+                bed=self.bed,
+                check_in=check_in,
+                check_out=check_in + timedelta(days=1),
+                guests=1,
+            )
+            experience_time = timezone.make_aware(datetime(2030, 1, day, 10))
+            Booking.objects.create(
+                kind=Booking.BookingKindChoices.EXPERIENCE,
+                user=self.user,
+                experience=self.experience,
+                experience_time=experience_time,
+                experience_end=experience_time + timedelta(hours=1),
+                guests=1,
+            )
+
+    def assertPageQueries(self, url, expected_price):
+        # 검증 (대상 조회 1회 + 예약 조회 1회, 예약 수와 무관)
+        for count in (1, 3):
+            Booking.objects.all().delete()
+            self.create_bookings(count)
+            with self.assertNumQueries(2):
+                response = self.client.get(url, self.month)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(response.data), count)
+            self.assertEqual(response.data[0]["price"], expected_price)
+        return response
+
+    def test_room_bookings_page(self):
+        """GET /api/v1/rooms/<pk>/bookings - 페이지당 쿼리 수 고정 테스트"""
+        response = self.assertPageQueries(
+            f"/api/v1/rooms/{self.room.pk}/bookings", 30000
+        )
+        self.assertIsNone(response.data[0]["bed"])
+
+    def test_bed_bookings_page(self):
+        """GET /api/v1/rooms/<pk>/beds/<bed_pk>/bookings - 페이지당 쿼리 수 고정 테스트"""
+        response = self.assertPageQueries(
+            f"/api/v1/rooms/{self.room.pk}/beds/{self.bed.pk}/bookings", 30000
+        )
+        self.assertEqual(
+            response.data[0]["bed"],
+            {
+                "pk": self.bed.pk,
+                "name": "Bed",
+                "bed_type": Bed.BedTypeChoices.SINGLE,
+                "room": self.room.pk,
+            },
+        )
+
+    def test_experience_bookings_page(self):
+        """GET /api/v1/experiences/<pk>/bookings - 페이지당 쿼리 수 고정 테스트"""
+        self.assertPageQueries(
+            f"/api/v1/experiences/{self.experience.pk}/bookings", 20000
+        )
+
+
+class TestBookingHolds(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        self.other = User.objects.create_user(username="other", password="testpass123")
+        self.host = User.objects.create_user(
+            username="host", password="testpass123", is_host=True
+        )
+        self.client.force_authenticate(user=self.user)
+        self.room = Room.objects.create(
+            name="Hostel",
+            price=30000,
+            rooms=1,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=Room.RoomKindChoices.SHARED_ROOM,
+            owner=self.host,
+        )
+        self.bed = Bed.objects.create(
+            room=self.room,
+            name="Bed",
+            bed_type=Bed.BedTypeChoices.SINGLE,
+        )
+        self.experience = Experience.objects.create(
+            name="Experience",
+            host=self.host,
+            price=20000,
+            address="Address",
+            start="09:00",
+            end="18:00",
+            description="Description",
+        )
+        self.check_in = timezone.localdate() + timedelta(days=1)
+        self.stay = {
+            "check_in": self.check_in.isoformat(),
+            "check_out": (self.check_in + timedelta(days=2)).isoformat(),
+            "guests": 1,
+        }
+        self.slot = {
+            "experience_time": timezone.make_aware(
+                datetime.combine(self.check_in, datetime.min.time().replace(hour=10))
+            ).isoformat(),
+            "guests": 1,
+        }
+        self.room_holds_url = f"/api/v1/rooms/{self.room.pk}/holds"
+
+    def hold(self, url, data):
+        response = self.client.post(url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data
+
+    def expire(self, hold):
+        BookingHold.objects.filter(pk=hold["pk"]).update(
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+    def test_hold_blocks_other_users(self):
+        """POST /api/v1/rooms/<pk>/holds - 홀드 중인 날짜는 다른 사용자가 예약 불가 테스트"""
+        hold = self.hold(self.room_holds_url, self.stay)
+        self.client.force_authenticate(user=self.other)
+
+        # API 호출
+        booking = self.client.post(
+            f"/api/v1/rooms/{self.room.pk}/bookings", self.stay, format="json"
+        )
+        bed_hold = self.client.post(
+            f"/api/v1/rooms/{self.room.pk}/beds/{self.bed.pk}/holds",
+            self.stay,
+            format="json",
+        )
+
+        # 검증
+        self.assertEqual(hold["kind"], Booking.BookingKindChoices.ROOM)
+        self.assertEqual(booking.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("on hold", booking.data["detail"])
+        self.assertEqual(bed_hold.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Booking.objects.exists())
+
+    def test_hold_blocked_by_booking(self):
+        """POST /api/v1/rooms/<pk>/holds - 이미 예약된 날짜는 홀드 불가 테스트"""
+        self.client.post(
+            f"/api/v1/rooms/{self.room.pk}/beds/{self.bed.pk}/bookings",
+            self.stay,
+            format="json",
+        )
+        self.client.force_authenticate(user=self.other)
+
+        # API 호출
+        response = self.client.post(self.room_holds_url, self.stay, format="json")
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["detail"],
+            "Some beds are already booked during those dates.",
+        )
+
+    def test_expired_hold_frees_dates(self):
+        """POST /api/v1/rooms/<pk>/holds - 만료된 홀드는 무시되고 정리되는지 테스트"""
+        hold = self.hold(self.room_holds_url, self.stay)
+        self.expire(hold)
+        self.client.force_authenticate(user=self.other)
+
+        # API 호출
+        other_hold = self.hold(self.room_holds_url, self.stay)
+
+        # 검증
+        self.assertEqual(
+            list(BookingHold.objects.values_list("pk", flat=True)),
+            [other_hold["pk"]],
+        )
+
+    def test_holding_again_replaces_hold(self):
+        """POST /api/v1/rooms/<pk>/holds - 같은 사용자의 이전 홀드를 대체하는지 테스트"""
+        self.hold(self.room_holds_url, self.stay)
+
+        # API 호출
+        self.stay["guests"] = 2
+        hold = self.hold(self.room_holds_url, self.stay)
+
+        # 검증
+        self.assertEqual(BookingHold.objects.get().pk, hold["pk"])
+        self.assertEqual(hold["guests"], 2)
+
+    def test_confirm_hold(self):
+        """POST /api/v1/bookings/holds/<pk>/confirm - 홀드를 예약으로 전환 테스트"""
+        hold = self.hold(
+            f"/api/v1/rooms/{self.room.pk}/beds/{self.bed.pk}/holds", self.stay
+        )
+
+        # API 호출
+        response = self.client.post(f"/api/v1/bookings/holds/{hold['pk']}/confirm")
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        booking = Booking.objects.get(pk=response.data["pk"])
+        self.assertEqual(booking.kind, Booking.BookingKindChoices.BED)
+        self.assertEqual(booking.bed, self.bed)
+        self.assertEqual(booking.user, self.user)
+        self.assertFalse(BookingHold.objects.exists())
+        again = self.client.post(f"/api/v1/bookings/holds/{hold['pk']}/confirm")
+        self.assertEqual(again.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_confirm_experience_hold(self):
+        """POST /api/v1/experiences/<pk>/holds - 체험 슬롯 홀드 후 예약 전환 테스트"""
+        # 홀드가 남은 좌석을 모두 차지
+        self.experience.capacity = 1
+        self.experience.save()
+        hold = self.hold(f"/api/v1/experiences/{self.experience.pk}/holds", self.slot)
+        self.client.force_authenticate(user=self.other)
+        blocked = self.client.post(
+            f"/api/v1/experiences/{self.experience.pk}/bookings",
+            self.slot,
+            format="json",
+        )
+        self.client.force_authenticate(user=self.user)
+
+        # API 호출
+        response = self.client.post(f"/api/v1/bookings/holds/{hold['pk']}/confirm")
+
+        # 검증
+        self.assertEqual(blocked.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(blocked.data["detail"], "Not enough seats left in this slot.")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            Booking.objects.get().experience_end,
+            datetime.fromisoformat(hold["experience_end"]),
+        )
+
+    def test_confirm_expired_hold(self):
+        """POST /api/v1/bookings/holds/<pk>/confirm - 만료된 홀드는 전환 불가 테스트"""
+        hold = self.hold(self.room_holds_url, self.stay)
+        self.expire(hold)
+
+        # API 호출
+        response = self.client.post(f"/api/v1/bookings/holds/{hold['pk']}/confirm")
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["detail"], "This hold has expired.")
+        self.assertFalse(Booking.objects.exists())
+
+    def test_only_owner_can_use_hold(self):
+        """/api/v1/bookings/holds/<pk> - 다른 사용자의 홀드 조회/전환/해제 불가 테스트"""
+        hold = self.hold(self.room_holds_url, self.stay)
+        url = f"/api/v1/bookings/holds/{hold['pk']}"
+        self.client.force_authenticate(user=self.other)
+
+        # API 호출
+        responses = [
+            self.client.get(url),
+            self.client.delete(url),
+            self.client.post(f"{url}/confirm"),
+        ]
+
+        # 검증
+        for response in responses:
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertTrue(BookingHold.objects.exists())
+
+    def test_release_hold(self):
+        """DELETE /api/v1/bookings/holds/<pk> - 홀드 해제 후 다른 사용자가 예약 가능 테스트"""
+        hold = self.hold(self.room_holds_url, self.stay)
+
+        # API 호출
+        response = self.client.delete(f"/api/v1/bookings/holds/{hold['pk']}")
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.client.force_authenticate(user=self.other)
+        booking = self.client.post(
+            f"/api/v1/rooms/{self.room.pk}/bookings", self.stay, format="json"
+        )
+        self.assertEqual(booking.status_code, status.HTTP_201_CREATED)
+
+    def test_purge_booking_holds(self):
+        """purge_booking_holds - 만료된 홀드만 삭제하는지 테스트"""
+        expired = self.hold(self.room_holds_url, self.stay)
+        self.expire(expired)
+        self.client.force_authenticate(user=self.other)
+        live = self.hold(f"/api/v1/experiences/{self.experience.pk}/holds", self.slot)
+
+        # 명령 실행
+        out = io.StringIO()
+        call_command("purge_booking_holds", stdout=out)
+
+        # 검증
+        self.assertIn("Deleted 1 expired holds.", out.getvalue())
+        self.assertEqual(
+            list(BookingHold.objects.values_list("pk", flat=True)), [live["pk"]]
+        )
+
+
+class TestBulkBookings(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.user = User.objects.create_user(username="agent", password="testpass123")
+        self.other = User.objects.create_user(username="other", password="testpass123")
+        self.host = User.objects.create_user(
+            username="host", password="testpass123", is_host=True
+        )
+        self.client.force_authenticate(user=self.user)
+        self.room = Room.objects.create(
+            name="Hostel",
+            price=30000,
+            rooms=1,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=Room.RoomKindChoices.SHARED_ROOM,
+            owner=self.host,
+        )
+        self.beds = [
+            Bed.objects.create(
+                room=self.room,
+                name=f"Bed {i}",
+                bed_type=Bed.BedTypeChoices.SINGLE,
+            )
+            for i in range(10)
+        ]
+        self.experience = Experience.objects.create(
+            name="Experience",
+            host=self.host,
+            price=20000,
+            address="Address",
+            start="09:00",
+            end="18:00",
+            description="Description",
+        )
+        self.check_in = timezone.localdate() + timedelta(days=1)
+        self.url = "/api/v1/bookings/bulk"
+
+    def bed_item(self, bed, **fields):
+        item = {
+            "kind": "bed",
+            "bed": bed.pk,
+            "check_in": self.check_in.isoformat(),
+            "check_out": (self.check_in + timedelta(days=2)).isoformat(),
+            "guests": 1,
+        }
+        item.update(fields)
+        return item
+
+    def slot_item(self, hour):
+        experience_time = timezone.make_aware(
+            datetime.combine(self.check_in, datetime.min.time().replace(hour=hour))
+        )
+        return {
+            "kind": "experience",
+            "experience": self.experience.pk,
+            "experience_time": experience_time.isoformat(),
+            "guests": 2,
+        }
+
+    def statuses(self, response):
+        return [result["status"] for result in response.data["results"]]
+
+    def test_all_or_nothing_creates_every_booking(self):
+        """POST /api/v1/bookings/bulk - 침대와 체험 슬롯 일괄 예약 테스트"""
+        items = [self.bed_item(bed) for bed in self.beds[:3]]
+        items += [self.slot_item(10), self.slot_item(11)]
+
+        # API 호출
+        response = self.client.post(self.url, {"bookings": items}, format="json")
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 5)
+        self.assertEqual(self.statuses(response), ["created"] * 5)
+        self.assertEqual(response.data["results"][0]["booking"]["price"], 30000)
+        self.assertEqual(response.data["results"][3]["booking"]["price"], 20000)
+        self.assertEqual(Booking.objects.filter(user=self.user).count(), 5)
+
+    def test_all_or_nothing_rolls_back_on_conflict(self):
+        """POST /api/v1/bookings/bulk - 하나라도 충돌하면 아무것도 생성하지 않는지 테스트"""
+        self.client.force_authenticate(user=self.other)
+        self.client.post(
+            f"/api/v1/rooms/{self.room.pk}/beds/{self.beds[1].pk}/bookings",
+            self.bed_item(self.beds[1]),
+            format="json",
+        )
+        self.client.force_authenticate(user=self.user)
+        items = [self.bed_item(bed) for bed in self.beds[:3]]
+
+        # API 호출
+        response = self.client.post(self.url, {"bookings": items}, format="json")
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.statuses(response), ["skipped", "failed", "skipped"])
+        self.assertEqual(
+            response.data["results"][1]["errors"]["detail"],
+            "Some beds are already booked during those dates.",
+        )
+        self.assertFalse(Booking.objects.filter(user=self.user).exists())
+
+    def test_best_effort_reports_each_item(self):
+        """POST /api/v1/bookings/bulk - best_effort 모드의 항목별 결과 테스트"""
+        BookingHold.objects.create(
+            kind=Booking.BookingKindChoices.BED,
+            user=self.other,
+            room=self.room,
+            bed=self.beds[2],
+            check_in=self.check_in,
+            check_out=self.check_in + timedelta(days=1),
+            guests=1,
+            expires_at=timezone.now() + timedelta(minutes=5),
+        )
+        items = [
+            self.bed_item(self.beds[0]),
+            self.bed_item(self.beds[0]),
+            self.bed_item(self.beds[1], check_in="2000-01-01"),
+            self.bed_item(self.beds[2]),
+            {"kind": "bed", "bed": 999999, "guests": 1},
+            {"kind": "boat"},
+            self.slot_item(10),
+        ]
+
+        # API 호출
+        response = self.client.post(
+            self.url, {"mode": "best_effort", "bookings": items}, format="json"
+        )
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            self.statuses(response),
+            ["created", "failed", "failed", "failed", "failed", "failed", "created"],
+        )
+        errors = [result.get("errors") for result in response.data["results"]]
+        self.assertEqual(
+            errors[1]["detail"], "Some beds are already booked during those dates."
+        )
+        self.assertIn("check_in", errors[2])
+        self.assertIn("on hold", errors[3]["detail"])
+        self.assertEqual(errors[4], {"bed": ["Not found."]})
+        self.assertIn("kind", errors[5])
+        self.assertEqual(Booking.objects.filter(user=self.user).count(), 2)
+
+    def test_host_cannot_bulk_book_own_experience(self):
+        """POST /api/v1/bookings/bulk - 호스트 본인 체험 예약 불가 테스트"""
+        self.client.force_authenticate(user=self.host)
+
+        # API 호출
+        response = self.client.post(
+            self.url, {"bookings": [self.slot_item(10)]}, format="json"
+        )
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.statuses(response), ["failed"])
+
+    def test_query_count_does_not_grow_with_items(self):
+        """POST /api/v1/bookings/bulk - 항목 수와 무관하게 쿼리 수 고정 테스트"""
+        counts = []
+        for beds, hours in ((self.beds[:2], (9,)), (self.beds[2:], range(10, 17))):
+            items = [self.bed_item(bed) for bed in beds]
+            items += [self.slot_item(hour) for hour in hours]
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(self.url, {"bookings": items}, format="json")
+            self.assertEqual(response.data["created"], len(items))
+            counts.append(len(queries))
+
+        # 검증
+        self.assertEqual(counts[0], counts[1])
+
+    def test_rejects_bad_payloads(self):
+        """POST /api/v1/bookings/bulk - 잘못된 요청 본문 테스트"""
+        payloads = [
+            {"bookings": []},
+            {"bookings": "bed"},
+            {"bookings": [self.bed_item(self.beds[0])], "mode": "sometimes"},
+            {"bookings": [self.bed_item(self.beds[0])] * 101},
+        ]
+
+        # 검증
+        for payload in payloads:
+            response = self.client.post(self.url, payload, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Booking.objects.exists())
+
+    def test_slot_seats_across_items(self):
+        """POST /api/v1/bookings/bulk - 같은 슬롯 항목끼리 좌석을 나눠 쓰는지 테스트"""
+        self.experience.capacity = 5
+        self.experience.save()
+        items = [self.slot_item(10), self.slot_item(10), self.slot_item(10)]
+
+        # API 호출
+        response = self.client.post(
+            self.url, {"mode": "best_effort", "bookings": items}, format="json"
+        )
+
+        # 검증 (2 + 2명까지만 가능)
+        self.assertEqual(self.statuses(response), ["created", "created", "failed"])
+        self.assertEqual(
+            response.data["results"][2]["errors"]["detail"],
+            "Not enough seats left in this slot.",
+        )
+        self.assertEqual(ExperienceSlot.objects.get().seats, 1)
+
+    def test_invalidates_slot_listing(self):
+        """POST /api/v1/bookings/bulk - 일괄 예약 후 슬롯 목록 캐시 무효화 테스트"""
+        cache.clear()
+        self.experience.capacity = 2
+        self.experience.save()
+        slots_url = f"/api/v1/experiences/{self.experience.pk}/slots"
+        day = {"from": self.check_in.isoformat(), "to": self.check_in.isoformat()}
+
+        def ten_oclock():
+            response = self.client.get(slots_url, day)
+            return next(
+                slot for slot in response.data if slot["start"].hour == 10
+            )
+
+        self.assertEqual(ten_oclock()["seats"], 2)
+
+        # API 호출
+        response = self.client.post(
+            self.url, {"bookings": [self.slot_item(10)]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        # 검증
+        slot = ten_oclock()
+        self.assertEqual(slot["seats"], 0)
+        self.assertFalse(slot["available"])
+
+
+class TestExperienceSeats(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.users = [
+            User.objects.create_user(username=f"guest{i}", password="testpass123")
+            for i in range(3)
+        ]
+        self.host = User.objects.create_user(
+            username="host", password="testpass123", is_host=True
+        )
+        self.experience = Experience.objects.create(
+            name="Experience",
+            host=self.host,
+            price=20000,
+            address="Address",
+            start="09:00",
+            end="18:00",
+            capacity=4,
+            description="Description",
+        )
+        self.url = f"/api/v1/experiences/{self.experience.pk}/bookings"
+        self.day = timezone.localdate() + timedelta(days=1)
+
+    def at(self, hour, minute=0):
+        return timezone.make_aware(
+            datetime.combine(self.day, time(hour, minute))
+        ).isoformat()
+
+    def book(self, user, guests, experience_time=None):
+        self.client.force_authenticate(user=user)
+        return self.client.post(
+            self.url,
+            {"experience_time": experience_time or self.at(10), "guests": guests},
+            format="json",
+        )
+
+    def seats(self):
+        return ExperienceSlot.objects.get(experience=self.experience).seats
+
+    def test_parties_share_slot_until_full(self):
+        """POST /api/v1/experiences/<pk>/bookings - 정원까지 여러 예약이 같은 슬롯을 공유하는지 테스트"""
+        first = self.book(self.users[0], 2)
+        second = self.book(self.users[1], 1)
+        full = self.book(self.users[2], 2)
+
+        # 검증
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(full.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(full.data["detail"], "Not enough seats left in this slot.")
+        self.assertEqual(self.seats(), 1)
+
+    def test_party_larger_than_capacity(self):
+        """POST /api/v1/experiences/<pk>/bookings - 정원을 넘는 인원 예약 시 400 테스트"""
+        response = self.book(self.users[0], 5)
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("non_field_errors", response.data)
+        self.assertFalse(ExperienceSlot.objects.exists())
+
+    def test_overlapping_start_is_taken(self):
+        """POST /api/v1/experiences/<pk>/bookings - 다른 시각에 시작하는 겹치는 슬롯은 거절 테스트"""
+        self.book(self.users[0], 1)
+
+        # API 호출
+        response = self.book(self.users[1], 1, self.at(10, 30))
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["detail"], "This slot is already booked.")
+
+    def test_joining_is_one_conditional_update(self):
+        """POST /api/v1/experiences/<pk>/bookings - 열린 슬롯 합류 시 중복 검사 없이 UPDATE 1회 테스트"""
+        self.book(self.users[0], 1)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.book(self.users[1], 1)
+
+        # 검증 (겹침 검사와 Experience 잠금 없이 좌석 UPDATE 1회)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        sql = [query["sql"] for query in queries]
+        slot_updates = [
+            q for q in sql if q.startswith('UPDATE "experiences_experienceslot"')
+        ]
+        self.assertEqual(len(slot_updates), 1)
+        self.assertFalse(
+            [q for q in sql if q.startswith("SELECT") and "bookings_booking" in q]
+        )
+
+    def test_cancel_move_and_hold_return_seats(self):
+        """예약 취소/이동, 홀드 해제 시 좌석이 반환되는지 테스트"""
+        booking = self.book(self.users[0], 2)
+        self.client.force_authenticate(user=self.users[1])
+        hold = self.client.post(
+            f"/api/v1/experiences/{self.experience.pk}/holds",
+            {"experience_time": self.at(10), "guests": 2},
+            format="json",
+        )
+        self.assertEqual(self.seats(), 0)
+
+        # 검증 (홀드 해제)
+        self.client.delete(f"/api/v1/bookings/holds/{hold.data['pk']}")
+        self.assertEqual(self.seats(), 2)
+
+        # 검증 (인원 변경)
+        self.client.force_authenticate(user=self.users[0])
+        booking_url = f"{self.url}/{booking.data['pk']}"
+        response = self.client.put(booking_url, {"guests": 3}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.seats(), 1)
+
+        # 검증 (취소)
+        self.client.delete(booking_url)
+        self.assertEqual(self.seats(), 4)
+
+    def test_expired_hold_seats_are_reclaimed(self):
+        """만료된 홀드의 좌석은 슬롯이 가득 찼을 때 회수되는지 테스트"""
+        self.client.force_authenticate(user=self.users[0])
+        hold = self.client.post(
+            f"/api/v1/experiences/{self.experience.pk}/holds",
+            {"experience_time": self.at(10), "guests": 4},
+            format="json",
+        )
+        BookingHold.objects.filter(pk=hold.data["pk"]).update(
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        # API 호출
+        response = self.book(self.users[1], 3)
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertFalse(BookingHold.objects.exists())
+        self.assertEqual(self.seats(), 1)
+
+    def test_capacity_change_resizes_upcoming_slots(self):
+        """Experience 정원 변경 시 예정된 슬롯의 좌석이 함께 바뀌는지 테스트"""
+        self.book(self.users[0], 3)
+
+        # 검증 (정원 증가)
+        self.experience.capacity = 6
+        self.experience.save()
+        self.assertEqual(self.seats(), 3)
+
+        # 검증 (이미 예약된 인원보다 작게 줄이면 가득 찬 슬롯으로 남음)
+        self.experience.capacity = 2
+        self.experience.save()
+        slot = ExperienceSlot.objects.get()
+        self.assertEqual((slot.capacity, slot.seats), (3, 0))
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path("bulk", views.BulkBookings.as_view()),
+    path("export", views.BookingExport.as_view()),
+    path("holds/<int:pk>", views.BookingHoldDetail.as_view()),
+    path("holds/<int:pk>/confirm", views.BookingHoldConfirm.as_view()),
+]
@@ -0,0 +1,135 @@
+from django.http import StreamingHttpResponse
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.status import HTTP_204_NO_CONTENT
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import NotFound, ParseError, PermissionDenied
+
+from common.idempotency import idempotent
+from rooms.filters import parse_date
+from .bulk import create_bookings
+from .export import FORMATS, bookings_between, iter_export
+from .models import BookingHold
+from .serializers import BookingHoldSerializer, PublicBookingSerializer
+from .services import confirm_hold
+
+
+class BookingExport(APIView):
+
+    # 한 번에 내보낼 수 있는 최대 기간 (일)
+    max_days = 366
+
+    def get(self, request):
+        user = request.user
+        if not (user.is_staff or user.is_host):
+            raise PermissionDenied("Only hosts and staff can export bookings.")
+        first_day = parse_date(request.query_params, "from")
+        last_day = parse_date(request.query_params, "to")
+        if first_day is None or last_day is None:
+            raise ParseError("from and to are required.")
+        if last_day < first_day:
+            raise ParseError("to must not be before from.")
+        if (last_day - first_day).days >= self.max_days:
+            raise ParseError(f"The range can be at most {self.max_days} days.")
+        # ?format= is taken by DRF's renderer negotiation.
+        output = request.query_params.get("output", "ndjson")
+        if output not in FORMATS:
+            raise ParseError(f"output must be one of {', '.join(FORMATS)}.")
+        try:
+            rows = bookings_between(
+                first_day,
+                last_day,
+                host=None if user.is_staff else user,
+            )
+        except OverflowError:
+            raise ParseError("to is out of range.")
+        response = StreamingHttpResponse(
+            iter_export(rows, output),
+            content_type=FORMATS[output],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="bookings-{first_day}-{last_day}.{output}"'
+        )
+        return response
+
+
+class BulkBookings(APIView):
+
+    permission_classes = [IsAuthenticated]
+
+    # 한 번에 생성할 수 있는 최대 예약 수
+    max_items = 100
+    modes = ("all_or_nothing", "best_effort")
+
+    @idempotent
+    def post(self, request):
+        if not isinstance(request.data, dict):
+            raise ParseError("Expected an object with a bookings list.")
+        items = request.data.get("bookings")
+        if not isinstance(items, list) or not items:
+            raise ParseError("bookings must be a non-empty list.")
+        if len(items) > self.max_items:
+            raise ParseError(f"At most {self.max_items} bookings can be created at once.")
+        mode = request.data.get("mode", self.modes[0])
+        if mode not in self.modes:
+            raise ParseError(f"mode must be one of {', '.join(self.modes)}.")
+        bookings, errors, saved = create_bookings(
+            request.user,
+            items,
+            all_or_nothing=mode == "all_or_nothing",
+        )
+        results = []
+        for index, (booking, error) in enumerate(zip(bookings, errors)):
+            if error is not None:
+                results.append({"index": index, "status": "failed", "errors": error})
+            elif saved:
+                results.append(
+                    {
+                        "index": index,
+                        "status": "created",
+                        "booking": PublicBookingSerializer(booking).data,
+                    }
+                )
+            else:
+                results.append({"index": index, "status": "skipped"})
+        created = sum(result["status"] == "created" for result in results)
+        return Response(
+            {"mode": mode, "created": created, "results": results},
+            status=201 if created else 400,
+        )
+
+
+class BookingHoldDetail(APIView):
+
+    permission_classes = [IsAuthenticated]
+
+    def get_object(self, pk, user):
+        try:
+            return BookingHold.objects.active().get(pk=pk, user=user)
+        except BookingHold.DoesNotExist:
+            raise NotFound
+
+    def get(self, request, pk):
+        hold = self.get_object(pk, request.user)
+        return Response(BookingHoldSerializer(hold).data)
+
+    def delete(self, request, pk):
+        hold = self.get_object(pk, request.user)
+        hold.delete()
+        return Response(status=HTTP_204_NO_CONTENT)
+
+
+class BookingHoldConfirm(APIView):
+
+    permission_classes = [IsAuthenticated]
+
+    @idempotent
+    def post(self, request, pk):
+        try:
+            hold = BookingHold.objects.select_related(
+                "room", "bed", "experience"
+            ).get(pk=pk, user=request.user)
+        except BookingHold.DoesNotExist:
+            raise NotFound
+        booking = confirm_hold(hold)
+        return Response(PublicBookingSerializer(booking).data, status=201)
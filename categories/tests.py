@@ -106,3 +106,20 @@ class CategoryAPITestCase(APITestCase):
 
         # 검증
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_categories_conditional_get(self):
+        """GET /api/v1/categories/ - ETag 304 및 변경 후 200 테스트"""
+        category = Category.objects.create(
+            name="Cached", kind=Category.CategoryKindChoices.ROOMS
+        )
+        etag = self.client.get(self.base_url)["ETag"]
+
+        # 검증 (변경 없음)
+        response = self.client.get(self.base_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # 검증 (수정 후)
+        category.name = "Changed"
+        category.save()
+        response = self.client.get(self.base_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
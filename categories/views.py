@@ -1,4 +1,6 @@
 from rest_framework.viewsets import ModelViewSet
+from common.conditional import conditional_get
+from common.paginations import KeysetPagination
 from .models import Category
 from .serializers import CategorySerializer
 
@@ -6,3 +8,18 @@ from .serializers import CategorySerializer
 class CategoryViewSet(ModelViewSet):
     serializer_class = CategorySerializer
     queryset = Category.objects.all()
+    pagination_class = KeysetPagination
+
+    @conditional_get(
+        lambda view, request: view.get_queryset(),
+        many=True,
+        pagination_class=KeysetPagination,
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @conditional_get(
+        lambda view, request, pk: view.get_queryset().filter(pk=pk),
+    )
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
@@ -0,0 +1,43 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def version_key(namespace, pk):
+    return f"{namespace}:{pk}:version"
+
+
+def get_version(namespace, pk):
+    """Current version of a cached object, used as part of its cache keys.
+
+    A missing version starts from the current time in milliseconds, so a
+    version key that was evicted never comes back with a value whose
+    payload might still be cached.
+    """
+
+    key = version_key(namespace, pk)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(namespace, pk):
+    key = version_key(namespace, pk)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), timeout=None)
+
+
+def invalidate(namespace, pk):
+    """Move an object to a new cache version now and again after commit.
+
+    The second bump drops anything a concurrent reader cached from data
+    that was read before the surrounding transaction committed.
+    """
+
+    bump_version(namespace, pk)
+    transaction.on_commit(lambda: bump_version(namespace, pk))
@@ -0,0 +1,90 @@
+import hashlib
+import json
+from calendar import timegm
+from functools import wraps
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def served_rows(queryset, request, pagination_class=None):
+    """(pk, updated_at) of the rows the response shows, plus page links.
+
+    Paginated lists run the paginator on a narrow copy of the queryset, so
+    the validator covers exactly the page that will be served and costs
+    one LIMIT query, however large the filtered catalogue is.
+    """
+
+    if pagination_class is None:
+        rows = list(queryset.order_by("pk").values_list("pk", "updated_at"))
+        return rows, []
+    paginator = pagination_class()
+    page = paginator.paginate_queryset(
+        queryset.only("pk", "created_at", "updated_at"), request
+    )
+    rows = [(row.pk, row.updated_at) for row in page]
+    return rows, [paginator.has_next, paginator.has_previous]
+
+
+def conditional_get(
+    get_queryset, per_user=False, liked=None, many=False, pagination_class=None
+):
+    """ETag / Last-Modified handling for a catalogue view's GET method.
+
+    ``get_queryset(view, request, *args, **kwargs)`` returns the rows the
+    response is built from, or None when the response depends on more
+    than those rows and can't be validated. The pk and updated_at of the
+    rows served (the current page for lists with ``pagination_class``)
+    are read in one query before the view runs, so a matching
+    If-None-Match / If-Modified-Since is answered with 304 Not Modified
+    without any serializer work. Responses that show per-user fields pass
+    ``per_user`` and, for is_liked, the ``liked`` id loader from
+    ``wishlists.liked``; list views pass ``many``.
+
+    Last-Modified is only sent for single, shared rows. The newest
+    updated_at doesn't move when a row leaves a list or a wishlist
+    changes, which the ETag does cover, so those responses are validated
+    by ETag alone.
+    """
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            queryset = get_queryset(view, request, *args, **kwargs)
+            if queryset is None:
+                return method(view, request, *args, **kwargs)
+            rows, links = served_rows(queryset, request, pagination_class)
+            if not rows:
+                return method(view, request, *args, **kwargs)
+            fingerprint = [
+                request.get_full_path(),
+                [[pk, updated_at.isoformat()] for pk, updated_at in rows],
+                links,
+            ]
+            if per_user:
+                fingerprint.append(request.user.pk)
+            if liked is not None:
+                fingerprint.append(sorted(liked(request)))
+            etag = quote_etag(
+                hashlib.sha1(json.dumps(fingerprint).encode("utf-8")).hexdigest()
+            )
+            last_modified = None
+            if not (many or per_user or liked is not None):
+                newest = max(updated_at for _, updated_at in rows)
+                last_modified = timegm(newest.utctimetuple())
+            response = get_conditional_response(
+                request,
+                etag=etag,
+                last_modified=last_modified,
+            )
+            if response is None:
+                response = method(view, request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                response.headers["ETag"] = etag
+                if last_modified is not None:
+                    response.headers["Last-Modified"] = http_date(last_modified)
+            return response
+
+        return wrapper
+
+    return decorator
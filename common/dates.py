@@ -0,0 +1,29 @@
+import calendar
+from datetime import date, datetime, time, timedelta
+
+from django.utils import timezone
+
+
+def local_midnight(day):
+    """Midnight at the start of ``day`` in TIME_ZONE (Asia/Seoul)."""
+
+    return datetime.combine(day, time.min, tzinfo=timezone.get_default_timezone())
+
+
+def day_range(first_day, last_day):
+    """Half-open [start, end) datetimes covering first_day..last_day.
+
+    Filter with ``field__gte=start, field__lt=end`` instead of
+    ``field__date__gte/lte``: the __date lookup casts every row's column
+    to a local date, so no index on the column can be used, while the
+    range compares the stored values directly.
+    """
+
+    return local_midnight(first_day), local_midnight(last_day + timedelta(days=1))
+
+
+def month_range(year, month):
+    """Half-open [start, end) datetimes covering a calendar month."""
+
+    _, last_day = calendar.monthrange(year, month)
+    return day_range(date(year, month, 1), date(year, month, last_day))
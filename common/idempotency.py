@@ -0,0 +1,96 @@
+import hashlib
+import json
+from datetime import timedelta
+from functools import wraps
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework.exceptions import APIException, ParseError
+from rest_framework.response import Response
+
+from .models import IdempotencyKey
+
+HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+class IdempotencyKeyInProgress(APIException):
+    status_code = 409
+    default_detail = "A request with this Idempotency-Key is still in progress."
+    default_code = "idempotency_key_in_progress"
+
+
+class IdempotencyKeyReused(APIException):
+    status_code = 422
+    default_detail = "This Idempotency-Key was used for a different request."
+    default_code = "idempotency_key_reused"
+
+
+def fingerprint(request):
+    payload = json.dumps(
+        [request.method, request.get_full_path(), request.data],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def idempotent(method):
+    """Replay the first response to a POST carrying an Idempotency-Key.
+
+    The key is claimed with a unique (user, key) row before the view runs,
+    so a retry that arrives while the first request is still running gets
+    409 instead of running the view a second time. Responses below 500,
+    including handled API errors, are stored for IDEMPOTENCY_KEY_TTL
+    seconds and replayed as-is. A crash releases the key so the client
+    can retry. Requests without the header, or from anonymous users, run
+    unchanged.
+    """
+
+    @wraps(method)
+    def wrapper(view, request, *args, **kwargs):
+        key = request.headers.get(HEADER)
+        if not key or not request.user.is_authenticated:
+            return method(view, request, *args, **kwargs)
+        if len(key) > IdempotencyKey._meta.get_field("key").max_length:
+            raise ParseError(f"{HEADER} is too long.")
+        now = timezone.now()
+        request_fingerprint = fingerprint(request)
+        IdempotencyKey.objects.filter(user=request.user, expires_at__lte=now).delete()
+        try:
+            with transaction.atomic():
+                record = IdempotencyKey.objects.create(
+                    user=request.user,
+                    key=key,
+                    fingerprint=request_fingerprint,
+                    expires_at=now + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL),
+                )
+        except IntegrityError:
+            record = IdempotencyKey.objects.filter(user=request.user, key=key).first()
+            if record is None or record.status_code is None:
+                raise IdempotencyKeyInProgress
+            if record.fingerprint != request_fingerprint:
+                raise IdempotencyKeyReused
+            return Response(
+                record.body,
+                status=record.status_code,
+                headers={REPLAYED_HEADER: "true"},
+            )
+
+        try:
+            response = method(view, request, *args, **kwargs)
+        except APIException as exc:
+            response = view.handle_exception(exc)
+        except Exception:
+            record.delete()
+            raise
+        if response.status_code >= 500:
+            record.delete()
+        else:
+            record.status_code = response.status_code
+            record.body = response.data
+            record.save(update_fields=["status_code", "body", "updated_at"])
+        return response
+
+    return wrapper
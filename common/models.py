@@ -1,4 +1,9 @@
-from django.db import models
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.db.models import Avg, Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Round
+from django.utils import timezone
 
 
 class CommonModel(models.Model):
@@ -10,3 +15,88 @@ class CommonModel(models.Model):
     class Meta:
         abstract = True
 
+
+class RatedModel(CommonModel):
+    """A review target that stores the aggregates of its reviews.
+
+    ``reviews.Review`` points at the target with a foreign key named after
+    the model (``room``, ``experience``), so lists and details read the
+    rating from the row instead of aggregating reviews per object.
+    """
+
+    rating_sum = models.PositiveIntegerField(default=0, editable=False)
+    rating_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_avg = models.FloatField(default=0, editable=False)
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def rating_aggregates(cls):
+        """Correlated subqueries computing the stored rating columns per row."""
+
+        from reviews.models import Review
+
+        target = cls._meta.model_name
+        reviews = (
+            Review.objects.filter(**{target: OuterRef("pk")})
+            .order_by()
+            .values(target)
+        )
+        return {
+            "rating_sum": Coalesce(
+                Subquery(reviews.annotate(total=Sum("rating")).values("total")),
+                Value(0),
+            ),
+            "rating_count": Coalesce(
+                Subquery(reviews.annotate(count=Count("pk")).values("count")),
+                Value(0),
+            ),
+            "rating_avg": Coalesce(
+                Round(
+                    Subquery(reviews.annotate(average=Avg("rating")).values("average")),
+                    2,
+                ),
+                Value(0.0),
+            ),
+        }
+
+    def refresh_rating(self):
+        """Recompute the stored rating of this object from its reviews.
+
+        The row is locked first so concurrent review writes on the same
+        object are applied one after the other.
+        """
+
+        model = type(self)
+        with transaction.atomic():
+            rows = model.objects.filter(pk=self.pk)
+            list(rows.select_for_update().values_list("pk", flat=True))
+            rows.update(updated_at=timezone.now(), **model.rating_aggregates())
+
+
+class IdempotencyKey(CommonModel):
+    """First response to a POST sent with an Idempotency-Key header."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="idempotency_keys",
+    )
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64)
+    # NULL while the first request is still running.
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    body = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "key"],
+                name="idempotency_key_user_key_unique",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user} · {self.key}"
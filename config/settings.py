@@ -104,10 +104,38 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # SQLite has no row locks. Taking the write lock when a transaction
+        # starts keeps select_for_update() booking checks race free.
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+        },
+        # A file (not the shared in-memory database) so that the concurrent
+        # booking tests see SQLite's normal locking and busy timeout.
+        'TEST': {
+            'NAME': BASE_DIR / 'test_db.sqlite3',
+        },
     }
 }
 
 
+# Cache
+# CACHE_URL picks the backend, e.g. locmemcache://, filecache:///var/tmp/airbnb
+# or redis://127.0.0.1:6379/1 (any Redis-compatible service).
+
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+
+ROOM_DETAIL_CACHE_TIMEOUT = env.int("ROOM_DETAIL_CACHE_TIMEOUT", default=60 * 60)
+EXPERIENCE_SLOTS_CACHE_TIMEOUT = env.int("EXPERIENCE_SLOTS_CACHE_TIMEOUT", default=60 * 5)
+
+# How long the first response to an Idempotency-Key is kept for replays.
+IDEMPOTENCY_KEY_TTL = env.int("IDEMPOTENCY_KEY_TTL", default=60 * 60 * 24)
+
+# How long a checkout hold blocks the dates or slot for other guests.
+BOOKING_HOLD_TTL = env.int("BOOKING_HOLD_TTL", default=60 * 10)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -24,6 +24,7 @@ urlpatterns = [
     path("api/v1/rooms/", include(("rooms.urls", "rooms"))),
     path("api/v1/categories/", include("categories.urls")),
     path("api/v1/experiences/", include("experiences.urls")),
+    path("api/v1/bookings/", include("bookings.urls")),
     path("api/v1/medias/", include("medias.urls")),
     path("api/v1/wishlists/", include("wishlists.urls")),
     path("api/v1/users/", include("users.urls")),
@@ -1,14 +1,34 @@
 from django.contrib import admin
 
-from .models import Experience, Perk
+from .models import Experience, ExperienceSlot, Perk
 
 
 @admin.register(Experience)
 class ExperienceAdmin(admin.ModelAdmin):
-    list_display = ("name", "price", "start", "end", "created_at")
+    list_display = (
+        "name",
+        "price",
+        "start",
+        "end",
+        "capacity",
+        "rating",
+        "created_at",
+    )
     search_fields = ("name", "address")
     list_filter = ("country", "city", "host", "category", "created_at")
 
+    @admin.display(description="Rating", ordering="rating_avg")
+    def rating(self, experience):
+        return experience.rating_avg
+
+
+@admin.register(ExperienceSlot)
+class ExperienceSlotAdmin(admin.ModelAdmin):
+    list_display = ("experience", "starts_at", "seats", "capacity")
+    list_filter = ("starts_at",)
+    # Seats are only changed by bookings and holds.
+    readonly_fields = ("experience", "starts_at", "capacity", "seats")
+
 
 @admin.register(Perk)
 class PerkAdmin(admin.ModelAdmin):
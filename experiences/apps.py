@@ -5,3 +5,5 @@ class ExperiencesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "experiences"
 
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,50 @@
+from django.db.models import Count
+from rest_framework.exceptions import ParseError
+
+from rooms.filters import parse_int, parse_pk_list, parse_time
+from .models import Experience
+
+
+def filter_experiences(experiences, params):
+    """Apply the experience search query parameters to an Experience queryset.
+
+    Like filter_rooms, every filter ends up in the WHERE clause of the
+    listing query, and "has all perks" is a single grouped subquery on the
+    through table.
+    """
+
+    for name in ("city", "country"):
+        value = params.get(name)
+        if value:
+            experiences = experiences.filter(**{name: value})
+    price_min = parse_int(params, "price_min")
+    if price_min is not None:
+        experiences = experiences.filter(price__gte=price_min)
+    price_max = parse_int(params, "price_max")
+    if price_max is not None:
+        experiences = experiences.filter(price__lte=price_max)
+    starts_after = parse_time(params, "starts_after")
+    if starts_after is not None:
+        experiences = experiences.filter(start__gte=starts_after)
+    starts_before = parse_time(params, "starts_before")
+    if starts_before is not None:
+        experiences = experiences.filter(start__lte=starts_before)
+    if starts_after and starts_before and starts_before < starts_after:
+        raise ParseError("starts_before must not be before starts_after.")
+    duration_max = parse_int(params, "duration_max", minimum=1)
+    if duration_max is not None:
+        experiences = experiences.filter(duration__lte=duration_max)
+    category = parse_int(params, "category", minimum=1)
+    if category is not None:
+        experiences = experiences.filter(category_id=category)
+    perks = parse_pk_list(params, "perks")
+    if perks:
+        matching = (
+            Experience.perks.through.objects.filter(perk_id__in=perks)
+            .values("experience_id")
+            .annotate(matched=Count("perk_id"))
+            .filter(matched=len(perks))
+            .values("experience_id")
+        )
+        experiences = experiences.filter(pk__in=matching)
+    return experiences
@@ -0,0 +1,137 @@
+import random
+import time
+from datetime import time as clock
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.http import QueryDict
+from django.test.utils import CaptureQueriesContext
+
+from categories.models import Category
+from experiences.filters import filter_experiences
+from experiences.models import Experience, Perk
+from users.models import User
+
+CITIES = ["서울", "부산", "제주", "강릉", "전주", "경주", "여수", "속초"]
+COUNTRIES = ["한국", "일본"]
+DURATIONS = [30, 60, 90, 120, 180, 240]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the indexed experience search against loading every "
+        "experience and filtering in Python. Seeds a dataset inside a "
+        "transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--experiences", type=int, default=100_000)
+        parser.add_argument("--perks", type=int, default=20)
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument("--batch-size", type=int, default=5_000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.seed(options)
+            params = QueryDict(mutable=True)
+            params.update(
+                {
+                    "city": "제주",
+                    "price_min": "20000",
+                    "price_max": "80000",
+                    "starts_after": "09:00",
+                    "starts_before": "14:00",
+                    "duration_max": "120",
+                    "category": str(self.category.pk),
+                    "perks": ",".join(str(pk) for pk in self.perk_pks[:2]),
+                }
+            )
+            indexed = self.measure(
+                lambda: list(
+                    filter_experiences(Experience.objects.for_listing(), params)
+                ),
+                options["repeat"],
+            )
+            naive = self.measure(lambda: self.python_filter(params), options["repeat"])
+            if {e.pk for e in indexed[2]} != {e.pk for e in naive[2]}:
+                self.stderr.write("Result sets differ!")
+            self.report("filtered search", indexed)
+            self.report("full list + python filter", naive)
+            transaction.set_rollback(True)
+
+    def seed(self, options):
+        rng = random.Random(42)
+        host = User.objects.create_user(username="bench-experience-search-host")
+        self.category = Category.objects.create(
+            name="Bench", kind=Category.CategoryKindChoices.EXPERIENCES
+        )
+        perks = Perk.objects.bulk_create(
+            [Perk(name=f"Perk {i}") for i in range(options["perks"])]
+        )
+        self.perk_pks = [perk.pk for perk in perks]
+        started = time.perf_counter()
+        through = Experience.perks.through
+        created = 0
+        while created < options["experiences"]:
+            size = min(options["batch_size"], options["experiences"] - created)
+            experiences = Experience.objects.bulk_create(
+                [
+                    Experience(
+                        name=f"Experience {created + i}",
+                        country=rng.choice(COUNTRIES),
+                        city=rng.choice(CITIES),
+                        host=host,
+                        price=rng.randrange(10_000, 200_000, 1_000),
+                        address="",
+                        start=clock(rng.randint(6, 20), rng.choice((0, 30))),
+                        end=clock(23, 0),
+                        description="",
+                        duration=rng.choice(DURATIONS),
+                        category=self.category if rng.random() < 0.5 else None,
+                    )
+                    for i in range(size)
+                ]
+            )
+            through.objects.bulk_create(
+                [
+                    through(experience_id=experience.pk, perk_id=perk_pk)
+                    for experience in experiences
+                    for perk_pk in rng.sample(self.perk_pks, 4)
+                ]
+            )
+            created += size
+        self.stdout.write(
+            f"Seeded {created} experiences in {time.perf_counter() - started:.1f}s"
+        )
+
+    def python_filter(self, params):
+        perks = {int(pk) for pk in params["perks"].split(",")}
+        starts_after = clock.fromisoformat(params["starts_after"])
+        starts_before = clock.fromisoformat(params["starts_before"])
+        experiences = Experience.objects.prefetch_related("perks")
+        return [
+            experience
+            for experience in experiences
+            if experience.city == params["city"]
+            and int(params["price_min"]) <= experience.price <= int(params["price_max"])
+            and starts_after <= experience.start <= starts_before
+            and experience.duration <= int(params["duration_max"])
+            and experience.category_id == int(params["category"])
+            and perks <= {perk.pk for perk in experience.perks.all()}
+        ]
+
+    def measure(self, run, repeat):
+        timings = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                result = run()
+                timings.append(time.perf_counter() - started)
+        return min(timings), len(queries), result
+
+    def report(self, label, measurement):
+        elapsed, queries, result = measurement
+        self.stdout.write(
+            f"{label:>28}: {elapsed * 1000:9.1f} ms, {queries} queries, "
+            f"{len(result)} experiences"
+        )
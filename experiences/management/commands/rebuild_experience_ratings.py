@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from experiences.models import Experience
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the stored rating_sum, rating_count and rating_avg of "
+        "every experience."
+    )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            updated = Experience.objects.update(
+                updated_at=timezone.now(), **Experience.rating_aggregates()
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt ratings for {updated} experiences.")
+        )
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-17 23:44
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("categories", "0001_initial"),
+        ("experiences", "0004_experience_duration"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="experience",
+            index=models.Index(
+                fields=["created_at", "id"], name="experience_created_at_id_idx"
+            ),
+        ),
+    ]
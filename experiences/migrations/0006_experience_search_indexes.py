@@ -0,0 +1,50 @@
+# Generated by Django 5.2.7 on 2026-10-18 00:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("categories", "0001_initial"),
+        ("experiences", "0005_experience_experience_created_at_id_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="experience",
+            index=models.Index(
+                fields=["country", "city", "price"], name="experience_country_city_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experience",
+            index=models.Index(
+                fields=["city", "price"], name="experience_city_price_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experience",
+            index=models.Index(fields=["price"], name="experience_price_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="experience",
+            index=models.Index(
+                fields=["start", "price"], name="experience_start_price_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experience",
+            index=models.Index(
+                fields=["duration", "price"], name="experience_duration_price_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experience",
+            index=models.Index(
+                fields=["category", "price"], name="experience_category_price_idx"
+            ),
+        ),
+    ]
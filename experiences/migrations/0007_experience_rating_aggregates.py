@@ -0,0 +1,59 @@
+# Generated by Django 5.2.7 on 2026-10-18 00:42
+
+from django.db import migrations, models
+from django.db.models import Avg, Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Round
+
+
+def backfill_ratings(apps, schema_editor):
+    Experience = apps.get_model("experiences", "Experience")
+    Review = apps.get_model("reviews", "Review")
+    reviews = (
+        Review.objects.filter(experience=OuterRef("pk"))
+        .order_by()
+        .values("experience")
+    )
+    Experience.objects.update(
+        rating_sum=Coalesce(
+            Subquery(reviews.annotate(total=Sum("rating")).values("total")),
+            Value(0),
+        ),
+        rating_count=Coalesce(
+            Subquery(reviews.annotate(count=Count("pk")).values("count")),
+            Value(0),
+        ),
+        rating_avg=Coalesce(
+            Round(
+                Subquery(reviews.annotate(average=Avg("rating")).values("average")),
+                2,
+            ),
+            Value(0.0),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("experiences", "0006_experience_search_indexes"),
+        ("reviews", "0003_alter_review_user"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="experience",
+            name="rating_avg",
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="experience",
+            name="rating_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="experience",
+            name="rating_sum",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_ratings, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,99 @@
+# Generated by Django 5.2.7 on 2026-10-18 00:54
+
+from collections import Counter
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def open_booked_slots(apps, schema_editor):
+    # Upcoming slots that already have bookings or holds get a counter row.
+    # A slot booked beyond the default capacity opens full.
+    Booking = apps.get_model("bookings", "Booking")
+    BookingHold = apps.get_model("bookings", "BookingHold")
+    Experience = apps.get_model("experiences", "Experience")
+    ExperienceSlot = apps.get_model("experiences", "ExperienceSlot")
+    now = timezone.now()
+    taken = Counter()
+    for model in (Booking, BookingHold):
+        rows = model.objects.filter(
+            kind="experience",
+            experience__isnull=False,
+            experience_time__gt=now,
+        ).values_list("experience_id", "experience_time", "guests")
+        for experience_id, starts_at, guests in rows.iterator():
+            taken[experience_id, starts_at] += guests
+    capacities = dict(
+        Experience.objects.filter(
+            pk__in={experience_id for experience_id, _ in taken}
+        ).values_list("pk", "capacity")
+    )
+    slots = []
+    for (experience_id, starts_at), guests in taken.items():
+        capacity = max(capacities[experience_id], guests)
+        slots.append(
+            ExperienceSlot(
+                experience_id=experience_id,
+                starts_at=starts_at,
+                capacity=capacity,
+                seats=capacity - guests,
+            )
+        )
+    ExperienceSlot.objects.bulk_create(slots, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0008_bookinghold"),
+        ("experiences", "0007_experience_rating_aggregates"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="experience",
+            name="capacity",
+            field=models.PositiveIntegerField(default=10, help_text="Guests per slot"),
+        ),
+        migrations.CreateModel(
+            name="ExperienceSlot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("starts_at", models.DateTimeField()),
+                ("capacity", models.PositiveIntegerField()),
+                ("seats", models.PositiveIntegerField()),
+                (
+                    "experience",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="slots",
+                        to="experiences.experience",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("experience", "starts_at"),
+                        name="experience_slot_unique_start",
+                    ),
+                    models.CheckConstraint(
+                        condition=models.Q(("seats__lte", models.F("capacity"))),
+                        name="experience_slot_seats_lte_capacity",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(open_booked_slots, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,46 @@
 from django.db import models
+from django.db.models import OuterRef, Subquery
 
 from categories.models import Category
-from common.models import CommonModel
+from common.models import CommonModel, RatedModel
 
 
-class Experience(CommonModel):
+class ExperienceQuerySet(models.QuerySet):
+    def for_listing(self):
+        """Experiences with everything ExperienceListSerializer reads, in one query.
+
+        The host comes from a join, the rating from the stored columns and
+        the cover photo (the oldest one) from a correlated subquery, so a
+        page of any size is a single SELECT.
+        """
+
+        from medias.models import Photo
+
+        covers = Photo.objects.filter(experience=OuterRef("pk")).order_by(
+            "created_at", "pk"
+        )
+        return (
+            self.select_related("host")
+            .only(
+                "pk",
+                "name",
+                "country",
+                "city",
+                "price",
+                "duration",
+                "rating_avg",
+                "rating_count",
+                "created_at",
+                "host",
+                "host__name",
+                "host__avatar",
+                "host__username",
+            )
+            .annotate(cover=Subquery(covers.values("file")[:1]))
+        )
+
+
+class Experience(RatedModel):
     """Experience model definition."""
 
     country = models.CharField(max_length=50, default="한국")
@@ -26,6 +62,10 @@ class Experience(CommonModel):
         related_name="experiences",
     )
     duration = models.PositiveIntegerField(default=60, help_text="Duration in minutes")
+    capacity = models.PositiveIntegerField(
+        default=10,
+        help_text="Guests per slot",
+    )
     category = models.ForeignKey(
         Category,
         null=True,
@@ -34,10 +74,68 @@ class Experience(CommonModel):
         related_name="experiences",
     )
 
+    objects = ExperienceQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["created_at", "id"],
+                name="experience_created_at_id_idx",
+            ),
+            models.Index(
+                fields=["country", "city", "price"],
+                name="experience_country_city_idx",
+            ),
+            models.Index(fields=["city", "price"], name="experience_city_price_idx"),
+            models.Index(fields=["price"], name="experience_price_idx"),
+            models.Index(fields=["start", "price"], name="experience_start_price_idx"),
+            models.Index(
+                fields=["duration", "price"],
+                name="experience_duration_price_idx",
+            ),
+            models.Index(
+                fields=["category", "price"],
+                name="experience_category_price_idx",
+            ),
+        ]
+
     def __str__(self) -> str:
         return self.name
 
 
+class ExperienceSlot(CommonModel):
+    """Seats left in the slot of an experience that starts at ``starts_at``.
+
+    Bookings and holds take seats with a conditional UPDATE, so ``seats``
+    never drops below zero. ``capacity`` is what the slot opened with;
+    ``capacity - seats`` is the number of guests booked or holding.
+    """
+
+    experience = models.ForeignKey(
+        Experience,
+        on_delete=models.CASCADE,
+        related_name="slots",
+    )
+    starts_at = models.DateTimeField()
+    capacity = models.PositiveIntegerField()
+    seats = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["experience", "starts_at"],
+                name="experience_slot_unique_start",
+            ),
+            models.CheckConstraint(
+                condition=models.Q(seats__lte=models.F("capacity")),
+                name="experience_slot_seats_lte_capacity",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.experience} @ {self.starts_at}: {self.seats}/{self.capacity}"
+
+
 class Perk(CommonModel):
     """What is included on an experience."""
 
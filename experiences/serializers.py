@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from users.serializers import TinyUserSerializer
+from wishlists.liked import liked_experience_ids
 from .models import Experience, Perk
 
 
@@ -13,6 +14,10 @@ class PerkSerializer(serializers.ModelSerializer):
 class ExperienceListSerializer(serializers.ModelSerializer):
 
     host = TinyUserSerializer(read_only=True)
+    cover = serializers.URLField(read_only=True, allow_null=True)
+    rating = serializers.FloatField(source="rating_avg", read_only=True)
+    review_count = serializers.IntegerField(source="rating_count", read_only=True)
+    is_liked = serializers.SerializerMethodField()
 
     class Meta:
         model = Experience
@@ -24,12 +29,21 @@ class ExperienceListSerializer(serializers.ModelSerializer):
             "price",
             "host",
             "duration",
+            "cover",
+            "rating",
+            "review_count",
+            "is_liked",
         )
 
+    def get_is_liked(self, experience):
+        return experience.pk in liked_experience_ids(self.context.get("request"))
+
 
 class ExperienceDetailSerializer(serializers.ModelSerializer):
 
     host = TinyUserSerializer(read_only=True)
+    rating = serializers.FloatField(source="rating_avg", read_only=True)
+    review_count = serializers.IntegerField(source="rating_count", read_only=True)
     perks = PerkSerializer(
         many=True,
         read_only=True,
@@ -59,6 +73,7 @@ class ExperienceCreateUpdateSerializer(serializers.ModelSerializer):
             "start",
             "end",
             "duration",
+            "capacity",
             "description",
             "perks",
             "category",
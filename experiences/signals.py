@@ -0,0 +1,99 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.dispatch import receiver
+from django.utils import timezone
+
+from bookings.models import Booking, BookingHold
+from bookings.services import release_seats
+from medias.models import Photo
+from users.models import User
+from .models import Experience, ExperienceSlot, Perk
+from .slots import invalidate_experience_slots
+
+
+def touch_experiences(*experience_pks):
+    """Bump ``updated_at`` of experiences whose payload shows a changed row."""
+
+    experience_pks = [pk for pk in experience_pks if pk is not None]
+    if experience_pks:
+        Experience.objects.filter(pk__in=experience_pks).update(
+            updated_at=timezone.now(),
+        )
+
+
+@receiver(m2m_changed, sender=Experience.perks.through)
+def touch_experiences_of_perks(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            touch_experiences(instance.pk)
+    elif action == "pre_clear":
+        touch_experiences(*instance.experiences.values_list("pk", flat=True))
+    elif action in ("post_add", "post_remove"):
+        touch_experiences(*pk_set)
+
+
+@receiver(post_save, sender=Perk)
+@receiver(pre_delete, sender=Perk)
+def touch_experiences_of_perk(sender, instance, **kwargs):
+    touch_experiences(*instance.experiences.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=Photo)
+@receiver(post_delete, sender=Photo)
+def touch_experience_of_photo(sender, instance, **kwargs):
+    # The list shows the oldest photo as the cover. Review writes already
+    # bump updated_at through Experience.refresh_rating().
+    touch_experiences(instance.experience_id)
+
+
+@receiver(post_save, sender=User)
+def touch_experiences_of_host(sender, instance, created, update_fields, **kwargs):
+    if created or update_fields == frozenset({"last_login"}):
+        return
+    touch_experiences(*instance.experiences.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=Experience)
+def invalidate_slots_of_experience(sender, instance, **kwargs):
+    invalidate_experience_slots(instance.pk)
+
+
+@receiver(post_save, sender=Experience)
+def resize_upcoming_slots(sender, instance, created, **kwargs):
+    # Upcoming slots follow a capacity change. A slot already holding more
+    # guests than the new capacity is left full instead of oversold.
+    if created:
+        return
+    taken = F("capacity") - F("seats")
+    capacity = Greatest(Value(instance.capacity), taken)
+    ExperienceSlot.objects.filter(
+        experience=instance,
+        starts_at__gt=timezone.now(),
+    ).exclude(capacity=instance.capacity).update(
+        capacity=capacity,
+        seats=capacity - taken,
+    )
+
+
+@receiver(post_save, sender=Booking)
+@receiver(post_delete, sender=Booking)
+@receiver(post_save, sender=BookingHold)
+@receiver(post_delete, sender=BookingHold)
+def invalidate_slots_of_booking(sender, instance, **kwargs):
+    if instance.kind == Booking.BookingKindChoices.EXPERIENCE:
+        invalidate_experience_slots(instance.experience_id)
+
+
+@receiver(post_delete, sender=Booking)
+@receiver(post_delete, sender=BookingHold)
+def release_seats_of_booking(sender, instance, **kwargs):
+    # Covers cancellations, released, confirmed and swept holds, and
+    # cascades from deleted users alike.
+    if (
+        instance.kind == Booking.BookingKindChoices.EXPERIENCE
+        and instance.experience_id is not None
+    ):
+        release_seats(
+            instance.experience_id, instance.experience_time, instance.guests
+        )
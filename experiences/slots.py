@@ -0,0 +1,132 @@
+import math
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import DateTimeField, Value
+from django.utils import timezone
+
+from bookings.models import Booking, BookingHold
+from common.cache import get_version, invalidate
+from .models import ExperienceSlot
+
+EXPERIENCE_SLOTS = "experience-slots"
+
+
+def generate_slots(experience, first_day, last_day):
+    """Every (start, end) slot of the schedule from first_day to last_day.
+
+    Slots run back to back from ``start`` and must end by ``end`` on the
+    same day, the same rule CreateExperienceBookingSerializer enforces.
+    Times are in the current time zone.
+    """
+
+    duration = timedelta(minutes=experience.duration)
+    slots = []
+    day = first_day
+    while day <= last_day:
+        slot_start = timezone.make_aware(datetime.combine(day, experience.start))
+        closing = timezone.make_aware(datetime.combine(day, experience.end))
+        while slot_start + duration <= closing:
+            slots.append((slot_start, slot_start + duration))
+            slot_start += duration
+        day += timedelta(days=1)
+    return slots
+
+
+def count_seats(slots, taken, seats, capacity):
+    """Pair every slot with the seats still free in it.
+
+    ``seats`` maps the start of every opened slot to the seats left in its
+    ExperienceSlot row; slots that were never opened have ``capacity``.
+    ``slots`` and ``taken`` are (start, end) pairs sorted by start, where
+    ``taken`` are the bookings and live holds in the range. One that
+    starts at another time and overlaps a slot takes all of its seats, as
+    the slot can't be opened then. One sweep walks both lists: entries
+    that end before the current slot starts can't overlap any later slot
+    and are skipped for good, so the cost is O(slots + taken).
+    """
+
+    counted = []
+    index = 0
+    for slot_start, slot_end in slots:
+        while index < len(taken) and taken[index][1] <= slot_start:
+            index += 1
+        free = seats.get(slot_start, capacity)
+        ahead = index
+        while ahead < len(taken) and taken[ahead][0] < slot_end:
+            start, end = taken[ahead]
+            if start != slot_start and end > slot_start:
+                free = 0
+                break
+            ahead += 1
+        counted.append((slot_start, slot_end, free))
+    return counted
+
+
+def get_experience_slots(experience, first_day, last_day):
+    """(start, end, seats) for each slot, cached per experience version.
+
+    Seats are read from the ExperienceSlot rows in the range, the counters
+    bookings and holds take them from, so the listing agrees with what a
+    booking would find. Expired holds fire no signal and keep their seats
+    in the counter until take_seats sweeps them, so their guests are added
+    back here, and the entry is cached no longer than the nearest live
+    hold in the range has left.
+    """
+
+    version = get_version(EXPERIENCE_SLOTS, experience.pk)
+    key = f"{EXPERIENCE_SLOTS}:{experience.pk}:{version}:seats:{first_day}:{last_day}"
+    cached = cache.get(key)
+    if cached is None:
+        timeout = settings.EXPERIENCE_SLOTS_CACHE_TIMEOUT
+        slots = generate_slots(experience, first_day, last_day)
+        seats = {}
+        taken = []
+        if slots:
+            first, last = slots[0][0], slots[-1][1]
+            seats = dict(
+                ExperienceSlot.objects.filter(
+                    experience=experience,
+                    starts_at__gte=first,
+                    starts_at__lt=last,
+                ).values_list("starts_at", "seats")
+            )
+            span = {
+                "experience": experience,
+                "kind": Booking.BookingKindChoices.EXPERIENCE,
+                "experience_time__lt": last,
+                "experience_end__gt": first,
+            }
+            rows = (
+                Booking.objects.filter(**span)
+                .annotate(expires_at=Value(None, output_field=DateTimeField()))
+                .values_list(
+                    "experience_time", "experience_end", "guests", "expires_at"
+                )
+                .union(
+                    BookingHold.objects.filter(**span).values_list(
+                        "experience_time", "experience_end", "guests", "expires_at"
+                    ),
+                    all=True,
+                )
+                .order_by("experience_time")
+            )
+            now = timezone.now()
+            for start, end, guests, expires_at in rows:
+                if expires_at is None or expires_at > now:
+                    taken.append((start, end))
+                    if expires_at is not None:
+                        left = math.ceil((expires_at - now).total_seconds())
+                        timeout = min(timeout, left)
+                elif start in seats:
+                    seats[start] = min(seats[start] + guests, experience.capacity)
+        cached = count_seats(slots, taken, seats, experience.capacity)
+        cache.set(key, cached, timeout)
+    return cached
+
+
+def invalidate_experience_slots(*experience_pks):
+    for pk in experience_pks:
+        if pk is not None:
+            invalidate(EXPERIENCE_SLOTS, pk)
@@ -0,0 +1,551 @@
+import time as time_module
+from datetime import datetime, time, timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from bookings.models import Booking, BookingHold
+from categories.models import Category
+from experiences.models import Experience, ExperienceSlot, Perk
+from medias.models import Photo
+from reviews.models import Review
+from users.models import User
+from wishlists.models import Wishlist
+
+
+class TestExperiences(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.host = User.objects.create_user(
+            username="host",
+            email="host@example.com",
+            password="testpass123",
+            is_host=True,
+        )
+        self.client.force_authenticate(user=self.user)
+        self.base_url = "/api/v1/experiences/"
+
+    def create_experience(self, name, **fields):
+        defaults = {
+            "host": self.host,
+            "price": 30000,
+            "address": "Address",
+            "start": time(9, 0),
+            "end": time(18, 0),
+            "description": "Description",
+        }
+        defaults.update(fields)
+        return Experience.objects.create(name=name, **defaults)
+
+    def test_list_is_liked(self):
+        """GET /api/v1/experiences/ - is_liked 위시리스트 1회 조회 테스트"""
+        liked = self.create_experience("Liked")
+        self.create_experience("Other")
+        Wishlist.objects.create(name="Trip", user=self.user).experiences.add(liked)
+
+        # API 호출
+        response = self.client.get(self.base_url)
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        is_liked = {
+            experience["name"]: experience["is_liked"]
+            for experience in response.data["results"]
+        }
+        self.assertEqual(is_liked, {"Liked": True, "Other": False})
+
+    def test_list_is_liked_anonymous(self):
+        """GET /api/v1/experiences/ - 비인증 사용자 is_liked 테스트"""
+        self.create_experience("Experience")
+        self.client.force_authenticate(user=None)
+
+        # API 호출
+        response = self.client.get(self.base_url)
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data["results"][0]["is_liked"])
+
+    def test_list_cover_and_rating(self):
+        """GET /api/v1/experiences/ - 대표 사진(가장 오래된 사진)과 평균 평점 테스트"""
+        reviewed = self.create_experience("Reviewed")
+        self.create_experience("Plain")
+        for name in ("first", "second"):
+            Photo.objects.create(
+                file=f"https://example.com/{name}.jpg",
+                description=name,
+                experience=reviewed,
+            )
+        for index, rating in enumerate((4, 5)):
+            reviewer = User.objects.create_user(
+                username=f"reviewer{index}", password="testpass123"
+            )
+            Review.objects.create(
+                user=reviewer, experience=reviewed, payload="Good", rating=rating
+            )
+
+        # API 호출
+        response = self.client.get(self.base_url)
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = {row["name"]: row for row in response.data["results"]}
+        self.assertEqual(results["Reviewed"]["cover"], "https://example.com/first.jpg")
+        self.assertEqual(results["Reviewed"]["rating"], 4.5)
+        self.assertEqual(results["Reviewed"]["host"]["username"], "host")
+        self.assertIsNone(results["Plain"]["cover"])
+        self.assertEqual(results["Plain"]["rating"], 0)
+
+    def test_list_query_count_is_constant(self):
+        """GET /api/v1/experiences/ - 목록 크기와 무관하게 쿼리 수 고정 테스트"""
+        hosts = [
+            User.objects.create_user(username=f"host{i}", password="testpass123")
+            for i in range(3)
+        ]
+        created = 0
+        for size in (1, 5, 25):
+            while created < size:
+                experience = self.create_experience(
+                    f"Experience {created}", host=hosts[created % len(hosts)]
+                )
+                Photo.objects.create(
+                    file="https://example.com/photo.jpg",
+                    description="Photo",
+                    experience=experience,
+                )
+                Review.objects.create(
+                    user=self.user, experience=experience, payload="Good", rating=5
+                )
+                created += 1
+
+            # 검증 (ETag 행 조회 1회 + 위시리스트 1회 + 목록 1회)
+            with self.assertNumQueries(3):
+                response = self.client.get(self.base_url)
+            self.assertEqual(len(response.data["results"]), min(size, 20))
+
+        # 검증 (다음 페이지도 같은 쿼리 수, 순서가 안정적이라 중복 없음)
+        with self.assertNumQueries(3):
+            second = self.client.get(response.data["next"])
+        names = [row["name"] for row in response.data["results"] + second.data["results"]]
+        self.assertEqual(len(names), 25)
+        self.assertEqual(len(set(names)), 25)
+
+    def test_detail_conditional_get(self):
+        """GET /api/v1/experiences/<pk> - ETag 304 및 특전 변경 후 200 테스트"""
+        experience = self.create_experience("Experience")
+        url = f"{self.base_url}{experience.pk}"
+        etag = self.client.get(url)["ETag"]
+
+        # 검증 (변경 없음)
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # 검증 (특전 추가 후)
+        experience.perks.add(Perk.objects.create(name="Lunch"))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["perks"]), 1)
+
+    def test_booking_conflicts_and_reschedule(self):
+        """POST/PUT /api/v1/experiences/<pk>/bookings - 슬롯 중복 및 본인 예약 시간 변경 테스트"""
+        experience = self.create_experience("Experience", duration=60)
+        url = f"{self.base_url}{experience.pk}/bookings"
+        booked = self.client.post(
+            url,
+            {"experience_time": "2030-01-01T10:00:00", "guests": 2},
+            format="json",
+        )
+        other = User.objects.create_user(username="other", password="testpass123")
+        self.client.force_authenticate(user=other)
+        overlapping = self.client.post(
+            url,
+            {"experience_time": "2030-01-01T10:30:00", "guests": 1},
+            format="json",
+        )
+
+        # 검증 (겹치는 슬롯은 거절)
+        self.assertEqual(booked.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(overlapping.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(overlapping.data["detail"], "This slot is already booked.")
+
+        # API 호출 (본인 예약을 30분 미루기)
+        self.client.force_authenticate(user=self.user)
+        response = self.client.put(
+            f"{url}/{booked.data['pk']}",
+            {"experience_time": "2030-01-01T10:30:00"},
+            format="json",
+        )
+
+        # 검증 (자기 자신과는 충돌하지 않음)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["experience_end"].startswith("2030-01-01T11:30"))
+
+    def test_month_bookings_use_seoul_days(self):
+        """GET /api/v1/experiences/<pk>/bookings - 월 경계를 Asia/Seoul 기준으로 나누는지 테스트"""
+        experience = self.create_experience("Experience", start=time(0, 0), end=time(23, 59))
+        seoul = timezone.get_default_timezone()
+        # UTC로는 모두 1월이지만 Seoul 기준으로는 1월 31일 23:30과 2월 1일 00:30
+        for starts in (
+            datetime(2030, 1, 31, 23, 30, tzinfo=seoul),
+            datetime(2030, 2, 1, 0, 30, tzinfo=seoul),
+        ):
+            Booking.objects.create(
+                kind=Booking.BookingKindChoices.EXPERIENCE,
+                user=self.user,
+                experience=experience,
+                experience_time=starts,
+                experience_end=starts + timedelta(minutes=30),
+                guests=1,
+            )
+        url = f"{self.base_url}{experience.pk}/bookings"
+
+        # API 호출
+        january = self.client.get(url, {"year": 2030, "month": 1})
+        february = self.client.get(url, {"year": 2030, "month": 2})
+
+        # 검증
+        self.assertEqual(
+            [b["experience_time"] for b in january.data], ["2030-01-31T23:30:00+09:00"]
+        )
+        self.assertEqual(
+            [b["experience_time"] for b in february.data], ["2030-02-01T00:30:00+09:00"]
+        )
+
+    def test_month_bookings_out_of_range_year(self):
+        """GET /api/v1/experiences/<pk>/bookings - 범위를 벗어난 연도 400 테스트"""
+        experience = self.create_experience("Experience")
+        url = f"{self.base_url}{experience.pk}/bookings"
+
+        for params in ({"year": 9999, "month": 12}, {"year": 0, "month": 1}):
+            # API 호출
+            response = self.client.get(url, params)
+
+            # 검증
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestExperienceSearch(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.host = User.objects.create_user(
+            username="host", password="testpass123", is_host=True
+        )
+        self.base_url = "/api/v1/experiences/"
+        self.category = Category.objects.create(
+            name="Food", kind=Category.CategoryKindChoices.EXPERIENCES
+        )
+        self.lunch = Perk.objects.create(name="Lunch")
+        self.pickup = Perk.objects.create(name="Pickup")
+        self.morning = self.create_experience(
+            "Morning Walk",
+            city="서울",
+            price=20000,
+            start=time(8, 0),
+            duration=60,
+        )
+        self.evening = self.create_experience(
+            "Evening Cooking",
+            city="부산",
+            price=80000,
+            start=time(18, 0),
+            end=time(22, 0),
+            duration=180,
+            category=self.category,
+        )
+        self.morning.perks.add(self.lunch)
+        self.evening.perks.add(self.lunch, self.pickup)
+
+    def create_experience(self, name, **fields):
+        defaults = {
+            "host": self.host,
+            "address": "Address",
+            "end": time(18, 0),
+            "description": "Description",
+        }
+        defaults.update(fields)
+        return Experience.objects.create(name=name, **defaults)
+
+    def search(self, params):
+        response = self.client.get(self.base_url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sorted(experience["name"] for experience in response.data["results"])
+
+    def test_filter_by_fields(self):
+        """GET /api/v1/experiences/ - 필드별 필터 테스트"""
+        both = ["Evening Cooking", "Morning Walk"]
+        self.assertEqual(self.search({"city": "서울"}), ["Morning Walk"])
+        self.assertEqual(self.search({"country": "한국"}), both)
+        self.assertEqual(self.search({"price_min": 50000}), ["Evening Cooking"])
+        self.assertEqual(self.search({"price_max": 50000}), ["Morning Walk"])
+        self.assertEqual(self.search({"starts_after": "12:00"}), ["Evening Cooking"])
+        self.assertEqual(self.search({"starts_before": "08:00"}), ["Morning Walk"])
+        self.assertEqual(
+            self.search({"starts_after": "08:00", "starts_before": "18:00"}), both
+        )
+        self.assertEqual(self.search({"duration_max": 120}), ["Morning Walk"])
+        self.assertEqual(
+            self.search({"category": self.category.pk}), ["Evening Cooking"]
+        )
+
+    def test_filter_by_all_perks(self):
+        """GET /api/v1/experiences/ - 특전 모두 포함 필터 테스트"""
+        both = f"{self.lunch.pk},{self.pickup.pk}"
+
+        # 검증
+        self.assertEqual(
+            self.search({"perks": str(self.lunch.pk)}),
+            ["Evening Cooking", "Morning Walk"],
+        )
+        self.assertEqual(self.search({"perks": both}), ["Evening Cooking"])
+
+    def test_search_query_count_is_bounded(self):
+        """GET /api/v1/experiences/ - 필터 조합 쿼리 수 테스트"""
+        params = {
+            "city": "부산",
+            "price_max": 100000,
+            "starts_after": "17:00",
+            "duration_max": 240,
+            "perks": f"{self.lunch.pk},{self.pickup.pk}",
+        }
+
+        # 검증 (ETag 행 조회 1회 + 목록 조회 1회)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.base_url, params)
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_filtered_etag_differs(self):
+        """GET /api/v1/experiences/ - 필터마다 ETag가 달라지는지 테스트"""
+        everything = self.client.get(self.base_url)["ETag"]
+        filtered = self.client.get(self.base_url, {"city": "서울"})["ETag"]
+
+        # 검증
+        self.assertNotEqual(everything, filtered)
+
+    def test_invalid_filter_values(self):
+        """GET /api/v1/experiences/ - 잘못된 필터 값 400 테스트"""
+        for params in (
+            {"price_min": "cheap"},
+            {"starts_after": "noon"},
+            {"starts_after": "18:00", "starts_before": "08:00"},
+            {"duration_max": 0},
+            {"perks": "1,two"},
+        ):
+            response = self.client.get(self.base_url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestExperienceSlots(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.host = User.objects.create_user(
+            username="host",
+            email="host@example.com",
+            password="testpass123",
+            is_host=True,
+        )
+        self.client.force_authenticate(user=self.user)
+        self.experience = Experience.objects.create(
+            name="Experience",
+            host=self.host,
+            price=30000,
+            address="Address",
+            start=time(9, 0),
+            end=time(12, 0),
+            duration=60,
+            capacity=1,
+            description="Description",
+        )
+        self.url = f"/api/v1/experiences/{self.experience.pk}/slots"
+        self.day = {"from": "2030-01-01", "to": "2030-01-01"}
+
+    def available(self, params=None):
+        response = self.client.get(self.url, params or self.day)
+        return [
+            (slot["start"].strftime("%H:%M"), slot["available"])
+            for slot in response.data
+        ]
+
+    def test_slots_from_schedule(self):
+        """GET /api/v1/experiences/<pk>/slots - 일정 기반 슬롯 생성 및 예약 제외 테스트"""
+        start = timezone.make_aware(datetime(2030, 1, 1, 10, 30))
+        Booking.objects.create(
+            kind=Booking.BookingKindChoices.EXPERIENCE,
+            user=self.user,
+            experience=self.experience,
+            experience_time=start,
+            experience_end=start + timedelta(hours=1),
+            guests=1,
+        )
+
+        # 검증 (정시에 맞지 않는 예약도 겹치는 슬롯을 모두 막음)
+        self.assertEqual(
+            self.available(),
+            [("09:00", True), ("10:00", False), ("11:00", False)],
+        )
+
+    def test_slot_seats(self):
+        """GET /api/v1/experiences/<pk>/slots - 슬롯별 남은 좌석 수 테스트"""
+        self.experience.capacity = 4
+        self.experience.save()
+        bookings_url = f"/api/v1/experiences/{self.experience.pk}/bookings"
+        for guests in (1, 2):
+            self.client.post(
+                bookings_url,
+                {"experience_time": "2030-01-01T09:00:00", "guests": guests},
+                format="json",
+            )
+        start = timezone.make_aware(datetime(2030, 1, 1, 10, 30))
+        BookingHold.objects.create(
+            kind=Booking.BookingKindChoices.EXPERIENCE,
+            user=self.user,
+            experience=self.experience,
+            experience_time=start,
+            experience_end=start + timedelta(hours=1),
+            guests=1,
+            expires_at=timezone.now() + timedelta(minutes=5),
+        )
+
+        # API 호출
+        response = self.client.get(self.url, self.day)
+
+        # 검증 (9시는 3명 예약, 10시/11시는 10:30 홀드와 겹침)
+        self.assertEqual([slot["seats"] for slot in response.data], [1, 0, 0])
+        self.assertEqual(
+            [slot["available"] for slot in response.data], [True, False, False]
+        )
+
+    def test_holds_take_listed_seats(self):
+        """GET /api/v1/experiences/<pk>/slots - 홀드가 가져간 좌석 반영 및 캐시 무효화 테스트"""
+        self.experience.capacity = 2
+        self.experience.save()
+        self.assertEqual(self.available()[0], ("09:00", True))
+
+        # 홀드 생성
+        hold = self.client.post(
+            f"/api/v1/experiences/{self.experience.pk}/holds",
+            {"experience_time": "2030-01-01T09:00:00", "guests": 2},
+            format="json",
+        )
+        self.assertEqual(hold.status_code, status.HTTP_201_CREATED)
+
+        # 검증 (좌석 카운터 기준으로 가득 참)
+        response = self.client.get(self.url, self.day)
+        self.assertEqual(response.data[0]["seats"], 0)
+        self.assertFalse(response.data[0]["available"])
+
+        # 홀드 해제
+        self.client.delete(f"/api/v1/bookings/holds/{hold.data['pk']}")
+        response = self.client.get(self.url, self.day)
+        self.assertEqual(response.data[0]["seats"], 2)
+
+    def test_expired_hold_seats_listed_as_free(self):
+        """GET /api/v1/experiences/<pk>/slots - 만료된 홀드의 좌석이 정리 전에도 목록에 반영되는지 테스트"""
+        self.experience.capacity = 2
+        self.experience.save()
+        hold = self.client.post(
+            f"/api/v1/experiences/{self.experience.pk}/holds",
+            {"experience_time": "2030-01-01T09:00:00", "guests": 2},
+            format="json",
+        )
+        # 시그널 없이 1초 뒤 만료되도록 변경
+        BookingHold.objects.filter(pk=hold.data["pk"]).update(
+            expires_at=timezone.now() + timedelta(seconds=1)
+        )
+        response = self.client.get(self.url, self.day)
+        self.assertEqual(response.data[0]["seats"], 0)
+
+        # 홀드 만료 (캐시 수명도 만료 시각까지로 제한됨)
+        time_module.sleep(1.1)
+
+        # API 호출
+        response = self.client.get(self.url, self.day)
+
+        # 검증 (좌석 카운터는 아직 정리 전)
+        self.assertEqual(ExperienceSlot.objects.get().seats, 0)
+        self.assertEqual(response.data[0]["seats"], 2)
+        self.assertTrue(response.data[0]["available"])
+
+    def test_multiple_days(self):
+        """GET /api/v1/experiences/<pk>/slots - 여러 날짜 슬롯 테스트"""
+        response = self.client.get(self.url, {"from": "2030-01-01", "to": "2030-01-03"})
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 9)
+        self.assertEqual(response.data[-1]["end"].day, 3)
+
+    def test_cached_until_booking_changes(self):
+        """GET /api/v1/experiences/<pk>/slots - 캐시 및 예약 생성/이동/삭제 시 무효화 테스트"""
+        self.available()
+
+        # 검증 (캐시 적중 시 Experience 조회 1회만 실행)
+        with self.assertNumQueries(1):
+            self.available()
+
+        # 예약 생성
+        booking = self.client.post(
+            f"/api/v1/experiences/{self.experience.pk}/bookings",
+            {"experience_time": "2030-01-01T09:00:00", "guests": 1},
+            format="json",
+        )
+        self.assertEqual(booking.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.available()[0], ("09:00", False))
+
+        # 예약 이동
+        booking_url = (
+            f"/api/v1/experiences/{self.experience.pk}/bookings/{booking.data['pk']}"
+        )
+        self.client.put(
+            booking_url,
+            {"experience_time": "2030-01-01T11:00:00"},
+            format="json",
+        )
+        self.assertEqual(
+            self.available(),
+            [("09:00", True), ("10:00", True), ("11:00", False)],
+        )
+
+        # 예약 삭제
+        self.client.delete(booking_url)
+        self.assertEqual(self.available()[2], ("11:00", True))
+
+    def test_schedule_change_invalidates(self):
+        """GET /api/v1/experiences/<pk>/slots - 일정 변경 시 무효화 테스트"""
+        self.available()
+        self.experience.end = time(11, 0)
+        self.experience.save()
+
+        # 검증
+        self.assertEqual(len(self.available()), 2)
+
+    def test_past_slots_unavailable(self):
+        """GET /api/v1/experiences/<pk>/slots - 지난 슬롯 예약 불가 테스트"""
+        self.assertEqual(
+            self.available({"from": "2020-01-01", "to": "2020-01-01"}),
+            [("09:00", False), ("10:00", False), ("11:00", False)],
+        )
+
+    def test_invalid_range(self):
+        """GET /api/v1/experiences/<pk>/slots - 잘못된 기간 테스트"""
+        for params in (
+            {"from": "2030-01-05", "to": "2030-01-01"},
+            {"from": "2030-01-01", "to": "2030-03-01"},
+            {"from": "tomorrow"},
+        ):
+            response = self.client.get(self.url, params)
+
+            # 검증
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
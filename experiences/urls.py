@@ -8,6 +8,8 @@ urlpatterns = [
     path("<int:pk>/perks", views.ExperiencePerks.as_view()),
     path("<int:pk>/reviews", views.ExperienceReviews.as_view()),
     path("<int:pk>/bookings", views.ExperienceBookings.as_view()),
+    path("<int:pk>/holds", views.ExperienceHolds.as_view()),
+    path("<int:pk>/slots", views.ExperienceSlots.as_view()),
     path(
         "<int:pk>/bookings/<int:booking_pk>",
         views.ExperienceBookingDetail.as_view(),
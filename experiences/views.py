@@ -1,11 +1,10 @@
 from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
-import calendar
 from rest_framework.views import APIView
 from rest_framework.status import HTTP_204_NO_CONTENT
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.exceptions import (
     NotFound,
     ParseError,
@@ -14,14 +13,25 @@ from rest_framework.exceptions import (
 )
 
 from bookings.models import Booking
+from common.conditional import conditional_get
+from common.dates import month_range
+from common.idempotency import idempotent
+from common.paginations import KeysetPagination
 from bookings.serializers import (
+    BookingHoldSerializer,
     PublicBookingSerializer,
     CreateExperienceBookingSerializer,
 )
+from bookings.services import hold_experience, save_experience_booking
+from .filters import filter_experiences
 from .models import Experience, Perk
 from . import serializers
 from reviews.models import Review
 from reviews.serializers import ReviewSerializer
+from reviews.services import get_review_target, save_review
+from rooms.filters import parse_date
+from wishlists.liked import liked_experience_ids
+from .slots import get_experience_slots
 
 
 class Perks(APIView):
@@ -81,11 +91,28 @@ class Experiences(APIView):
 
     permission_classes = [IsAuthenticatedOrReadOnly]
 
+    @conditional_get(
+        lambda view, request: filter_experiences(
+            Experience.objects.all(), request.query_params
+        ),
+        liked=liked_experience_ids,
+        many=True,
+        pagination_class=KeysetPagination,
+    )
     def get(self, request):
-        experiences = Experience.objects.all()
-        serializer = serializers.ExperienceListSerializer(experiences, many=True)
-        return Response(serializer.data)
+        experiences = filter_experiences(
+            Experience.objects.for_listing(), request.query_params
+        )
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(experiences, request, view=self)
+        serializer = serializers.ExperienceListSerializer(
+            page,
+            many=True,
+            context={"request": request},
+        )
+        return paginator.get_paginated_response(serializer.data)
 
+    @idempotent
     def post(self, request):
         if not request.user.is_authenticated:
             raise NotAuthenticated
@@ -114,6 +141,7 @@ class ExperienceDetail(APIView):
         except Experience.DoesNotExist:
             raise NotFound
 
+    @conditional_get(lambda view, request, pk: Experience.objects.filter(pk=pk))
     def get(self, request, pk):
         experience = self.get_object(pk)
         serializer = serializers.ExperienceDetailSerializer(experience)
@@ -193,26 +221,10 @@ class ExperienceReviews(APIView):
     def post(self, request, pk):
         if not request.user.is_authenticated:
             raise NotAuthenticated
-        experience = self.get_experience(pk)
-        has_booking = Booking.objects.filter(
-            user=request.user,
-            experience=experience,
-            kind=Booking.BookingKindChoices.EXPERIENCE,
-        ).exists()
-        if not has_booking:
-            raise PermissionDenied("You can review experiences only after booking.")
-        already = Review.objects.filter(
-            user=request.user,
-            experience=experience,
-        ).exists()
-        if already:
-            raise ParseError("You have already reviewed this experience.")
+        experience = get_review_target(Experience, pk, request.user)
         serializer = ReviewSerializer(data=request.data)
         if serializer.is_valid():
-            review = serializer.save(
-                user=request.user,
-                experience=experience,
-            )
+            review = save_review(serializer, request.user, experience)
             return Response(
                 ReviewSerializer(review).data,
                 status=201,
@@ -239,14 +251,17 @@ class ExperienceBookings(APIView):
             raise ParseError("year and month must be integers.")
         if month < 1 or month > 12:
             raise ParseError("month must be between 1 and 12.")
-        _, last_day = calendar.monthrange(year, month)
-        start_date = timezone.datetime(year, month, 1).date()
-        end_date = timezone.datetime(year, month, last_day).date()
-        bookings = Booking.objects.filter(
+        try:
+            month_start, month_end = month_range(year, month)
+        except (OverflowError, ValueError):
+            raise ParseError("year is out of range.")
+        bookings = Booking.objects.for_public(
+            Booking.BookingKindChoices.EXPERIENCE
+        ).filter(
             experience=experience,
             kind=Booking.BookingKindChoices.EXPERIENCE,
-            experience_time__date__gte=start_date,
-            experience_time__date__lte=end_date,
+            experience_time__gte=month_start,
+            experience_time__lt=month_end,
         ).order_by("experience_time")
         try:
             page = int(request.query_params.get("page", 1))
@@ -263,6 +278,7 @@ class ExperienceBookings(APIView):
         )
         return Response(serializer.data)
 
+    @idempotent
     def post(self, request, pk):
         if not request.user.is_authenticated:
             raise NotAuthenticated
@@ -274,14 +290,10 @@ class ExperienceBookings(APIView):
             context={"experience": experience},
         )
         if serializer.is_valid():
-            duration_minutes = experience.duration
-            start_time = serializer.validated_data["experience_time"]
-            slot_end = start_time + timedelta(minutes=duration_minutes)
-            booking = serializer.save(
-                experience=experience,
-                user=request.user,
-                kind=Booking.BookingKindChoices.EXPERIENCE,
-                experience_end=slot_end,
+            booking = save_experience_booking(
+                experience,
+                request.user,
+                **serializer.validated_data,
             )
             return Response(
                 PublicBookingSerializer(booking).data,
@@ -290,6 +302,74 @@ class ExperienceBookings(APIView):
         return Response(serializer.errors, status=400)
 
 
+class ExperienceHolds(APIView):
+
+    permission_classes = [IsAuthenticated]
+
+    def get_object(self, pk):
+        try:
+            return Experience.objects.get(pk=pk)
+        except Experience.DoesNotExist:
+            raise NotFound
+
+    @idempotent
+    def post(self, request, pk):
+        experience = self.get_object(pk)
+        if experience.host == request.user:
+            raise PermissionDenied("Hosts cannot book their own experiences.")
+        serializer = CreateExperienceBookingSerializer(
+            data=request.data,
+            context={"experience": experience},
+        )
+        if serializer.is_valid():
+            hold = hold_experience(
+                experience,
+                request.user,
+                **serializer.validated_data,
+            )
+            return Response(BookingHoldSerializer(hold).data, status=201)
+        return Response(serializer.errors, status=400)
+
+
+class ExperienceSlots(APIView):
+
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+    # 기본 조회 기간과 최대 조회 기간 (일)
+    default_days = 7
+    max_days = 31
+
+    def get_object(self, pk):
+        try:
+            return Experience.objects.get(pk=pk)
+        except Experience.DoesNotExist:
+            raise NotFound
+
+    def get(self, request, pk):
+        experience = self.get_object(pk)
+        first_day = parse_date(request.query_params, "from") or timezone.localdate()
+        last_day = parse_date(request.query_params, "to") or (
+            first_day + timedelta(days=self.default_days - 1)
+        )
+        if last_day < first_day:
+            raise ParseError("to must not be before from.")
+        if (last_day - first_day).days >= self.max_days:
+            raise ParseError(f"The range can be at most {self.max_days} days.")
+        now = timezone.now()
+        slots = get_experience_slots(experience, first_day, last_day)
+        return Response(
+            [
+                {
+                    "start": start,
+                    "end": end,
+                    "seats": seats,
+                    "available": seats > 0 and start > now,
+                }
+                for start, end, seats in slots
+            ]
+        )
+
+
 class ExperienceBookingDetail(APIView):
 
     permission_classes = [IsAuthenticatedOrReadOnly]
@@ -320,13 +400,16 @@ class ExperienceBookingDetail(APIView):
             partial=True,
         )
         if serializer.is_valid():
-            new_start = serializer.validated_data.get(
-                "experience_time",
-                booking.experience_time,
+            updated = save_experience_booking(
+                booking.experience,
+                booking.user,
+                serializer.validated_data.get(
+                    "experience_time",
+                    booking.experience_time,
+                ),
+                serializer.validated_data.get("guests", booking.guests),
+                booking=booking,
             )
-            duration_minutes = booking.experience.duration
-            slot_end = new_start + timedelta(minutes=duration_minutes)
-            updated = serializer.save(experience_end=slot_end)
             return Response(PublicBookingSerializer(updated).data)
         return Response(serializer.errors, status=400)
 
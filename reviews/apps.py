@@ -5,3 +5,5 @@ class ReviewsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "reviews"
 
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.7 on 2026-10-18 00:47
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def find_duplicate_reviews(Review, target):
+    """(user, target pk, review pks) of users with several reviews of one target."""
+
+    groups = (
+        Review.objects.filter(**{f"{target}__isnull": False})
+        .values("user", target)
+        .annotate(count=Count("pk"))
+        .filter(count__gt=1)
+        .order_by("user", target)
+    )
+    return [
+        (
+            group["user"],
+            group[target],
+            list(
+                Review.objects.filter(user=group["user"], **{target: group[target]})
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            ),
+        )
+        for group in groups
+    ]
+
+
+def check_duplicate_reviews(apps, schema_editor):
+    # Which review a user keeps is a business decision, so duplicates are
+    # listed and the migration stops instead of deleting any of them.
+    Review = apps.get_model("reviews", "Review")
+    duplicates = [
+        f"user {user} {target} {target_pk}: reviews {', '.join(map(str, pks))}"
+        for target in ("room", "experience")
+        for user, target_pk, pks in find_duplicate_reviews(Review, target)
+    ]
+    if duplicates:
+        raise RuntimeError(
+            "Cannot add the one-review-per-target constraints. Delete all but "
+            "one review of each group, then migrate again: " + "; ".join(duplicates)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("experiences", "0007_experience_rating_aggregates"),
+        ("reviews", "0003_alter_review_user"),
+        ("rooms", "0009_room_search_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_reviews, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="review",
+            constraint=models.UniqueConstraint(
+                fields=("user", "room"), name="review_user_room_unique"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="review",
+            constraint=models.UniqueConstraint(
+                fields=("user", "experience"), name="review_user_experience_unique"
+            ),
+        ),
+    ]
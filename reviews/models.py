@@ -32,6 +32,18 @@ class Review(CommonModel):
         validators=[MinValueValidator(1), MaxValueValidator(5)]
     )
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "room"],
+                name="review_user_room_unique",
+            ),
+            models.UniqueConstraint(
+                fields=["user", "experience"],
+                name="review_user_experience_unique",
+            ),
+        ]
+
     def __str__(self) -> str:
         target = self.room or self.experience
         return f"{self.user} → {target} ({self.rating}⭐️)"
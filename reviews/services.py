@@ -0,0 +1,50 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef
+from rest_framework.exceptions import NotFound, ParseError, PermissionDenied
+
+from bookings.models import Booking
+from .models import Review
+
+
+def get_review_target(model, pk, user):
+    """Load a room or experience with the user's review eligibility.
+
+    ``has_booking`` and ``has_review`` are EXISTS subqueries of the same
+    SELECT, so the target and both checks cost one round trip.
+    """
+
+    target = model._meta.model_name
+    try:
+        return model.objects.annotate(
+            has_booking=Exists(
+                Booking.objects.filter(user=user, **{target: OuterRef("pk")})
+            ),
+            has_review=Exists(
+                Review.objects.filter(user=user, **{target: OuterRef("pk")})
+            ),
+        ).get(pk=pk)
+    except model.DoesNotExist:
+        raise NotFound
+
+
+def save_review(serializer, user, target):
+    """Save a validated review of ``target`` by a guest who has booked it.
+
+    The unique (user, room) and (user, experience) constraints catch a
+    duplicate that races past the has_review check. The review and the
+    stored rating that its signal refreshes commit together.
+    """
+
+    name = target._meta.model_name
+    already = f"You have already reviewed this {name}."
+    if not target.has_booking:
+        raise PermissionDenied(
+            f"You can review {target._meta.verbose_name_plural} only after booking."
+        )
+    if target.has_review:
+        raise ParseError(already)
+    try:
+        with transaction.atomic():
+            return serializer.save(user=user, **{name: target})
+    except IntegrityError:
+        raise ParseError(already)
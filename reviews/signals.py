@@ -0,0 +1,42 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from experiences.models import Experience
+from rooms.cache import invalidate_room_detail
+from rooms.models import Room
+from .models import Review
+
+
+@receiver(pre_save, sender=Review)
+def remember_previous_targets(sender, instance, **kwargs):
+    instance._previous_targets = (None, None)
+    if instance.pk:
+        instance._previous_targets = (
+            Review.objects.filter(pk=instance.pk)
+            .values_list("room_id", "experience_id")
+            .first()
+        ) or (None, None)
+
+
+def refresh_ratings(room_ids, experience_ids):
+    for room_id in set(room_ids) - {None}:
+        Room(pk=room_id).refresh_rating()
+        invalidate_room_detail(room_id)
+    for experience_id in set(experience_ids) - {None}:
+        Experience(pk=experience_id).refresh_rating()
+
+
+@receiver(post_save, sender=Review)
+def update_rating_on_save(sender, instance, **kwargs):
+    previous_room_id, previous_experience_id = getattr(
+        instance, "_previous_targets", (None, None)
+    )
+    refresh_ratings(
+        [instance.room_id, previous_room_id],
+        [instance.experience_id, previous_experience_id],
+    )
+
+
+@receiver(post_delete, sender=Review)
+def update_rating_on_delete(sender, instance, **kwargs):
+    refresh_ratings([instance.room_id], [instance.experience_id])
@@ -1,6 +1,17 @@
+from datetime import datetime, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from django.utils import timezone
 from rest_framework.test import APITestCase
 from rest_framework import status
+from rest_framework.exceptions import ParseError
+from bookings.models import Booking
+from experiences.models import Experience
 from reviews.models import Review
+from reviews.serializers import ReviewSerializer
+from reviews.services import get_review_target, save_review
 from rooms.models import Room
 from categories.models import Category
 from users.models import User
@@ -37,6 +48,14 @@ class TestRoomReviews(APITestCase):
             owner=self.user,
             category=self.category,
         )
+        Booking.objects.create(
+            kind=Booking.BookingKindChoices.ROOM,
+            user=self.user,
+            room=self.room,
+            check_in="2030-01-01",
+            check_out="2030-01-03",
+            guests=1,
+        )
         self.base_url = f"/api/v1/rooms/{self.room.pk}/reviews"
 
     def test_create_room_review(self):
@@ -126,9 +145,12 @@ class TestRoomReviews(APITestCase):
         """GET /api/v1/rooms/<pk>/reviews - 페이지네이션 테스트"""
         # 여러 리뷰 생성
         for i in range(5):
+            reviewer = User.objects.create_user(
+                username=f"reviewer{i}", password="testpass123"
+            )
             Review.objects.create(
                 room=self.room,
-                user=self.user,
+                user=reviewer,
                 payload=f"Review {i+1}",
                 rating=4,
             )
@@ -163,11 +185,11 @@ class TestRoomReviews(APITestCase):
             rating=3,
         )
 
-        # Room의 rating 메서드 호출
-        calculated_rating = self.room.rating()
+        # 저장된 평점 조회
+        self.room.refresh_from_db()
 
         # 검증 (평균: (5 + 3) / 2 = 4.0)
-        self.assertEqual(calculated_rating, 4.0)
+        self.assertEqual(self.room.rating_avg, 4.0)
 
     def test_room_rating_with_no_reviews(self):
         """리뷰가 없는 Room의 평점 테스트"""
@@ -186,11 +208,8 @@ class TestRoomReviews(APITestCase):
             category=self.category,
         )
 
-        # Room의 rating 메서드 호출
-        calculated_rating = new_room.rating()
-
-        # 검증 (리뷰가 없으면 0 반환)
-        self.assertEqual(calculated_rating, 0)
+        # 검증 (리뷰가 없으면 0)
+        self.assertEqual(new_room.rating_avg, 0)
 
     def test_create_review_unauthenticated(self):
         """POST /api/v1/rooms/<pk>/reviews - 비인증 사용자 리뷰 생성 시 에러 테스트"""
@@ -228,7 +247,7 @@ class TestRoomReviews(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_multiple_reviews_same_user(self):
-        """같은 사용자가 여러 리뷰 작성 테스트"""
+        """같은 사용자가 같은 방에 두 번째 리뷰 작성 시 에러 테스트"""
         # 첫 번째 리뷰
         data1 = {
             "payload": "First Review",
@@ -243,9 +262,321 @@ class TestRoomReviews(APITestCase):
             "rating": 4,
         }
         response2 = self.client.post(self.base_url, data2, format="json")
-        self.assertEqual(response2.status_code, status.HTTP_200_OK)
 
-        # 검증 (두 리뷰 모두 생성됨)
+        # 검증 (첫 번째 리뷰만 남음)
+        self.assertEqual(response2.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response2.data["detail"], "You have already reviewed this room."
+        )
         reviews = Review.objects.filter(room=self.room, user=self.user)
-        self.assertEqual(reviews.count(), 2)
+        self.assertEqual(reviews.count(), 1)
+        self.assertEqual(reviews.get().payload, "First Review")
+
+    def test_create_review_without_booking(self):
+        """POST /api/v1/rooms/<pk>/reviews - 예약 없이 리뷰 작성 시 403 테스트"""
+        guest = User.objects.create_user(username="guest", password="testpass123")
+        self.client.force_authenticate(user=guest)
+
+        # API 호출
+        response = self.client.post(
+            self.base_url, {"payload": "Review", "rating": 5}, format="json"
+        )
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Review.objects.filter(user=guest).exists())
+
+    def test_duplicate_review_rejected_by_constraint(self):
+        """(user, room) 유니크 제약으로 중복 리뷰가 저장되지 않는지 테스트"""
+        Review.objects.create(
+            room=self.room, user=self.user, payload="First", rating=5
+        )
+
+        # 검증
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Review.objects.create(
+                room=self.room, user=self.user, payload="Second", rating=4
+            )
+
+    def test_stored_rating_updates_on_review_writes(self):
+        """Review 생성/수정/삭제 시 Room에 저장된 평점 집계 갱신 테스트"""
+        other_user = User.objects.create_user(
+            username="otheruser",
+            email="other@example.com",
+            password="testpass123"
+        )
+        first = Review.objects.create(
+            room=self.room,
+            user=self.user,
+            payload="Review 1",
+            rating=5,
+        )
+        Review.objects.create(
+            room=self.room,
+            user=other_user,
+            payload="Review 2",
+            rating=2,
+        )
+
+        # 검증 (생성)
+        self.room.refresh_from_db()
+        self.assertEqual(self.room.rating_count, 2)
+        self.assertEqual(self.room.rating_sum, 7)
+        self.assertEqual(self.room.rating_avg, 3.5)
+
+        # 검증 (수정)
+        first.rating = 3
+        first.save()
+        self.room.refresh_from_db()
+        self.assertEqual(self.room.rating_sum, 5)
+        self.assertEqual(self.room.rating_avg, 2.5)
+
+        # 검증 (삭제)
+        first.delete()
+        self.room.refresh_from_db()
+        self.assertEqual(self.room.rating_count, 1)
+        self.assertEqual(self.room.rating_avg, 2.0)
+
+    def test_room_list_reads_stored_rating(self):
+        """GET /api/v1/rooms/ - 저장된 평점 사용 테스트"""
+        self.client.post(self.base_url, {"payload": "Nice", "rating": 4}, format="json")
+
+        # API 호출
+        response = self.client.get("/api/v1/rooms/")
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["rating"], 4.0)
+
+    def test_rebuild_room_ratings_command(self):
+        """manage.py rebuild_room_ratings - 평점 집계 재계산 테스트"""
+        Review.objects.create(
+            room=self.room,
+            user=self.user,
+            payload="Review",
+            rating=4,
+        )
+        Room.objects.filter(pk=self.room.pk).update(
+            rating_sum=0,
+            rating_count=0,
+            rating_avg=0,
+        )
+
+        call_command("rebuild_room_ratings", stdout=StringIO())
+
+        # 검증
+        self.room.refresh_from_db()
+        self.assertEqual(self.room.rating_sum, 4)
+        self.assertEqual(self.room.rating_count, 1)
+        self.assertEqual(self.room.rating_avg, 4.0)
+
+    def test_rebuild_room_ratings_refreshes_detail(self):
+        """manage.py rebuild_room_ratings - 재계산 후 상세 캐시/ETag 갱신 테스트"""
+        detail_url = f"/api/v1/rooms/{self.room.pk}"
+        etag = self.client.get(detail_url)["ETag"]
+        Review.objects.bulk_create(
+            [Review(room=self.room, user=self.user, payload="Review", rating=4)]
+        )
+
+        call_command("rebuild_room_ratings", stdout=StringIO())
+
+        # API 호출
+        response = self.client.get(detail_url, HTTP_IF_NONE_MATCH=etag)
 
+        # 검증 (시그널 없이 저장된 리뷰도 반영)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["rating"], 4.0)
+
+
+class TestExperienceRatings(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        self.host = User.objects.create_user(
+            username="host", password="testpass123", is_host=True
+        )
+        self.client.force_authenticate(user=self.user)
+        self.experience = self.create_experience("Experience")
+        self.base_url = f"/api/v1/experiences/{self.experience.pk}/reviews"
+
+    def create_experience(self, name):
+        return Experience.objects.create(
+            name=name,
+            host=self.host,
+            price=20000,
+            address="Address",
+            start="09:00",
+            end="18:00",
+            description="Description",
+        )
+
+    def book(self, user, experience):
+        experience_time = timezone.make_aware(datetime(2030, 1, 1, 10))
+        Booking.objects.create(
+            kind=Booking.BookingKindChoices.EXPERIENCE,
+            user=user,
+            experience=experience,
+            experience_time=experience_time,
+            experience_end=experience_time + timedelta(hours=1),
+            guests=1,
+        )
+
+    def test_review_post_updates_stored_rating(self):
+        """POST /api/v1/experiences/<pk>/reviews - 리뷰 작성 시 저장된 평점 갱신 테스트"""
+        other = User.objects.create_user(username="other", password="testpass123")
+        for user, rating in ((self.user, 5), (other, 2)):
+            self.book(user, self.experience)
+            self.client.force_authenticate(user=user)
+
+            # API 호출
+            response = self.client.post(
+                self.base_url, {"payload": "Review", "rating": rating}, format="json"
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        # 검증
+        self.experience.refresh_from_db()
+        self.assertEqual(self.experience.rating_sum, 7)
+        self.assertEqual(self.experience.rating_count, 2)
+        self.assertEqual(self.experience.rating_avg, 3.5)
+
+    def test_review_eligibility_is_one_query(self):
+        """예약 여부/기존 리뷰 여부를 체험 조회와 함께 한 번의 쿼리로 확인하는지 테스트"""
+        self.book(self.user, self.experience)
+
+        # 검증
+        with self.assertNumQueries(1):
+            experience = get_review_target(Experience, self.experience.pk, self.user)
+        self.assertTrue(experience.has_booking)
+        self.assertFalse(experience.has_review)
+
+    def test_review_requires_booking(self):
+        """POST /api/v1/experiences/<pk>/reviews - 예약 없이 리뷰 작성 시 403 테스트"""
+        # API 호출
+        response = self.client.post(
+            self.base_url, {"payload": "Review", "rating": 5}, format="json"
+        )
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Review.objects.exists())
+
+    def test_second_review_is_rejected(self):
+        """POST /api/v1/experiences/<pk>/reviews - 같은 체험 중복 리뷰 시 400 테스트"""
+        self.book(self.user, self.experience)
+        first = self.client.post(
+            self.base_url, {"payload": "First", "rating": 5}, format="json"
+        )
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+
+        # API 호출
+        response = self.client.post(
+            self.base_url, {"payload": "Second", "rating": 1}, format="json"
+        )
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["detail"], "You have already reviewed this experience."
+        )
+        self.experience.refresh_from_db()
+        self.assertEqual(self.experience.rating_count, 1)
+
+    def test_racing_duplicate_maps_to_400(self):
+        """has_review 확인 이후 끼어든 중복 리뷰는 IntegrityError -> 400으로 변환되는지 테스트"""
+        self.book(self.user, self.experience)
+        experience = get_review_target(Experience, self.experience.pk, self.user)
+        Review.objects.create(
+            experience=self.experience, user=self.user, payload="First", rating=5
+        )
+        serializer = ReviewSerializer(data={"payload": "Second", "rating": 1})
+        serializer.is_valid(raise_exception=True)
+
+        # 검증
+        with self.assertRaises(ParseError):
+            save_review(serializer, self.user, experience)
+        self.assertEqual(Review.objects.filter(user=self.user).count(), 1)
+
+    def test_stored_rating_follows_review_writes(self):
+        """Review 수정/이동/삭제 시 Experience 평점 집계 갱신 테스트"""
+        other_experience = self.create_experience("Other")
+        review = Review.objects.create(
+            experience=self.experience, user=self.user, payload="Review", rating=4
+        )
+
+        # 검증 (수정)
+        review.rating = 2
+        review.save()
+        self.experience.refresh_from_db()
+        self.assertEqual(self.experience.rating_avg, 2.0)
+
+        # 검증 (다른 체험으로 이동하면 양쪽 모두 갱신)
+        review.experience = other_experience
+        review.save()
+        self.experience.refresh_from_db()
+        other_experience.refresh_from_db()
+        self.assertEqual(self.experience.rating_count, 0)
+        self.assertEqual(self.experience.rating_avg, 0)
+        self.assertEqual(other_experience.rating_count, 1)
+
+        # 검증 (삭제)
+        review.delete()
+        other_experience.refresh_from_db()
+        self.assertEqual(other_experience.rating_count, 0)
+
+    def test_list_and_detail_read_stored_rating(self):
+        """GET /api/v1/experiences/ - 저장된 평점/리뷰 수를 추가 쿼리 없이 노출하는지 테스트"""
+        Review.objects.create(
+            experience=self.experience, user=self.user, payload="Review", rating=4
+        )
+
+        # API 호출 (ETag 행 조회 1회 + 위시리스트 1회 + 목록 1회)
+        with self.assertNumQueries(3):
+            listing = self.client.get("/api/v1/experiences/")
+        detail = self.client.get(f"/api/v1/experiences/{self.experience.pk}")
+
+        # 검증
+        row = listing.data["results"][0]
+        self.assertEqual((row["rating"], row["review_count"]), (4.0, 1))
+        self.assertEqual((detail.data["rating"], detail.data["review_count"]), (4.0, 1))
+
+    def test_rebuild_experience_ratings_command(self):
+        """manage.py rebuild_experience_ratings - 평점 집계 재계산 테스트"""
+        Review.objects.create(
+            experience=self.experience, user=self.user, payload="Review", rating=3
+        )
+        Experience.objects.update(rating_sum=0, rating_count=0, rating_avg=0)
+
+        out = StringIO()
+        call_command("rebuild_experience_ratings", stdout=out)
+
+        # 검증
+        self.experience.refresh_from_db()
+        self.assertIn("Rebuilt ratings for 1 experiences.", out.getvalue())
+        self.assertEqual(self.experience.rating_sum, 3)
+        self.assertEqual(self.experience.rating_count, 1)
+        self.assertEqual(self.experience.rating_avg, 3.0)
+
+    def test_rebuild_experience_ratings_changes_etag(self):
+        """manage.py rebuild_experience_ratings - 재계산 후 상세 ETag 갱신 테스트"""
+        detail_url = f"/api/v1/experiences/{self.experience.pk}"
+        etag = self.client.get(detail_url)["ETag"]
+        Review.objects.bulk_create(
+            [
+                Review(
+                    experience=self.experience,
+                    user=self.user,
+                    payload="Review",
+                    rating=3,
+                )
+            ]
+        )
+
+        call_command("rebuild_experience_ratings", stdout=StringIO())
+
+        # API 호출
+        response = self.client.get(detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        # 검증 (시그널 없이 저장된 리뷰도 반영)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["rating"], 3.0)
@@ -40,6 +40,10 @@ class RoomAdmin(admin.ModelAdmin):
     ordering = ("-created_at",)
     filter_horizontal = ("amenities",)
 
+    @admin.display(description="Rating", ordering="rating_avg")
+    def rating(self, room):
+        return room.rating_avg
+
 
 @admin.register(Amenity)
 class AmenityAdmin(admin.ModelAdmin):
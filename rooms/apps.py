@@ -5,3 +5,5 @@ class RoomsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "rooms"
 
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,51 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from common.cache import get_version, invalidate
+from .models import Room
+from .serializers import RoomBodySerializer
+
+ROOM_DETAIL = "room-detail"
+
+
+def get_room_detail(pk):
+    """User independent room detail payload, cached per room version.
+
+    Returns a dict with the room's ``owner_id`` and the serialized ``data``.
+    Raises ``Room.DoesNotExist`` for unknown rooms.
+    """
+
+    key = f"{ROOM_DETAIL}:{pk}:{get_version(ROOM_DETAIL, pk)}"
+    cached = cache.get(key)
+    if cached is None:
+        room = (
+            Room.objects.select_related("owner", "category")
+            .prefetch_related("amenities", "photos", "beds")
+            .get(pk=pk)
+        )
+        cached = {
+            "owner_id": room.owner_id,
+            "data": RoomBodySerializer(room).data,
+        }
+        cache.set(key, cached, settings.ROOM_DETAIL_CACHE_TIMEOUT)
+    return cached
+
+
+def invalidate_room_detail(*room_pks):
+    for pk in room_pks:
+        if pk is not None:
+            invalidate(ROOM_DETAIL, pk)
+
+
+def touch_rooms(*room_pks):
+    """Mark rooms as changed after a write to something their payload shows.
+
+    Bumps ``updated_at`` (which the conditional GET validators read) and the
+    detail cache version.
+    """
+
+    room_pks = [pk for pk in room_pks if pk is not None]
+    if room_pks:
+        Room.objects.filter(pk__in=room_pks).update(updated_at=timezone.now())
+        invalidate_room_detail(*room_pks)
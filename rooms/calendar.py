@@ -0,0 +1,138 @@
+from datetime import date, timedelta
+
+from bookings.models import Booking
+
+FREE = ord("0")
+BOOKED = ord("1")
+PARTIAL = ord("2")
+DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def month_window(year, month, months=1):
+    """Return [start, end) covering ``months`` calendar months from year/month."""
+
+    start = date(year, month, 1)
+    month_index = year * 12 + month - 1 + months
+    end = date(month_index // 12, month_index % 12 + 1, 1)
+    return start, end
+
+
+def room_calendar(room, start, end):
+    """Per-day occupancy of a room and its beds for the days in [start, end).
+
+    Every day is one character: "0" free, "1" booked and, for the room
+    row only, "2" when some of its beds are booked. The rows are filled
+    from a single query over bookings that overlap the window, so stays
+    starting before ``start`` are included.
+    """
+
+    days = (end - start).days
+    room_row = bytearray(b"0") * days
+    beds = list(room.beds.order_by("pk").only("pk", "name", "room_id"))
+    bed_rows = {bed.pk: bytearray(b"0") * days for bed in beds}
+    bookings = Booking.objects.filter(
+        room=room,
+        kind__in=[Booking.BookingKindChoices.ROOM, Booking.BookingKindChoices.BED],
+        check_in__lt=end,
+        check_out__gt=start,
+    ).values_list("kind", "bed_id", "check_in", "check_out")
+    partial = []
+    for kind, bed_id, check_in, check_out in bookings:
+        first = max((check_in - start).days, 0)
+        last = min((check_out - start).days, days)
+        if kind == Booking.BookingKindChoices.ROOM:
+            room_row[first:last] = bytes([BOOKED]) * (last - first)
+        elif bed_id in bed_rows:
+            bed_rows[bed_id][first:last] = bytes([BOOKED]) * (last - first)
+            partial.append((first, last))
+    for first, last in partial:
+        for day in range(first, last):
+            if room_row[day] == FREE:
+                room_row[day] = PARTIAL
+    return {
+        "start": start,
+        "end": end,
+        "days": days,
+        "room": room_row.decode("ascii"),
+        "beds": [
+            {
+                "pk": bed.pk,
+                "name": bed.name,
+                "occupancy": bed_rows[bed.pk].decode("ascii"),
+            }
+            for bed in beds
+        ],
+    }
+
+
+class BedOccupancy:
+    """Beds x days occupancy matrix for the days in [start, end).
+
+    The matrix is one flat bytearray, a row per bed and a byte per night
+    (1 = booked). Bed bookings and whole-room bookings are loaded with a
+    single query. Rows are grouped by bed type, so a night's column, for
+    all beds or one type, is a strided slice that is counted in C instead
+    of looping over beds in Python.
+    """
+
+    def __init__(self, room, start, end):
+        self.start = start
+        self.end = end
+        self.days = (end - start).days
+        self.beds = list(
+            room.beds.order_by("bed_type", "pk").only(
+                "pk", "name", "bed_type", "room_id"
+            )
+        )
+        self.rows = {bed.pk: row for row, bed in enumerate(self.beds)}
+        self.types = {}
+        for row, bed in enumerate(self.beds):
+            first, _ = self.types.get(bed.bed_type, (row, row))
+            self.types[bed.bed_type] = (first, row + 1)
+        self.matrix = bytearray(len(self.beds) * self.days)
+        bookings = Booking.objects.filter(
+            room=room,
+            kind__in=[Booking.BookingKindChoices.ROOM, Booking.BookingKindChoices.BED],
+            check_in__lt=end,
+            check_out__gt=start,
+        ).values_list("kind", "bed_id", "check_in", "check_out")
+        for kind, bed_id, check_in, check_out in bookings:
+            first = max((check_in - start).days, 0)
+            last = min((check_out - start).days, self.days)
+            if kind == Booking.BookingKindChoices.ROOM:
+                rows = range(len(self.beds))
+            elif bed_id in self.rows:
+                rows = [self.rows[bed_id]]
+            else:
+                continue
+            for row in rows:
+                offset = row * self.days
+                self.matrix[offset + first:offset + last] = b"\x01" * (last - first)
+
+    def free_beds(self, bed_type=None):
+        """Number of free beds on each night, optionally for one bed type."""
+
+        if bed_type is None:
+            first, last = 0, len(self.beds)
+        else:
+            first, last = self.types.get(bed_type, (0, 0))
+        block = self.matrix[first * self.days:last * self.days]
+        return [block[day::self.days].count(0) for day in range(self.days)]
+
+    def free_beds_by_type(self):
+        return {bed_type: self.free_beds(bed_type) for bed_type in self.types}
+
+    def first_night_with(self, beds, bed_type=None):
+        """First night with at least ``beds`` free beds, or None."""
+
+        for day, free in enumerate(self.free_beds(bed_type)):
+            if free >= beds:
+                return self.start + timedelta(days=day)
+        return None
+
+    def row(self, bed):
+        """The bed's nights in the same "0"/"1" form as room_calendar."""
+
+        offset = self.rows[bed.pk] * self.days
+        row = bytes(self.matrix[offset:offset + self.days])
+        return row.translate(DIGITS).decode("ascii")
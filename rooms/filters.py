@@ -0,0 +1,161 @@
+from datetime import date, time
+
+from django.db.models import Count, Exists, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from rest_framework.exceptions import ParseError
+
+from bookings.models import Booking
+from .models import Bed, Room
+
+
+def parse_int(params, name, minimum=0):
+    value = params.get(name)
+    if value in (None, ""):
+        return None
+    try:
+        value = int(value)
+    except ValueError:
+        raise ParseError(f"{name} must be an integer.")
+    if value < minimum:
+        raise ParseError(f"{name} must be at least {minimum}.")
+    return value
+
+
+def parse_bool(params, name):
+    value = params.get(name)
+    if value in (None, ""):
+        return None
+    value = value.lower()
+    if value in ("true", "1", "yes"):
+        return True
+    if value in ("false", "0", "no"):
+        return False
+    raise ParseError(f"{name} must be true or false.")
+
+
+def parse_date(params, name):
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ParseError(f"{name} must be a date (YYYY-MM-DD).")
+
+
+def parse_time(params, name):
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        return time.fromisoformat(value)
+    except ValueError:
+        raise ParseError(f"{name} must be a time (HH:MM).")
+
+
+def parse_pk_list(params, name):
+    value = params.get(name)
+    if not value:
+        return []
+    try:
+        return sorted({int(pk) for pk in value.split(",") if pk.strip()})
+    except ValueError:
+        raise ParseError(f"{name} must be a comma separated list of ids.")
+
+
+def filter_rooms(rooms, params):
+    """Apply the room search query parameters to a Room queryset.
+
+    Every filter is pushed into the WHERE clause of the listing query, and
+    "has all amenities" is a single grouped subquery on the through table.
+    """
+
+    for name in ("city", "country"):
+        value = params.get(name)
+        if value:
+            rooms = rooms.filter(**{name: value})
+    kind = params.get("kind")
+    if kind:
+        if kind not in Room.RoomKindChoices.values:
+            raise ParseError(f"kind must be one of {', '.join(Room.RoomKindChoices.values)}.")
+        rooms = rooms.filter(kind=kind)
+    pet_friendly = parse_bool(params, "pet_friendly")
+    if pet_friendly is not None:
+        rooms = rooms.filter(pet_friendly=pet_friendly)
+    price_min = parse_int(params, "price_min")
+    if price_min is not None:
+        rooms = rooms.filter(price__gte=price_min)
+    price_max = parse_int(params, "price_max")
+    if price_max is not None:
+        rooms = rooms.filter(price__lte=price_max)
+    rooms_gte = parse_int(params, "rooms__gte")
+    if rooms_gte is not None:
+        rooms = rooms.filter(rooms__gte=rooms_gte)
+    toilets_gte = parse_int(params, "toilets__gte")
+    if toilets_gte is not None:
+        rooms = rooms.filter(toilets__gte=toilets_gte)
+    category = parse_int(params, "category", minimum=1)
+    if category is not None:
+        rooms = rooms.filter(category_id=category)
+    amenities = parse_pk_list(params, "amenities")
+    if amenities:
+        matching = (
+            Room.amenities.through.objects.filter(amenity_id__in=amenities)
+            .values("room_id")
+            .annotate(matched=Count("amenity_id"))
+            .filter(matched=len(amenities))
+            .values("room_id")
+        )
+        rooms = rooms.filter(pk__in=matching)
+    return filter_available_rooms(rooms, params)
+
+
+def filter_available_rooms(rooms, params):
+    """Keep rooms that are free between check_in and check_out.
+
+    A room is free when no ROOM booking overlaps the stay. Rooms that have
+    beds must also have enough capacity left on beds without an overlapping
+    BED booking to fit the guests. Both checks are correlated NOT EXISTS /
+    SUM subqueries inside the listing query, so the whole search stays a
+    single query however many rooms or bookings there are.
+    """
+
+    check_in = parse_date(params, "check_in")
+    check_out = parse_date(params, "check_out")
+    guests = parse_int(params, "guests", minimum=1)
+    if check_in is None and check_out is None:
+        if guests is not None:
+            raise ParseError("guests requires check_in and check_out.")
+        return rooms
+    if check_in is None or check_out is None:
+        raise ParseError("check_in and check_out must be given together.")
+    if check_out <= check_in:
+        raise ParseError("Check out must be after check in.")
+
+    overlapping = Booking.objects.filter(
+        check_in__lt=check_out,
+        check_out__gt=check_in,
+    )
+    room_booked = overlapping.filter(
+        room=OuterRef("pk"),
+        kind=Booking.BookingKindChoices.ROOM,
+    )
+    bed_booked = overlapping.filter(
+        bed=OuterRef("pk"),
+        kind=Booking.BookingKindChoices.BED,
+    )
+    free_capacity = (
+        Bed.objects.filter(room=OuterRef("pk"))
+        .filter(~Exists(bed_booked))
+        .order_by()
+        .values("room")
+        .annotate(total=Sum("capacity"))
+        .values("total")
+    )
+    return rooms.alias(
+        has_beds=Exists(Bed.objects.filter(room=OuterRef("pk"))),
+        free_capacity=Coalesce(Subquery(free_capacity), Value(0)),
+    ).filter(
+        ~Exists(room_booked),
+        Q(has_beds=False) | Q(free_capacity__gte=guests or 1),
+    )
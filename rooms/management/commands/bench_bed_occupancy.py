@@ -0,0 +1,137 @@
+import calendar
+import random
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from bookings.models import Booking
+from rooms.calendar import BedOccupancy
+from rooms.models import Bed, Room
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the beds x days occupancy matrix against asking for each "
+        "bed's bookings month by month. Seeds a dataset inside a transaction "
+        "that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--beds", type=int, default=200)
+        parser.add_argument("--days", type=int, default=365)
+        parser.add_argument("--bookings-per-bed", type=int, default=60)
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.seed(options)
+            end = self.start + timedelta(days=options["days"])
+            matrix = self.measure(
+                lambda: self.use_matrix(self.start, end),
+                options["repeat"],
+            )
+            per_bed = self.measure(
+                lambda: self.per_bed_per_month(self.start, end),
+                options["repeat"],
+            )
+            if matrix[2] != per_bed[2]:
+                self.stderr.write("Free bed counts differ!")
+            self.report("occupancy matrix", matrix)
+            self.report("bed by bed, month by month", per_bed)
+            transaction.set_rollback(True)
+
+    def seed(self, options):
+        rng = random.Random(42)
+        self.start = date(2030, 1, 1)
+        user = User.objects.create_user(username="bench-bed-occupancy-user")
+        self.room = Room.objects.create(
+            name="Bench Hostel",
+            price=20_000,
+            rooms=1,
+            toilets=1,
+            description="",
+            address="",
+            kind=Room.RoomKindChoices.SHARED_ROOM,
+            owner=user,
+        )
+        bed_types = Bed.BedTypeChoices.values
+        beds = Bed.objects.bulk_create(
+            [
+                Bed(
+                    room=self.room,
+                    name=f"Bed {i}",
+                    bed_type=rng.choice(bed_types),
+                )
+                for i in range(options["beds"])
+            ]
+        )
+        bookings = []
+        for bed in beds:
+            check_in = self.start
+            for _ in range(options["bookings_per_bed"]):
+                check_in += timedelta(days=rng.randint(1, 5))
+                check_out = check_in + timedelta(days=rng.randint(1, 3))
+                bookings.append(
+                    Booking(
+                        kind=Booking.BookingKindChoices.BED,
+                        user=user,
+                        room=self.room,
+                        bed=bed,
+                        check_in=check_in,
+                        check_out=check_out,
+                        guests=1,
+                    )
+                )
+                check_in = check_out
+        Booking.objects.bulk_create(bookings, batch_size=5_000)
+        self.stdout.write(f"Seeded {len(beds)} beds and {len(bookings)} bookings")
+
+    def use_matrix(self, start, end):
+        occupancy = BedOccupancy(self.room, start, end)
+        occupancy.free_beds_by_type()
+        occupancy.first_night_with(len(occupancy.beds) // 2)
+        return occupancy.free_beds()
+
+    def per_bed_per_month(self, start, end):
+        days = (end - start).days
+        free = [0] * days
+        for bed in self.room.beds.all():
+            booked = set()
+            year, month = start.year, start.month
+            while date(year, month, 1) < end:
+                _, last_day = calendar.monthrange(year, month)
+                for check_in, check_out in Booking.objects.filter(
+                    bed=bed,
+                    kind=Booking.BookingKindChoices.BED,
+                    check_in__gte=date(year, month, 1),
+                    check_in__lte=date(year, month, last_day),
+                ).values_list("check_in", "check_out"):
+                    night = check_in
+                    while night < check_out:
+                        booked.add(night)
+                        night += timedelta(days=1)
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+            for day in range(days):
+                if start + timedelta(days=day) not in booked:
+                    free[day] += 1
+        return free
+
+    def measure(self, run, repeat):
+        timings = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                result = run()
+                timings.append(time.perf_counter() - started)
+        return min(timings), len(queries), result
+
+    def report(self, label, measurement):
+        elapsed, queries, result = measurement
+        self.stdout.write(
+            f"{label:>28}: {elapsed * 1000:9.1f} ms, {queries} queries, "
+            f"{sum(result)} free bed-nights"
+        )
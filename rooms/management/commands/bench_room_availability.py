@@ -0,0 +1,174 @@
+import random
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.http import QueryDict
+from django.test.utils import CaptureQueriesContext
+
+from bookings.models import Booking
+from rooms.filters import filter_available_rooms
+from rooms.models import Bed, Room
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the anti-join availability search against checking every "
+        "room one by one. Seeds a dataset inside a transaction that is rolled "
+        "back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rooms", type=int, default=5_000)
+        parser.add_argument("--bookings", type=int, default=500_000)
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.seed(options)
+            check_in = self.start + timedelta(days=180)
+            check_out = check_in + timedelta(days=3)
+            params = QueryDict(mutable=True)
+            params.update(
+                {
+                    "check_in": check_in.isoformat(),
+                    "check_out": check_out.isoformat(),
+                    "guests": "2",
+                }
+            )
+            anti_join = self.measure(
+                lambda: [
+                    room.pk
+                    for room in filter_available_rooms(
+                        Room.objects.for_listing(), params
+                    )
+                ],
+                options["repeat"],
+            )
+            per_room = self.measure(
+                lambda: self.check_each_room(check_in, check_out, guests=2),
+                options["repeat"],
+            )
+            if set(anti_join[2]) != set(per_room[2]):
+                self.stderr.write("Result sets differ!")
+            self.report("anti-join search", anti_join)
+            self.report("room by room", per_room)
+            transaction.set_rollback(True)
+
+    def seed(self, options):
+        rng = random.Random(42)
+        self.start = date(2030, 1, 1)
+        user = User.objects.create_user(username="bench-availability-user")
+        started = time.perf_counter()
+        rooms = Room.objects.bulk_create(
+            [
+                Room(
+                    name=f"Room {i}",
+                    price=50_000,
+                    rooms=1,
+                    toilets=1,
+                    description="",
+                    address="",
+                    kind=Room.RoomKindChoices.ENTIRE_PLACE,
+                    owner=user,
+                )
+                for i in range(options["rooms"])
+            ],
+            batch_size=options["batch_size"],
+        )
+        hostels = rooms[: len(rooms) // 5]
+        beds = Bed.objects.bulk_create(
+            [
+                Bed(
+                    room=room,
+                    name=f"Bed {i}",
+                    bed_type=Bed.BedTypeChoices.SINGLE,
+                )
+                for room in hostels
+                for i in range(4)
+            ],
+            batch_size=options["batch_size"],
+        )
+        created = 0
+        while created < options["bookings"]:
+            size = min(options["batch_size"], options["bookings"] - created)
+            batch = []
+            for _ in range(size):
+                check_in = self.start + timedelta(days=rng.randrange(365))
+                check_out = check_in + timedelta(days=rng.randint(1, 5))
+                if rng.random() < 0.2:
+                    bed = rng.choice(beds)
+                    batch.append(
+                        Booking(
+                            kind=Booking.BookingKindChoices.BED,
+                            user=user,
+                            room_id=bed.room_id,
+                            bed=bed,
+                            check_in=check_in,
+                            check_out=check_out,
+                            guests=1,
+                        )
+                    )
+                else:
+                    batch.append(
+                        Booking(
+                            kind=Booking.BookingKindChoices.ROOM,
+                            user=user,
+                            room=rng.choice(rooms[len(hostels):]),
+                            check_in=check_in,
+                            check_out=check_out,
+                            guests=2,
+                        )
+                    )
+            Booking.objects.bulk_create(batch)
+            created += size
+        self.stdout.write(
+            f"Seeded {len(rooms)} rooms, {len(beds)} beds and {created} bookings "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+
+    def check_each_room(self, check_in, check_out, guests):
+        available = []
+        for room in Room.objects.only("pk"):
+            overlapping = Booking.objects.filter(
+                check_in__lt=check_out,
+                check_out__gt=check_in,
+            )
+            if overlapping.filter(
+                room=room,
+                kind=Booking.BookingKindChoices.ROOM,
+            ).exists():
+                continue
+            beds = list(room.beds.all())
+            if beds:
+                free = sum(
+                    bed.capacity
+                    for bed in beds
+                    if not overlapping.filter(
+                        bed=bed,
+                        kind=Booking.BookingKindChoices.BED,
+                    ).exists()
+                )
+                if free < guests:
+                    continue
+            available.append(room.pk)
+        return available
+
+    def measure(self, run, repeat):
+        timings = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                result = run()
+                timings.append(time.perf_counter() - started)
+        return min(timings), len(queries), result
+
+    def report(self, label, measurement):
+        elapsed, queries, result = measurement
+        self.stdout.write(
+            f"{label:>20}: {elapsed * 1000:9.1f} ms, {queries} queries, "
+            f"{len(result)} rooms available"
+        )
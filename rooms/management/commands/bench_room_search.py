@@ -0,0 +1,136 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.http import QueryDict
+from django.test.utils import CaptureQueriesContext
+
+from categories.models import Category
+from rooms.filters import filter_rooms
+from rooms.models import Amenity, Room
+from users.models import User
+
+CITIES = ["서울", "부산", "제주", "강릉", "전주", "경주", "여수", "속초"]
+COUNTRIES = ["한국", "일본"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the indexed room search against loading every room and "
+        "filtering in Python. Seeds a dataset inside a transaction that is "
+        "rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rooms", type=int, default=100_000)
+        parser.add_argument("--amenities", type=int, default=20)
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument("--batch-size", type=int, default=5_000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.seed(options)
+            params = QueryDict(mutable=True)
+            params.update(
+                {
+                    "city": "제주",
+                    "kind": Room.RoomKindChoices.ENTIRE_PLACE,
+                    "pet_friendly": "true",
+                    "price_min": "50000",
+                    "price_max": "150000",
+                    "rooms__gte": "2",
+                    "toilets__gte": "1",
+                    "category": str(self.category.pk),
+                    "amenities": ",".join(str(pk) for pk in self.amenity_pks[:2]),
+                }
+            )
+            indexed = self.measure(
+                lambda: list(filter_rooms(Room.objects.for_listing(), params)),
+                options["repeat"],
+            )
+            naive = self.measure(lambda: self.python_filter(params), options["repeat"])
+            if {room.pk for room in indexed[2]} != {room.pk for room in naive[2]}:
+                self.stderr.write("Result sets differ!")
+            self.report("filtered search", indexed)
+            self.report("full list + python filter", naive)
+            transaction.set_rollback(True)
+
+    def seed(self, options):
+        rng = random.Random(42)
+        owner = User.objects.create_user(username="bench-room-search-owner")
+        self.category = Category.objects.create(
+            name="Bench", kind=Category.CategoryKindChoices.ROOMS
+        )
+        amenities = Amenity.objects.bulk_create(
+            [Amenity(name=f"Amenity {i}") for i in range(options["amenities"])]
+        )
+        self.amenity_pks = [amenity.pk for amenity in amenities]
+        kinds = Room.RoomKindChoices.values
+        started = time.perf_counter()
+        through = Room.amenities.through
+        created = 0
+        while created < options["rooms"]:
+            size = min(options["batch_size"], options["rooms"] - created)
+            rooms = Room.objects.bulk_create(
+                [
+                    Room(
+                        name=f"Room {created + i}",
+                        country=rng.choice(COUNTRIES),
+                        city=rng.choice(CITIES),
+                        price=rng.randrange(10_000, 300_000, 1_000),
+                        rooms=rng.randint(1, 5),
+                        toilets=rng.randint(1, 3),
+                        description="",
+                        address="",
+                        pet_friendly=rng.random() < 0.5,
+                        kind=rng.choice(kinds),
+                        owner=owner,
+                        category=self.category if rng.random() < 0.5 else None,
+                    )
+                    for i in range(size)
+                ]
+            )
+            through.objects.bulk_create(
+                [
+                    through(room_id=room.pk, amenity_id=amenity_pk)
+                    for room in rooms
+                    for amenity_pk in rng.sample(self.amenity_pks, 4)
+                ]
+            )
+            created += size
+        self.stdout.write(
+            f"Seeded {created} rooms in {time.perf_counter() - started:.1f}s"
+        )
+
+    def python_filter(self, params):
+        amenities = {int(pk) for pk in params["amenities"].split(",")}
+        rooms = Room.objects.prefetch_related("photos", "amenities")
+        return [
+            room
+            for room in rooms
+            if room.city == params["city"]
+            and room.kind == params["kind"]
+            and room.pet_friendly
+            and int(params["price_min"]) <= room.price <= int(params["price_max"])
+            and room.rooms >= int(params["rooms__gte"])
+            and room.toilets >= int(params["toilets__gte"])
+            and room.category_id == int(params["category"])
+            and amenities <= {amenity.pk for amenity in room.amenities.all()}
+        ]
+
+    def measure(self, run, repeat):
+        timings = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                result = run()
+                timings.append(time.perf_counter() - started)
+        return min(timings), len(queries), result
+
+    def report(self, label, measurement):
+        elapsed, queries, result = measurement
+        self.stdout.write(
+            f"{label:>28}: {elapsed * 1000:9.1f} ms, {queries} queries, "
+            f"{len(result)} rooms"
+        )
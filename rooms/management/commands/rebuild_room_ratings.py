@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from rooms.cache import invalidate_room_detail
+from rooms.models import Room
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored rating_sum, rating_count and rating_avg of every room."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            updated = Room.objects.update(
+                updated_at=timezone.now(), **Room.rating_aggregates()
+            )
+            invalidate_room_detail(*Room.objects.values_list("pk", flat=True))
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt ratings for {updated} rooms."))
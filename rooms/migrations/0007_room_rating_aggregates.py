@@ -0,0 +1,55 @@
+# Generated by Django 5.2.7 on 2026-10-17 23:42
+
+from django.db import migrations, models
+from django.db.models import Avg, Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Round
+
+
+def backfill_ratings(apps, schema_editor):
+    Room = apps.get_model("rooms", "Room")
+    Review = apps.get_model("reviews", "Review")
+    reviews = Review.objects.filter(room=OuterRef("pk")).order_by().values("room")
+    Room.objects.update(
+        rating_sum=Coalesce(
+            Subquery(reviews.annotate(total=Sum("rating")).values("total")),
+            Value(0),
+        ),
+        rating_count=Coalesce(
+            Subquery(reviews.annotate(count=Count("pk")).values("count")),
+            Value(0),
+        ),
+        rating_avg=Coalesce(
+            Round(
+                Subquery(reviews.annotate(average=Avg("rating")).values("average")),
+                2,
+            ),
+            Value(0.0),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rooms", "0006_bed"),
+        ("reviews", "0003_alter_review_user"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="room",
+            name="rating_avg",
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="room",
+            name="rating_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="room",
+            name="rating_sum",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_ratings, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-17 23:44
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("categories", "0001_initial"),
+        ("rooms", "0007_room_rating_aggregates"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="room",
+            index=models.Index(
+                fields=["created_at", "id"], name="room_created_at_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.7 on 2026-10-17 23:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("categories", "0001_initial"),
+        ("rooms", "0008_room_room_created_at_id_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="room",
+            index=models.Index(
+                fields=["country", "city", "price"], name="room_country_city_price_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="room",
+            index=models.Index(fields=["city", "price"], name="room_city_price_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="room",
+            index=models.Index(fields=["kind", "price"], name="room_kind_price_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="room",
+            index=models.Index(
+                fields=["pet_friendly", "price"], name="room_pet_friendly_price_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="room",
+            index=models.Index(
+                fields=["category", "price"], name="room_category_price_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="room",
+            index=models.Index(
+                fields=["rooms", "toilets"], name="room_rooms_toilets_idx"
+            ),
+        ),
+    ]
@@ -1,10 +1,34 @@
 from django.db import models
+from django.db.models import Prefetch
 
 from categories.models import Category
-from common.models import CommonModel
+from common.models import CommonModel, RatedModel
 
 
-class Room(CommonModel):
+class RoomQuerySet(models.QuerySet):
+    def for_listing(self):
+        """Rooms with everything RoomListSerializer reads, in a fixed number of queries."""
+
+        from medias.models import Photo
+
+        return self.only(
+            "pk",
+            "name",
+            "country",
+            "city",
+            "price",
+            "rating_avg",
+            "owner_id",
+            "created_at",
+        ).prefetch_related(
+            Prefetch(
+                "photos",
+                queryset=Photo.objects.only("pk", "file", "description", "room_id"),
+            )
+        )
+
+
+class Room(RatedModel):
     """Room model definition."""
 
     class RoomKindChoices(models.TextChoices):
@@ -40,21 +64,37 @@ class Room(CommonModel):
         related_name="rooms",
     )
 
+    objects = RoomQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["created_at", "id"],
+                name="room_created_at_id_idx",
+            ),
+            models.Index(
+                fields=["country", "city", "price"],
+                name="room_country_city_price_idx",
+            ),
+            models.Index(fields=["city", "price"], name="room_city_price_idx"),
+            models.Index(fields=["kind", "price"], name="room_kind_price_idx"),
+            models.Index(
+                fields=["pet_friendly", "price"],
+                name="room_pet_friendly_price_idx",
+            ),
+            models.Index(
+                fields=["category", "price"],
+                name="room_category_price_idx",
+            ),
+            models.Index(fields=["rooms", "toilets"], name="room_rooms_toilets_idx"),
+        ]
+
     def __str__(self) -> str:
         return self.name
 
     def total_amenities(self) -> int:
         return self.amenities.count()
 
-    def rating(self):
-        count = self.reviews.count()
-        if count == 0:
-            return 0
-        total_rating = 0
-        for review in self.reviews.all().values("rating"):
-            total_rating += review["rating"]
-        return round(total_rating / count, 2)
-
 
 class Amenity(CommonModel):
     """Amenity definition."""
@@ -4,7 +4,7 @@ from users.serializers import TinyUserSerializer
 from reviews.serializers import ReviewSerializer
 from categories.serializers import CategorySerializer
 from medias.serializers import PhotoSerializer
-from wishlists.models import Wishlist
+from wishlists.liked import liked_room_ids
 
 class AmenitySerializer(serializers.ModelSerializer):
     class Meta:
@@ -25,7 +25,8 @@ class BedSerializer(serializers.ModelSerializer):
             "capacity",
         )
 
-class RoomDetailSerializer(serializers.ModelSerializer):
+class RoomBodySerializer(serializers.ModelSerializer):
+    """Room detail fields that are the same for every user."""
 
     owner = TinyUserSerializer(read_only=True)
     amenities = AmenitySerializer(
@@ -35,9 +36,7 @@ class RoomDetailSerializer(serializers.ModelSerializer):
     category = CategorySerializer(
         read_only=True,
     )
-    rating = serializers.SerializerMethodField()
-    is_owner = serializers.SerializerMethodField()
-    is_liked = serializers.SerializerMethodField()
+    rating = serializers.FloatField(source="rating_avg", read_only=True)
     photos = PhotoSerializer(many=True, read_only=True)
     beds = BedSerializer(many=True, read_only=True)
 
@@ -45,24 +44,23 @@ class RoomDetailSerializer(serializers.ModelSerializer):
         model = Room
         fields = "__all__"
 
-    def get_rating(self, room):
-        return room.rating()
+class RoomDetailSerializer(RoomBodySerializer):
+
+    is_owner = serializers.SerializerMethodField()
+    is_liked = serializers.SerializerMethodField()
 
     def get_is_owner(self, room):
         request = self.context["request"]
         return room.owner == request.user
 
     def get_is_liked(self, room):
-        request = self.context["request"]
-        return Wishlist.objects.filter(
-            user=request.user,
-            rooms__pk=room.pk,
-        ).exists()
+        return room.pk in liked_room_ids(self.context.get("request"))
 
 class RoomListSerializer(serializers.ModelSerializer):
 
-    rating = serializers.SerializerMethodField()
+    rating = serializers.FloatField(source="rating_avg", read_only=True)
     is_owner = serializers.SerializerMethodField()
+    is_liked = serializers.SerializerMethodField()
     photos = PhotoSerializer(many=True, read_only=True)
 
     class Meta:
@@ -75,12 +73,13 @@ class RoomListSerializer(serializers.ModelSerializer):
             "price",
             "rating",
             "is_owner",
+            "is_liked",
             "photos",
         )
 
-    def get_rating(self, room):
-        return room.rating()
-
     def get_is_owner(self, room):
         request = self.context["request"]
-        return room.owner == request.user
+        return room.owner_id == request.user.pk
+
+    def get_is_liked(self, room):
+        return room.pk in liked_room_ids(self.context.get("request"))
@@ -0,0 +1,52 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from categories.models import Category
+from medias.models import Photo
+from users.models import User
+from .cache import invalidate_room_detail, touch_rooms
+from .models import Amenity, Bed, Room
+
+
+@receiver(post_save, sender=Room)
+@receiver(post_delete, sender=Room)
+def invalidate_room(sender, instance, **kwargs):
+    invalidate_room_detail(instance.pk)
+
+
+@receiver(post_save, sender=Photo)
+@receiver(post_delete, sender=Photo)
+@receiver(post_save, sender=Bed)
+@receiver(post_delete, sender=Bed)
+def touch_room_of_child(sender, instance, **kwargs):
+    touch_rooms(instance.room_id)
+
+
+@receiver(m2m_changed, sender=Room.amenities.through)
+def touch_rooms_of_amenities(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            touch_rooms(instance.pk)
+    elif action == "pre_clear":
+        touch_rooms(*instance.rooms.values_list("pk", flat=True))
+    elif action in ("post_add", "post_remove"):
+        touch_rooms(*pk_set)
+
+
+@receiver(post_save, sender=Amenity)
+@receiver(pre_delete, sender=Amenity)
+def touch_rooms_of_amenity(sender, instance, **kwargs):
+    touch_rooms(*instance.rooms.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=Category)
+def touch_rooms_of_category(sender, instance, created, **kwargs):
+    if not created:
+        touch_rooms(*instance.rooms.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=User)
+def touch_rooms_of_owner(sender, instance, created, update_fields, **kwargs):
+    if created or update_fields == frozenset({"last_login"}):
+        return
+    touch_rooms(*instance.rooms.values_list("pk", flat=True))
@@ -1,8 +1,19 @@
+import time
+from datetime import date
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.http import http_date
 from rest_framework.test import APITestCase
 from rest_framework import status
 from . import models
 from users.models import User
 from categories.models import Category
+from bookings.models import Booking
+from medias.models import Photo
+from reviews.models import Review
+from wishlists.models import Wishlist
 
 
 class TestAmenities(APITestCase):
@@ -206,11 +217,11 @@ class TestRooms(APITestCase):
         # API 호출
         response = self.client.get(self.base_url)
 
-        # 검증
+        # 검증 (커서 페이지네이션으로 인해 response.data는 dict 형태)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIsInstance(response.data, list)
+        self.assertIn("results", response.data)
         # 새로 생성한 room이 포함되어 있는지 확인
-        room_names = [room["name"] for room in response.data]
+        room_names = [room["name"] for room in response.data["results"]]
         self.assertIn("Test Room", room_names)
 
     def test_get_rooms_list_unauthenticated(self):
@@ -503,3 +514,1014 @@ class TestRooms(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         # Room은 삭제되지 않아야 함
         self.assertTrue(models.Room.objects.filter(pk=room_id).exists())
+
+
+class TestRoomAmenityAssignment(APITestCase):
+    # 생성 시 amenity 수와 무관한 쿼리 수를 확인하기 위한 amenity 개수
+    AMENITY_COUNT = 40
+
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.base_url = "/api/v1/rooms/"
+        self.category = Category.objects.create(
+            name="Test Category",
+            kind=Category.CategoryKindChoices.ROOMS
+        )
+        self.amenities = models.Amenity.objects.bulk_create(
+            [models.Amenity(name=f"Amenity {i}") for i in range(self.AMENITY_COUNT)]
+        )
+
+    def room_data(self, name, amenities):
+        return {
+            "name": name,
+            "country": "한국",
+            "city": "서울",
+            "price": 50000,
+            "rooms": 2,
+            "toilets": 1,
+            "description": "Description",
+            "address": "Address",
+            "kind": models.Room.RoomKindChoices.ENTIRE_PLACE,
+            "category": self.category.pk,
+            "amenities": amenities,
+        }
+
+    def create_room(self, name, amenities):
+        room = models.Room.objects.create(
+            name=name,
+            price=50000,
+            rooms=2,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=models.Room.RoomKindChoices.ENTIRE_PLACE,
+            owner=self.user,
+            category=self.category,
+        )
+        room.amenities.set(amenities)
+        return room
+
+    def test_create_query_count_does_not_grow_with_amenities(self):
+        """POST /api/v1/rooms/ - amenity 개수와 무관한 쿼리 수 테스트"""
+        one = self.room_data("One", [self.amenities[0].pk])
+        many = self.room_data("Many", [amenity.pk for amenity in self.amenities])
+
+        # 검증 (amenity 1개와 40개의 쿼리 수가 같아야 함)
+        with CaptureQueriesContext(connection) as single:
+            response = self.client.post(self.base_url, one, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        with self.assertNumQueries(len(single)):
+            response = self.client.post(self.base_url, many, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["amenities"]), self.AMENITY_COUNT)
+
+    def test_create_reports_every_missing_amenity(self):
+        """POST /api/v1/rooms/ - 존재하지 않는 amenity pk 전체 보고 테스트"""
+        data = self.room_data("Missing", [self.amenities[0].pk, 9998, 9999])
+
+        # API 호출
+        response = self.client.post(self.base_url, data, format="json")
+
+        # 검증 (Room은 생성되지 않아야 함)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["detail"], "Amenity not found: 9998, 9999")
+        self.assertFalse(models.Room.objects.filter(name="Missing").exists())
+
+    def test_create_rejects_malformed_amenities(self):
+        """POST /api/v1/rooms/ - 잘못된 amenities 형식 테스트"""
+        for amenities in ("1,2", ["wifi"], [None]):
+            response = self.client.post(
+                self.base_url,
+                self.room_data("Malformed", amenities),
+                format="json",
+            )
+
+            # 검증
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(models.Room.objects.filter(name="Malformed").exists())
+
+    def test_create_without_amenities(self):
+        """POST /api/v1/rooms/ - amenities 없이 생성 테스트"""
+        data = self.room_data("No Amenities", [])
+        del data["amenities"]
+
+        # API 호출
+        response = self.client.post(self.base_url, data, format="json")
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["amenities"], [])
+
+    def test_update_sets_amenities_with_diff(self):
+        """PUT /api/v1/rooms/<pk> - amenities 변경분만 반영 테스트"""
+        first, second, third = self.amenities[:3]
+        room = self.create_room("Room", [first, second])
+        through = models.Room.amenities.through
+        kept = through.objects.get(room=room, amenity=second).pk
+
+        # API 호출
+        response = self.client.put(
+            f"{self.base_url}{room.pk}",
+            {"amenities": [second.pk, third.pk]},
+            format="json",
+        )
+
+        # 검증 (유지된 amenity의 연결 행은 그대로 남아야 함)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(room.amenities.values_list("pk", flat=True)),
+            {second.pk, third.pk},
+        )
+        self.assertTrue(through.objects.filter(pk=kept).exists())
+
+    def test_update_missing_amenity_keeps_room(self):
+        """PUT /api/v1/rooms/<pk> - 존재하지 않는 amenity로 수정 시 변경 없음 테스트"""
+        room = self.create_room("Room", [self.amenities[0]])
+
+        # API 호출
+        response = self.client.put(
+            f"{self.base_url}{room.pk}",
+            {"name": "Renamed", "amenities": [9999]},
+            format="json",
+        )
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["detail"], "Amenity not found: 9999")
+        room.refresh_from_db()
+        self.assertEqual(room.name, "Room")
+        self.assertEqual(list(room.amenities.all()), [self.amenities[0]])
+
+
+class TestRoomListQueries(APITestCase):
+    # ETag 행 조회 1회 + rooms 조회 1회 + photos prefetch 1회 + 위시리스트(liked set) 1회
+    LIST_QUERIES = 4
+
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.base_url = "/api/v1/rooms/"
+        self.category = Category.objects.create(
+            name="Test Category",
+            kind=Category.CategoryKindChoices.ROOMS
+        )
+
+    def create_rooms(self, count):
+        owners = [
+            self.user,
+            User.objects.create_user(username="owner", password="testpass123"),
+        ]
+        rooms = models.Room.objects.bulk_create(
+            [
+                models.Room(
+                    name=f"Room {i}",
+                    price=50000,
+                    rooms=1,
+                    toilets=1,
+                    description="Description",
+                    address="Address",
+                    kind=models.Room.RoomKindChoices.ENTIRE_PLACE,
+                    owner=owners[i % 2],
+                    category=self.category,
+                )
+                for i in range(count)
+            ]
+        )
+        Photo.objects.bulk_create(
+            [
+                Photo(file="https://example.com/photo.jpg", description="Photo", room=room)
+                for room in rooms
+            ]
+        )
+        for room in rooms[:3]:
+            Review.objects.create(room=room, user=self.user, payload="Good", rating=4)
+
+    def assert_constant_queries(self, count):
+        self.create_rooms(count)
+
+        # API 호출
+        with self.assertNumQueries(self.LIST_QUERIES):
+            response = self.client.get(self.base_url)
+
+        # 검증
+        results = response.data["results"]
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(results), min(count, 20))
+        self.assertEqual(len(results[0]["photos"]), 1)
+        owned = [room for room in results if room["is_owner"]]
+        self.assertEqual(len(owned), (len(results) + 1) // 2)
+
+    def test_list_queries_one_room(self):
+        """GET /api/v1/rooms/ - Room 1개 쿼리 수 테스트"""
+        self.assert_constant_queries(1)
+
+    def test_list_queries_ten_rooms(self):
+        """GET /api/v1/rooms/ - Room 10개 쿼리 수 테스트"""
+        self.assert_constant_queries(10)
+
+    def test_list_queries_five_hundred_rooms(self):
+        """GET /api/v1/rooms/ - Room 500개 쿼리 수 테스트"""
+        self.assert_constant_queries(500)
+
+    def test_is_liked_costs_one_query_per_page(self):
+        """GET /api/v1/rooms/ - 50개 Room의 is_liked 위시리스트 1회 조회 테스트"""
+        self.create_rooms(50)
+        liked = models.Room.objects.order_by("-created_at", "-pk")[:2]
+        Wishlist.objects.create(name="First", user=self.user).rooms.add(liked[0])
+        Wishlist.objects.create(name="Second", user=self.user).rooms.add(liked[1])
+
+        # API 호출
+        with self.assertNumQueries(self.LIST_QUERIES):
+            response = self.client.get(self.base_url, {"page_size": 50})
+
+        # 검증
+        results = response.data["results"]
+        self.assertEqual(len(results), 50)
+        self.assertEqual([room["is_liked"] for room in results[:3]], [True, True, False])
+
+
+class TestRoomListPagination(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.base_url = "/api/v1/rooms/"
+        models.Room.objects.bulk_create(
+            [
+                models.Room(
+                    name=f"Room {i}",
+                    price=50000,
+                    rooms=1,
+                    toilets=1,
+                    description="Description",
+                    address="Address",
+                    kind=models.Room.RoomKindChoices.ENTIRE_PLACE,
+                    owner=self.user,
+                )
+                for i in range(7)
+            ]
+        )
+
+    def test_walk_all_pages_with_next_cursor(self):
+        """GET /api/v1/rooms/ - next 커서로 전체 페이지 순회 테스트"""
+        names = []
+        url = f"{self.base_url}?page_size=3"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 3)
+            names += [room["name"] for room in response.data["results"]]
+            url = response.data["next"]
+
+        # 검증 (최신순, 중복/누락 없음)
+        self.assertEqual(names, [f"Room {i}" for i in reversed(range(7))])
+
+    def test_previous_cursor(self):
+        """GET /api/v1/rooms/ - previous 커서 테스트"""
+        first = self.client.get(self.base_url, {"page_size": 3})
+        self.assertIsNone(first.data["previous"])
+        second = self.client.get(first.data["next"])
+        previous = self.client.get(second.data["previous"])
+
+        # 검증
+        self.assertEqual(previous.data["results"], first.data["results"])
+        self.assertIsNone(previous.data["previous"])
+
+    def test_page_size_is_bounded(self):
+        """GET /api/v1/rooms/ - page_size 상한 테스트"""
+        with self.assertNumQueries(3):
+            response = self.client.get(self.base_url, {"page_size": 100000})
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 7)
+        self.assertIsNone(response.data["next"])
+
+    def test_invalid_cursor(self):
+        """GET /api/v1/rooms/ - 잘못된 커서 404 테스트"""
+        response = self.client.get(self.base_url, {"cursor": "not-a-cursor"})
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestRoomSearch(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.base_url = "/api/v1/rooms/"
+        self.category = Category.objects.create(
+            name="Test Category",
+            kind=Category.CategoryKindChoices.ROOMS
+        )
+        self.wifi = models.Amenity.objects.create(name="Wifi")
+        self.parking = models.Amenity.objects.create(name="Parking")
+        self.seoul = self.create_room(
+            "Seoul Room",
+            city="서울",
+            price=50000,
+            rooms=1,
+            toilets=1,
+            pet_friendly=False,
+            kind=models.Room.RoomKindChoices.PRIVATE_ROOM,
+        )
+        self.busan = self.create_room(
+            "Busan Room",
+            city="부산",
+            price=120000,
+            rooms=3,
+            toilets=2,
+            category=self.category,
+        )
+        self.seoul.amenities.add(self.wifi)
+        self.busan.amenities.add(self.wifi, self.parking)
+
+    def create_room(self, name, **fields):
+        defaults = {
+            "description": "Description",
+            "address": "Address",
+            "kind": models.Room.RoomKindChoices.ENTIRE_PLACE,
+            "owner": self.user,
+        }
+        defaults.update(fields)
+        return models.Room.objects.create(name=name, **defaults)
+
+    def search(self, params):
+        response = self.client.get(self.base_url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sorted(room["name"] for room in response.data["results"])
+
+    def test_filter_by_fields(self):
+        """GET /api/v1/rooms/ - 필드별 필터 테스트"""
+        self.assertEqual(self.search({"city": "서울"}), ["Seoul Room"])
+        self.assertEqual(self.search({"kind": "entire_place"}), ["Busan Room"])
+        self.assertEqual(self.search({"pet_friendly": "false"}), ["Seoul Room"])
+        self.assertEqual(self.search({"price_min": 100000}), ["Busan Room"])
+        self.assertEqual(self.search({"price_max": 100000}), ["Seoul Room"])
+        self.assertEqual(self.search({"rooms__gte": 2}), ["Busan Room"])
+        self.assertEqual(self.search({"toilets__gte": 2}), ["Busan Room"])
+        self.assertEqual(self.search({"category": self.category.pk}), ["Busan Room"])
+        self.assertEqual(self.search({"country": "한국"}), ["Busan Room", "Seoul Room"])
+
+    def test_filter_by_all_amenities(self):
+        """GET /api/v1/rooms/ - Amenity 모두 포함 필터 테스트"""
+        both = f"{self.wifi.pk},{self.parking.pk}"
+
+        # 검증
+        self.assertEqual(
+            self.search({"amenities": str(self.wifi.pk)}),
+            ["Busan Room", "Seoul Room"],
+        )
+        self.assertEqual(self.search({"amenities": both}), ["Busan Room"])
+
+    def test_search_query_count_is_bounded(self):
+        """GET /api/v1/rooms/ - 필터 조합 쿼리 수 테스트"""
+        params = {
+            "city": "부산",
+            "price_min": 100000,
+            "price_max": 200000,
+            "amenities": f"{self.wifi.pk},{self.parking.pk}",
+        }
+
+        # 검증 (ETag 행 조회 1회 + rooms 조회 1회 + photos prefetch 1회)
+        with self.assertNumQueries(3):
+            response = self.client.get(self.base_url, params)
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_invalid_filter_values(self):
+        """GET /api/v1/rooms/ - 잘못된 필터 값 400 테스트"""
+        for params in (
+            {"price_min": "cheap"},
+            {"pet_friendly": "maybe"},
+            {"kind": "castle"},
+            {"amenities": "1,two"},
+        ):
+            response = self.client.get(self.base_url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestRoomAvailabilitySearch(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.base_url = "/api/v1/rooms/"
+        self.check_in = date(2030, 5, 10)
+        self.check_out = date(2030, 5, 13)
+        self.booked = self.create_room("Booked Room")
+        self.free = self.create_room("Free Room")
+        self.hostel = self.create_room("Hostel")
+        self.bed_a = models.Bed.objects.create(
+            room=self.hostel, name="A", bed_type=models.Bed.BedTypeChoices.LOWER
+        )
+        self.bed_b = models.Bed.objects.create(
+            room=self.hostel, name="B", bed_type=models.Bed.BedTypeChoices.UPPER
+        )
+        Booking.objects.create(
+            kind=Booking.BookingKindChoices.ROOM,
+            user=self.user,
+            room=self.booked,
+            check_in=date(2030, 5, 12),
+            check_out=date(2030, 5, 15),
+            guests=2,
+        )
+        Booking.objects.create(
+            kind=Booking.BookingKindChoices.ROOM,
+            user=self.user,
+            room=self.free,
+            check_in=date(2030, 5, 13),
+            check_out=date(2030, 5, 14),
+            guests=2,
+        )
+        Booking.objects.create(
+            kind=Booking.BookingKindChoices.BED,
+            user=self.user,
+            room=self.hostel,
+            bed=self.bed_a,
+            check_in=date(2030, 5, 9),
+            check_out=date(2030, 5, 11),
+            guests=1,
+        )
+
+    def create_room(self, name):
+        return models.Room.objects.create(
+            name=name,
+            price=50000,
+            rooms=1,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=models.Room.RoomKindChoices.ENTIRE_PLACE,
+            owner=self.user,
+        )
+
+    def search(self, **params):
+        params.setdefault("check_in", self.check_in.isoformat())
+        params.setdefault("check_out", self.check_out.isoformat())
+        response = self.client.get(self.base_url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sorted(room["name"] for room in response.data["results"])
+
+    def test_excludes_overlapping_room_bookings(self):
+        """GET /api/v1/rooms/?check_in&check_out - 겹치는 예약 제외 테스트"""
+        # 검증 (check_out 당일 시작하는 예약은 겹치지 않음)
+        self.assertEqual(self.search(), ["Free Room", "Hostel"])
+
+    def test_bed_capacity_for_guests(self):
+        """GET /api/v1/rooms/?guests - 침대 잔여 수용 인원 테스트"""
+        self.assertEqual(self.search(guests=1), ["Free Room", "Hostel"])
+        self.assertEqual(self.search(guests=2), ["Free Room"])
+        self.assertEqual(
+            self.search(check_in="2030-05-11", guests=2),
+            ["Free Room", "Hostel"],
+        )
+
+    def test_availability_search_is_one_listing_query(self):
+        """GET /api/v1/rooms/?check_in&check_out - 쿼리 수 테스트"""
+        # 검증 (rooms 조회 1회 + photos prefetch 1회, ETag 조회 없음)
+        with self.assertNumQueries(2):
+            self.search(guests=1)
+
+    def test_availability_search_is_not_cached_by_etag(self):
+        """GET /api/v1/rooms/?check_in&check_out - 예약 변경 후 304가 나지 않는지 테스트"""
+        params = {
+            "check_in": self.check_in.isoformat(),
+            "check_out": self.check_out.isoformat(),
+        }
+        response = self.client.get(self.base_url, params)
+        self.assertFalse(response.has_header("ETag"))
+        Booking.objects.create(
+            kind=Booking.BookingKindChoices.ROOM,
+            user=self.user,
+            room=self.free,
+            check_in=self.check_in,
+            check_out=self.check_out,
+            guests=2,
+        )
+
+        # API 호출
+        response = self.client.get(self.base_url, params, HTTP_IF_NONE_MATCH="*")
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [room["name"] for room in response.data["results"]], ["Hostel"]
+        )
+
+    def test_invalid_availability_params(self):
+        """GET /api/v1/rooms/ - 잘못된 날짜 파라미터 400 테스트"""
+        for params in (
+            {"check_in": "2030-05-10"},
+            {"check_in": "2030-05-10", "check_out": "2030-05-10"},
+            {"check_in": "10/05/2030", "check_out": "2030-05-12"},
+            {"guests": 2},
+        ):
+            response = self.client.get(self.base_url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestRoomDetailCache(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.guest = User.objects.create_user(
+            username="guest",
+            email="guest@example.com",
+            password="testpass123"
+        )
+        self.amenity = models.Amenity.objects.create(name="Wifi")
+        self.room = models.Room.objects.create(
+            name="Cached Room",
+            price=50000,
+            rooms=1,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=models.Room.RoomKindChoices.ENTIRE_PLACE,
+            owner=self.user,
+        )
+        self.room.amenities.add(self.amenity)
+        self.url = f"/api/v1/rooms/{self.room.pk}"
+
+    def get_detail(self, user=None):
+        self.client.force_authenticate(user=user or self.user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_cache_hit_skips_room_queries(self):
+        """GET /api/v1/rooms/<pk> - 캐시 적중 시 Room 조회 생략 테스트"""
+        self.get_detail()
+
+        # 검증 (ETag 행 조회 1회 + wishlist 조회 1회만 실행)
+        with self.assertNumQueries(2):
+            data = self.get_detail()
+        self.assertEqual(data["name"], "Cached Room")
+
+    def test_user_fields_are_merged_per_user(self):
+        """GET /api/v1/rooms/<pk> - 사용자별 is_owner/is_liked 테스트"""
+        wishlist = Wishlist.objects.create(name="Trip", user=self.guest)
+        wishlist.rooms.add(self.room)
+
+        owner_data = self.get_detail(self.user)
+        guest_data = self.get_detail(self.guest)
+
+        # 검증
+        self.assertTrue(owner_data["is_owner"])
+        self.assertFalse(owner_data["is_liked"])
+        self.assertFalse(guest_data["is_owner"])
+        self.assertTrue(guest_data["is_liked"])
+
+    def test_invalidated_by_related_writes(self):
+        """GET /api/v1/rooms/<pk> - 관련 모델 변경 시 캐시 무효화 테스트"""
+        self.get_detail()
+
+        Photo.objects.create(file="https://example.com/a.jpg", description="A", room=self.room)
+        self.assertEqual(len(self.get_detail()["photos"]), 1)
+
+        models.Bed.objects.create(room=self.room, name="A", bed_type="single")
+        self.assertEqual(len(self.get_detail()["beds"]), 1)
+
+        self.amenity.name = "Fast Wifi"
+        self.amenity.save()
+        self.assertEqual(self.get_detail()["amenities"][0]["name"], "Fast Wifi")
+
+        self.room.amenities.clear()
+        self.assertEqual(self.get_detail()["amenities"], [])
+
+        Review.objects.create(room=self.room, user=self.guest, payload="Good", rating=4)
+        self.assertEqual(self.get_detail()["rating"], 4.0)
+
+        self.room.name = "Renamed Room"
+        self.room.save()
+        self.assertEqual(self.get_detail()["name"], "Renamed Room")
+
+    def test_anonymous_detail(self):
+        """GET /api/v1/rooms/<pk> - 비인증 사용자 상세 조회 테스트"""
+        self.client.force_authenticate(user=None)
+
+        # API 호출
+        response = self.client.get(self.url)
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data["is_owner"])
+        self.assertFalse(response.data["is_liked"])
+
+    def test_deleted_room_is_not_served_from_cache(self):
+        """GET /api/v1/rooms/<pk> - 삭제된 Room 404 테스트"""
+        self.get_detail()
+        self.room.delete()
+
+        # API 호출
+        response = self.client.get(self.url)
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestRoomConditionalGet(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.room = models.Room.objects.create(
+            name="Room",
+            price=50000,
+            rooms=1,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=models.Room.RoomKindChoices.ENTIRE_PLACE,
+            owner=self.user,
+        )
+        self.list_url = "/api/v1/rooms/"
+        self.detail_url = f"/api/v1/rooms/{self.room.pk}"
+
+    def test_list_not_modified(self):
+        """GET /api/v1/rooms/ - If-None-Match 일치 시 304 테스트"""
+        response = self.client.get(self.list_url)
+        etag = response["ETag"]
+        self.assertFalse(response.has_header("Last-Modified"))
+
+        # 검증 (현재 페이지 행 조회 1회 + 위시리스트 1회, 직렬화 없음)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_list_etag_covers_served_page(self):
+        """GET /api/v1/rooms/ - 현재 페이지 밖의 변경은 ETag에 영향이 없는지 테스트"""
+        newest = models.Room.objects.create(
+            name="Newest",
+            price=60000,
+            rooms=1,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=models.Room.RoomKindChoices.ENTIRE_PLACE,
+            owner=self.user,
+        )
+        params = {"page_size": 1}
+        etag = self.client.get(self.list_url, params)["ETag"]
+
+        # 검증 (다음 페이지의 방 수정은 304, 현재 페이지의 방 수정은 200)
+        self.room.save()
+        response = self.client.get(self.list_url, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        newest.save()
+        response = self.client.get(self.list_url, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_etag_depends_on_query(self):
+        """GET /api/v1/rooms/ - 쿼리 파라미터별 ETag 테스트"""
+        etag = self.client.get(self.list_url)["ETag"]
+
+        # API 호출
+        response = self.client.get(
+            self.list_url,
+            {"city": "서울"},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_detail_not_modified(self):
+        """GET /api/v1/rooms/amenities/<pk> - If-Modified-Since 304 테스트"""
+        amenity = models.Amenity.objects.create(name="Wifi")
+        url = f"/api/v1/rooms/amenities/{amenity.pk}"
+        response = self.client.get(url)
+
+        # API 호출
+        response = self.client.get(
+            url,
+            HTTP_IF_MODIFIED_SINCE=response["Last-Modified"],
+        )
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_per_user_detail_ignores_if_modified_since(self):
+        """GET /api/v1/rooms/<pk> - 위시리스트 추가 후 If-Modified-Since로 304가 나지 않는지 테스트"""
+        response = self.client.get(self.detail_url)
+        self.assertFalse(response.has_header("Last-Modified"))
+        last_modified = http_date(time.time())
+        Wishlist.objects.create(name="Trip", user=self.user).rooms.add(self.room)
+
+        # API 호출
+        response = self.client.get(
+            self.detail_url,
+            HTTP_IF_MODIFIED_SINCE=last_modified,
+        )
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["is_liked"])
+
+    def test_list_ignores_if_modified_since_after_delete(self):
+        """GET /api/v1/rooms/ - 최신이 아닌 방 삭제 후 If-Modified-Since로 304가 나지 않는지 테스트"""
+        newest = models.Room.objects.create(
+            name="Newest",
+            price=60000,
+            rooms=1,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=models.Room.RoomKindChoices.ENTIRE_PLACE,
+            owner=self.user,
+        )
+        self.client.get(self.list_url)
+        last_modified = http_date(time.time())
+        self.room.delete()
+
+        # API 호출
+        response = self.client.get(self.list_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [room["pk"] for room in response.data["results"]], [newest.pk]
+        )
+
+    def test_related_writes_change_etag(self):
+        """GET /api/v1/rooms/<pk> - 사진/위시리스트 변경 시 ETag 변경 테스트"""
+        etag = self.client.get(self.detail_url)["ETag"]
+        Photo.objects.create(file="https://example.com/a.jpg", description="A", room=self.room)
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["photos"]), 1)
+
+        etag = response["ETag"]
+        Wishlist.objects.create(name="Trip", user=self.user).rooms.add(self.room)
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["is_liked"])
+
+    def test_etag_is_per_user(self):
+        """GET /api/v1/rooms/<pk> - 사용자별 ETag 테스트"""
+        etag = self.client.get(self.detail_url)["ETag"]
+        other = User.objects.create_user(username="other", password="testpass123")
+        self.client.force_authenticate(user=other)
+
+        # API 호출
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data["is_owner"])
+
+    def test_amenity_not_modified(self):
+        """GET /api/v1/rooms/amenities/ - 304 테스트"""
+        models.Amenity.objects.create(name="Wifi")
+        etag = self.client.get("/api/v1/rooms/amenities/")["ETag"]
+
+        # API 호출
+        response = self.client.get("/api/v1/rooms/amenities/", HTTP_IF_NONE_MATCH=etag)
+
+        # 검증
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+class TestRoomCalendar(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.room = models.Room.objects.create(
+            name="Hostel",
+            price=30000,
+            rooms=1,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=models.Room.RoomKindChoices.SHARED_ROOM,
+            owner=self.user,
+        )
+        self.bed = models.Bed.objects.create(
+            room=self.room,
+            name="Bed 1",
+            bed_type=models.Bed.BedTypeChoices.SINGLE,
+        )
+        self.url = f"/api/v1/rooms/{self.room.pk}/calendar"
+
+    def book(self, check_in, check_out, bed=None):
+        return Booking.objects.create(
+            kind=Booking.BookingKindChoices.BED if bed else Booking.BookingKindChoices.ROOM,
+            user=self.user,
+            room=self.room,
+            bed=bed,
+            check_in=check_in,
+            check_out=check_out,
+            guests=1,
+        )
+
+    def test_month_includes_stays_starting_earlier(self):
+        """GET /api/v1/rooms/<pk>/calendar - 이전 달에 시작한 예약 포함 테스트"""
+        self.book(date(2030, 1, 30), date(2030, 2, 3))
+        self.book(date(2030, 2, 27), date(2030, 3, 2))
+
+        # API 호출
+        response = self.client.get(self.url, {"year": 2030, "month": 2})
+
+        # 검증 (check_out 당일은 비어 있음)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["days"], 28)
+        self.assertEqual(response.data["room"], "11" + "0" * 24 + "11")
+
+    def test_bed_bookings(self):
+        """GET /api/v1/rooms/<pk>/calendar - 침대별 예약 및 부분 예약 표시 테스트"""
+        self.book(date(2030, 2, 2), date(2030, 2, 4), bed=self.bed)
+        self.book(date(2030, 2, 3), date(2030, 2, 5))
+
+        # API 호출
+        response = self.client.get(self.url, {"year": 2030, "month": 2})
+
+        # 검증 (방 전체 예약이 부분 예약보다 우선)
+        self.assertEqual(response.data["room"][:6], "021100")
+        self.assertEqual(
+            response.data["beds"],
+            [{"pk": self.bed.pk, "name": "Bed 1", "occupancy": "011" + "0" * 25}],
+        )
+
+    def test_multiple_months(self):
+        """GET /api/v1/rooms/<pk>/calendar - 여러 달 조회 테스트"""
+        self.book(date(2030, 1, 31), date(2030, 2, 1))
+
+        # API 호출
+        response = self.client.get(self.url, {"year": 2029, "month": 12, "months": 3})
+
+        # 검증 (2029-12 ~ 2030-02)
+        self.assertEqual(response.data["start"], date(2029, 12, 1))
+        self.assertEqual(response.data["end"], date(2030, 3, 1))
+        self.assertEqual(response.data["days"], 31 + 31 + 28)
+        self.assertEqual(response.data["room"][61], "1")
+        self.assertEqual(response.data["room"].count("1"), 1)
+
+    def test_query_count_does_not_grow_with_bookings(self):
+        """GET /api/v1/rooms/<pk>/calendar - 예약 수와 무관한 쿼리 수 테스트"""
+        for day in range(1, 28, 2):
+            self.book(date(2030, 2, day), date(2030, 2, day + 1))
+
+        # 검증 (room 1회 + beds 1회 + bookings 범위 조회 1회)
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, {"year": 2030, "month": 2})
+        self.assertEqual(response.data["room"].count("1"), 14)
+
+    def test_invalid_params(self):
+        """GET /api/v1/rooms/<pk>/calendar - 잘못된 파라미터 테스트"""
+        for params in ({"month": 13}, {"months": 13}, {"year": "abc"}, {"year": 9999, "month": 12, "months": 2}):
+            response = self.client.get(self.url, params)
+
+            # 검증
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestRoomBedAvailability(APITestCase):
+    def setUp(self):
+        """테스트 전에 실행되는 설정"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.room = models.Room.objects.create(
+            name="Bunk Hostel",
+            price=20000,
+            rooms=1,
+            toilets=1,
+            description="Description",
+            address="Address",
+            kind=models.Room.RoomKindChoices.SHARED_ROOM,
+            owner=self.user,
+        )
+        self.lower = models.Bed.objects.create(
+            room=self.room, name="Lower", bed_type=models.Bed.BedTypeChoices.LOWER
+        )
+        self.upper = models.Bed.objects.create(
+            room=self.room, name="Upper", bed_type=models.Bed.BedTypeChoices.UPPER
+        )
+        self.single = models.Bed.objects.create(
+            room=self.room, name="Single", bed_type=models.Bed.BedTypeChoices.SINGLE
+        )
+        self.url = f"/api/v1/rooms/{self.room.pk}/beds/availability"
+        self.window = {"start": "2030-01-01", "end": "2030-01-06"}
+
+    def book(self, check_in, check_out, bed=None):
+        return Booking.objects.create(
+            kind=Booking.BookingKindChoices.BED if bed else Booking.BookingKindChoices.ROOM,
+            user=self.user,
+            room=self.room,
+            bed=bed,
+            check_in=check_in,
+            check_out=check_out,
+            guests=1,
+        )
+
+    def test_free_beds_per_night(self):
+        """GET /api/v1/rooms/<pk>/beds/availability - 날짜별 빈 침대 수 테스트"""
+        self.book(date(2029, 12, 30), date(2030, 1, 3), bed=self.lower)
+        self.book(date(2030, 1, 2), date(2030, 1, 4), bed=self.upper)
+        self.book(date(2030, 1, 5), date(2030, 1, 6))
+
+        # API 호출
+        response = self.client.get(self.url, self.window)
+
+        # 검증 (방 전체 예약은 모든 침대를 막음)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["days"], 5)
+        self.assertEqual(response.data["free_beds"], [2, 1, 2, 3, 0])
+        self.assertEqual(
+            response.data["free_beds_by_type"],
+            {
+                "lower": [0, 0, 1, 1, 0],
+                "single": [1, 1, 1, 1, 0],
+                "upper": [1, 0, 0, 1, 0],
+            },
+        )
+        occupancy = {bed["name"]: bed["occupancy"] for bed in response.data["beds"]}
+        self.assertEqual(
+            occupancy,
+            {"Lower": "11001", "Single": "00001", "Upper": "01101"},
+        )
+
+    def test_first_night_with_free_beds(self):
+        """GET /api/v1/rooms/<pk>/beds/availability - N개 빈 침대 첫 날짜 테스트"""
+        self.book(date(2030, 1, 1), date(2030, 1, 3), bed=self.lower)
+        self.book(date(2030, 1, 1), date(2030, 1, 4), bed=self.upper)
+
+        # 검증
+        first_night = lambda **params: self.client.get(
+            self.url, {**self.window, **params}
+        ).data["first_night"]
+        self.assertEqual(first_night(), date(2030, 1, 1))
+        self.assertEqual(first_night(beds=2), date(2030, 1, 3))
+        self.assertEqual(first_night(beds=3), date(2030, 1, 4))
+        self.assertEqual(first_night(beds=4), None)
+        self.assertEqual(first_night(bed_type="upper"), date(2030, 1, 4))
+
+    def test_query_count_does_not_grow_with_beds(self):
+        """GET /api/v1/rooms/<pk>/beds/availability - 침대 수와 무관한 쿼리 수 테스트"""
+        beds = models.Bed.objects.bulk_create(
+            [
+                models.Bed(room=self.room, name=f"Bunk {i}", bed_type=models.Bed.BedTypeChoices.LOWER)
+                for i in range(50)
+            ]
+        )
+        for bed in beds[::2]:
+            self.book(date(2030, 1, 2), date(2030, 1, 3), bed=bed)
+
+        # 검증 (room 1회 + beds 1회 + bookings 1회)
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, self.window)
+        self.assertEqual(response.data["free_beds"][1], 53 - 25)
+
+    def test_invalid_params(self):
+        """GET /api/v1/rooms/<pk>/beds/availability - 잘못된 파라미터 테스트"""
+        for params in (
+            {"start": "2030-01-05", "end": "2030-01-01"},
+            {"start": "2030-01-01", "end": "2031-06-01"},
+            {"beds": 0},
+            {"bed_type": "sofa"},
+        ):
+            response = self.client.get(self.url, params)
+
+            # 검증
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
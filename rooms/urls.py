@@ -7,9 +7,13 @@ urlpatterns = [
     path("<int:pk>/reviews", views.RoomReviews.as_view()),
     path("<int:pk>/photos", views.RoomPhotos.as_view()),
     path("<int:pk>/bookings", views.RoomBookings.as_view()),
+    path("<int:pk>/holds", views.RoomHolds.as_view()),
+    path("<int:pk>/calendar", views.RoomCalendar.as_view()),
     path("<int:pk>/beds", views.RoomBeds.as_view()),
+    path("<int:pk>/beds/availability", views.RoomBedAvailability.as_view()),
     path("<int:pk>/beds/<int:bed_pk>", views.BedDetail.as_view()),
     path("<int:pk>/beds/<int:bed_pk>/bookings", views.BedBookings.as_view()),
+    path("<int:pk>/beds/<int:bed_pk>/holds", views.BedHolds.as_view()),
     path("amenities/", views.Amenities.as_view()),
     path("amenities/<int:pk>", views.AmenityDetail.as_view()),
 ]
@@ -2,18 +2,26 @@ from django.conf import settings
 from django.utils import timezone
 from django.db import transaction
 import calendar
+from datetime import timedelta
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.status import HTTP_204_NO_CONTENT
-from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.exceptions import (
     NotFound,
     ParseError,
     PermissionDenied,
 )
 from .models import Amenity, Room, Bed
+from .calendar import BedOccupancy, month_window, room_calendar
+from .filters import filter_rooms, parse_date, parse_int
+from .cache import get_room_detail
 from categories.models import Category
 from bookings.models import Booking
+from common.conditional import conditional_get
+from common.idempotency import idempotent
+from common.paginations import KeysetPagination
+from wishlists.liked import liked_room_ids
 from .serializers import (
     AmenitySerializer,
     RoomListSerializer,
@@ -21,13 +29,45 @@ from .serializers import (
     BedSerializer,
 )
 from reviews.serializers import ReviewSerializer
+from reviews.services import get_review_target, save_review
 from medias.serializers import PhotoSerializer
 from bookings.serializers import (
+    BookingHoldSerializer,
     PublicBookingSerializer,
     CreateRoomBookingSerializer,
 )
+from bookings.services import (
+    create_bed_booking,
+    create_room_booking,
+    hold_bed,
+    hold_room,
+)
+
+def get_amenity_pks(amenity_pks):
+    """Validate a list of amenity pks with one query.
+
+    Raises ParseError naming every pk that does not exist, so a room is
+    never saved with a partial amenity list.
+    """
+
+    if not isinstance(amenity_pks, list):
+        raise ParseError("amenities must be a list of ids.")
+    try:
+        amenity_pks = {int(pk) for pk in amenity_pks}
+    except (TypeError, ValueError):
+        raise ParseError("amenities must be a list of ids.")
+    found = set(
+        Amenity.objects.filter(pk__in=amenity_pks).values_list("pk", flat=True)
+    )
+    missing = sorted(amenity_pks - found)
+    if missing:
+        raise ParseError(
+            f"Amenity not found: {', '.join(str(pk) for pk in missing)}"
+        )
+    return sorted(amenity_pks)
 
 class Amenities(APIView):
+    @conditional_get(lambda view, request: Amenity.objects.all(), many=True)
     def get(self, request):
         all_amenities = Amenity.objects.all()
         serializer = AmenitySerializer(all_amenities, many=True)
@@ -50,6 +90,7 @@ class AmenityDetail(APIView):
         except Amenity.DoesNotExist:
             raise NotFound
 
+    @conditional_get(lambda view, request, pk: Amenity.objects.filter(pk=pk))
     def get(self, request, pk):
         amenity = self.get_object(pk)
         serializer = AmenitySerializer(amenity)
@@ -75,19 +116,41 @@ class AmenityDetail(APIView):
         amenity.delete()
         return Response(status=HTTP_204_NO_CONTENT)
 
+def rooms_to_validate(params):
+    """Rooms the list ETag is built from, or None for a stay search.
+
+    Which rooms are free between check_in and check_out changes with
+    bookings, which don't touch Room.updated_at, so those searches are
+    always served fresh.
+    """
+
+    if "check_in" in params or "check_out" in params:
+        return None
+    return filter_rooms(Room.objects.all(), params)
+
 class Rooms(APIView):
 
     permission_classes = [IsAuthenticatedOrReadOnly]
 
+    @conditional_get(
+        lambda view, request: rooms_to_validate(request.query_params),
+        per_user=True,
+        liked=liked_room_ids,
+        many=True,
+        pagination_class=KeysetPagination,
+    )
     def get(self, request):
-        all_rooms = Room.objects.all()
+        all_rooms = filter_rooms(Room.objects.for_listing(), request.query_params)
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(all_rooms, request, view=self)
         serializer = RoomListSerializer(
-            all_rooms,
+            page,
             many=True,
             context={"request": request},
         )
-        return Response(serializer.data)
+        return paginator.get_paginated_response(serializer.data)
 
+    @idempotent
     def post(self, request):
         serializer = RoomDetailSerializer(
             data=request.data,
@@ -103,23 +166,18 @@ class Rooms(APIView):
                     raise ParseError("The category kind should be 'rooms'")
             except Category.DoesNotExist:
                 raise ParseError("Category not found")
-            try:
-                with transaction.atomic():
-                    room = serializer.save(
-                        owner=request.user,
-                        category=category,
-                    )
-                    amenities = request.data.get("amenities")
-                    for amenity_pk in amenities:
-                        amenity = Amenity.objects.get(pk=amenity_pk)
-                        room.amenities.add(amenity)
-                    serializer = RoomDetailSerializer(
-                        room,
-                        context={"request": request},
-                    )
-                    return Response(serializer.data)
-            except Exception:
-                raise ParseError("Amenity not found")
+            amenity_pks = get_amenity_pks(request.data.get("amenities", []))
+            with transaction.atomic():
+                room = serializer.save(
+                    owner=request.user,
+                    category=category,
+                )
+                room.amenities.add(*amenity_pks)
+            serializer = RoomDetailSerializer(
+                room,
+                context={"request": request},
+            )
+            return Response(serializer.data)
         else:
             return Response(serializer.errors)
 
@@ -133,13 +191,20 @@ class RoomDetail(APIView):
         except Room.DoesNotExist:
             raise NotFound
 
+    @conditional_get(
+        lambda view, request, pk: Room.objects.filter(pk=pk),
+        per_user=True,
+        liked=liked_room_ids,
+    )
     def get(self, request, pk):
-        room = self.get_object(pk)
-        serializer = RoomDetailSerializer(
-            room,
-            context={"request": request},
-        )
-        return Response(serializer.data)
+        try:
+            cached = get_room_detail(pk)
+        except Room.DoesNotExist:
+            raise NotFound
+        data = dict(cached["data"])
+        data["is_owner"] = cached["owner_id"] == request.user.pk
+        data["is_liked"] = pk in liked_room_ids(request)
+        return Response(data)
 
     def put(self, request, pk):
         room = self.get_object(pk)
@@ -162,24 +227,20 @@ class RoomDetail(APIView):
                     raise ParseError("Category not found")
             else:
                 category = room.category
-            try:
-                with transaction.atomic():
-                    room = serializer.save(
-                        category=category,
-                    )
-                    amenities = request.data.get("amenities")
-                    if amenities is not None:
-                        room.amenities.clear()
-                        for amenity_pk in amenities:
-                            amenity = Amenity.objects.get(pk=amenity_pk)
-                            room.amenities.add(amenity)
-                    serializer = RoomDetailSerializer(
-                        room,
-                        context={"request": request},
-                    )
-                    return Response(serializer.data)
-            except Exception:
-                raise ParseError("Amenity not found")
+            amenities = request.data.get("amenities")
+            if amenities is not None:
+                amenity_pks = get_amenity_pks(amenities)
+            with transaction.atomic():
+                room = serializer.save(
+                    category=category,
+                )
+                if amenities is not None:
+                    room.amenities.set(amenity_pks)
+            serializer = RoomDetailSerializer(
+                room,
+                context={"request": request},
+            )
+            return Response(serializer.data)
         else:
             return Response(serializer.errors)
 
@@ -217,12 +278,10 @@ class RoomReviews(APIView):
         return Response(serializer.data)
 
     def post(self, request, pk):
+        room = get_review_target(Room, pk, request.user)
         serializer = ReviewSerializer(data=request.data)
         if serializer.is_valid():
-            review = serializer.save(
-                user=request.user,
-                room=self.get_object(pk),
-            )
+            review = save_review(serializer, request.user, room)
             serializer = ReviewSerializer(review)
             return Response(serializer.data)
         else:
@@ -272,7 +331,9 @@ class RoomBookings(APIView):
         _, last_day = calendar.monthrange(year, month)
         start_date = timezone.datetime(year, month, 1).date()
         end_date = timezone.datetime(year, month, last_day).date()
-        bookings = Booking.objects.filter(
+        bookings = Booking.objects.for_public(
+            Booking.BookingKindChoices.ROOM
+        ).filter(
             room=room,
             kind=Booking.BookingKindChoices.ROOM,
             check_in__gte=start_date,
@@ -293,35 +354,15 @@ class RoomBookings(APIView):
         )
         return Response(serializer.data)
 
+    @idempotent
     def post(self, request, pk):
         room = self.get_object(pk)
-        serializer = CreateRoomBookingSerializer(
-            data=request.data,
-            context={"room": room},
-        )
+        serializer = CreateRoomBookingSerializer(data=request.data)
         if serializer.is_valid():
-            check_in = serializer.validated_data["check_in"]
-            check_out = serializer.validated_data["check_out"]
-            existing = Booking.objects.filter(
-                room=room,
-                kind=Booking.BookingKindChoices.ROOM,
-                check_in__lt=check_out,
-                check_out__gt=check_in,
-            ).exists()
-            if existing:
-                raise ParseError("Those dates are already booked.")
-            bed_conflict = Booking.objects.filter(
-                bed__room=room,
-                kind=Booking.BookingKindChoices.BED,
-                check_in__lt=check_out,
-                check_out__gt=check_in,
-            ).exists()
-            if bed_conflict:
-                raise ParseError("Some beds are already booked during those dates.")
-            booking = serializer.save(
-                room=room,
-                user=request.user,
-                kind=Booking.BookingKindChoices.ROOM,
+            booking = create_room_booking(
+                room,
+                request.user,
+                **serializer.validated_data,
             )
             return Response(
                 PublicBookingSerializer(booking).data,
@@ -329,6 +370,58 @@ class RoomBookings(APIView):
             )
         return Response(serializer.errors)
 
+class RoomHolds(APIView):
+
+    permission_classes = [IsAuthenticated]
+
+    def get_object(self, pk):
+        try:
+            return Room.objects.get(pk=pk)
+        except Room.DoesNotExist:
+            raise NotFound
+
+    @idempotent
+    def post(self, request, pk):
+        room = self.get_object(pk)
+        serializer = CreateRoomBookingSerializer(data=request.data)
+        if serializer.is_valid():
+            hold = hold_room(room, request.user, **serializer.validated_data)
+            return Response(BookingHoldSerializer(hold).data, status=201)
+        return Response(serializer.errors)
+
+class RoomCalendar(APIView):
+
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+    # 한 번에 조회할 수 있는 최대 개월 수
+    max_months = 12
+
+    def get_object(self, pk):
+        try:
+            return Room.objects.get(pk=pk)
+        except Room.DoesNotExist:
+            raise NotFound
+
+    def get(self, request, pk):
+        room = self.get_object(pk)
+        today = timezone.localdate()
+        year = parse_int(request.query_params, "year", minimum=1)
+        month = parse_int(request.query_params, "month", minimum=1)
+        months = parse_int(request.query_params, "months", minimum=1)
+        if month is not None and month > 12:
+            raise ParseError("month must be between 1 and 12")
+        if months is not None and months > self.max_months:
+            raise ParseError(f"months must be at most {self.max_months}")
+        try:
+            start, end = month_window(
+                year or today.year,
+                month or today.month,
+                months or 1,
+            )
+        except ValueError:
+            raise ParseError("year is out of range")
+        return Response(room_calendar(room, start, end))
+
 class RoomBeds(APIView):
 
     permission_classes = [IsAuthenticatedOrReadOnly]
@@ -364,6 +457,56 @@ class RoomBeds(APIView):
             )
         return Response(serializer.errors)
 
+class RoomBedAvailability(APIView):
+
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+    # 기본 조회 기간과 최대 조회 기간 (일)
+    default_days = 30
+    max_days = 366
+
+    def get_object(self, pk):
+        try:
+            return Room.objects.get(pk=pk)
+        except Room.DoesNotExist:
+            raise NotFound
+
+    def get(self, request, pk):
+        room = self.get_object(pk)
+        params = request.query_params
+        start = parse_date(params, "start") or timezone.localdate()
+        end = parse_date(params, "end") or start + timedelta(days=self.default_days)
+        if end <= start:
+            raise ParseError("end must be after start")
+        if (end - start).days > self.max_days:
+            raise ParseError(f"The window can be at most {self.max_days} days")
+        beds = parse_int(params, "beds", minimum=1) or 1
+        bed_type = params.get("bed_type") or None
+        if bed_type and bed_type not in Bed.BedTypeChoices.values:
+            raise ParseError(
+                f"bed_type must be one of {', '.join(Bed.BedTypeChoices.values)}"
+            )
+        occupancy = BedOccupancy(room, start, end)
+        return Response(
+            {
+                "start": start,
+                "end": end,
+                "days": occupancy.days,
+                "free_beds": occupancy.free_beds(),
+                "free_beds_by_type": occupancy.free_beds_by_type(),
+                "first_night": occupancy.first_night_with(beds, bed_type),
+                "beds": [
+                    {
+                        "pk": bed.pk,
+                        "name": bed.name,
+                        "bed_type": bed.bed_type,
+                        "occupancy": occupancy.row(bed),
+                    }
+                    for bed in occupancy.beds
+                ],
+            }
+        )
+
 class BedDetail(APIView):
 
     permission_classes = [IsAuthenticatedOrReadOnly]
@@ -422,7 +565,9 @@ class BedBookings(APIView):
         _, last_day = calendar.monthrange(year, month)
         start_date = timezone.datetime(year, month, 1).date()
         end_date = timezone.datetime(year, month, last_day).date()
-        bookings = Booking.objects.filter(
+        bookings = Booking.objects.for_public(
+            Booking.BookingKindChoices.BED
+        ).filter(
             bed=bed,
             kind=Booking.BookingKindChoices.BED,
             check_in__gte=start_date,
@@ -443,29 +588,37 @@ class BedBookings(APIView):
         )
         return Response(serializer.data)
 
+    @idempotent
     def post(self, request, pk, bed_pk):
         bed = self.get_bed(pk, bed_pk)
-        serializer = CreateRoomBookingSerializer(
-            data=request.data,
-            context={
-                "room": bed.room,
-                "bed": bed,
-            },
-        )
+        serializer = CreateRoomBookingSerializer(data=request.data)
         if serializer.is_valid():
-            check_in = serializer.validated_data["check_in"]
-            check_out = serializer.validated_data["check_out"]
-            guests = serializer.validated_data["guests"]
-            if guests > bed.capacity:
-                raise ParseError("Guest count exceeds bed capacity.")
-            booking = serializer.save(
-                bed=bed,
-                room=bed.room,
-                user=request.user,
-                kind=Booking.BookingKindChoices.BED,
+            booking = create_bed_booking(
+                bed,
+                request.user,
+                **serializer.validated_data,
             )
             return Response(
                 PublicBookingSerializer(booking).data,
                 status=201,
             )
         return Response(serializer.errors)
+
+class BedHolds(APIView):
+
+    permission_classes = [IsAuthenticated]
+
+    def get_bed(self, room_pk, bed_pk):
+        try:
+            return Bed.objects.get(pk=bed_pk, room_id=room_pk)
+        except Bed.DoesNotExist:
+            raise NotFound
+
+    @idempotent
+    def post(self, request, pk, bed_pk):
+        bed = self.get_bed(pk, bed_pk)
+        serializer = CreateRoomBookingSerializer(data=request.data)
+        if serializer.is_valid():
+            hold = hold_bed(bed, request.user, **serializer.validated_data)
+            return Response(BookingHoldSerializer(hold).data, status=201)
+        return Response(serializer.errors)
@@ -0,0 +1,34 @@
+from .models import Wishlist
+
+
+def liked_room_ids(request):
+    """Pks of every room in the requesting user's wishlists.
+
+    Loaded with one query the first time it is needed and kept on the
+    request, so every serializer in the response shares it. Anonymous
+    users like nothing.
+    """
+
+    return _liked_ids(request, Wishlist.rooms.through, "room_id")
+
+
+def liked_experience_ids(request):
+    """Pks of every experience in the requesting user's wishlists."""
+
+    return _liked_ids(request, Wishlist.experiences.through, "experience_id")
+
+
+def _liked_ids(request, through, column):
+    if request is None or not request.user.is_authenticated:
+        return frozenset()
+    attribute = f"_liked_{column}s"
+    liked = getattr(request, attribute, None)
+    if liked is None:
+        liked = frozenset(
+            through.objects.filter(wishlist__user=request.user).values_list(
+                column,
+                flat=True,
+            )
+        )
+        setattr(request, attribute, liked)
+    return liked